@@ -3,9 +3,13 @@
 from pathlib import Path
 
 
+def parse(text):
+    return [int(line) for line in text.splitlines()]
+
+
 def load_data(path):
     with open(path) as fp:
-        return [int(line) for line in fp]
+        return parse(fp.read())
 
 
 def count_increasing_depth_num(measurements, sliding_window_size=1):
@@ -31,9 +31,13 @@ AUTOCOMPLETION_SCORING = {
 }
 
 
+def parse(text):
+    return text.splitlines()
+
+
 def load_data(path):
     with open(path) as fd:
-        return fd.read().splitlines()
+        return parse(fd.read())
 
 
 def get_scores(lines):
@@ -67,6 +71,10 @@ def part_two(data):
     return autocompletion_score
 
 
+def solve(data):
+    return get_scores(data)
+
+
 if __name__ == "__main__":
     input_dir = Path().resolve().parent / "inputs/10"
     samples = load_data(input_dir / "samples.in")
@@ -74,6 +82,7 @@ if __name__ == "__main__":
 
     assert part_one(samples) == 26397
     assert part_two(samples) == 288957
+    assert solve(samples) == (26397, 288957)
 
     print(part_one(data))
     print(part_two(data))
@@ -1,80 +1,89 @@
 # https://adventofcode.com/2021/day/11
 
-import copy
 from collections import deque
-from itertools import product
 from pathlib import Path
 
+from aoc.checkpoint import progress, resume
+from aoc.grid import DIGITS, MISSING, Grid
+
 
 class Octopuses(object):
     def __init__(self, energy_levels):
-        self.energy_levels = copy.deepcopy(energy_levels)
-        self.rows_num = len(energy_levels)
-        self.cols_num = len(energy_levels[0])
+        self.energy_levels = energy_levels.copy()
         self.steps_num = 0
+        self.flashes_num = 0
+        self.all_flash_step = None
+
+    @property
+    def neighbors(self):
+        # Cached on the grid and left out of its pickled state, so it is not part of the checkpointed state.
+        return self.energy_levels.neighbors8
 
     def _increase_energy(self):
-        for y in range(self.rows_num):
-            for x in range(self.cols_num):
-                self.energy_levels[y][x] += 1
-
-    def _get_neighbors(self, x, y):
-        neighbors = []
-        for dx, dy in product((-1, 0, 1), repeat=2):
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.cols_num and 0 <= ny < self.rows_num:
-                neighbors.append((nx, ny))
-        return neighbors
+        self.energy_levels.cells = bytearray(level + 1 for level in self.energy_levels.cells)
 
     def do_step(self):
         self.steps_num += 1
         self._increase_energy()
-        flashing_octopuses = deque()
-        for y, row in enumerate(self.energy_levels):
-            for x, energy_level in enumerate(row):
-                if energy_level > 9:
-                    flashing_octopuses.append((x, y))
+        energy_levels = self.energy_levels.cells
+        neighbors = self.neighbors
+        table, stride = neighbors.table, neighbors.stride
+        flashing_octopuses = deque(index for index, energy_level in enumerate(energy_levels) if energy_level > 9)
         flashes = 0
         while flashing_octopuses:
             flashes += 1
-            x, y = flashing_octopuses.popleft()
-            self.energy_levels[y][x] = 0
-            for nx, ny in self._get_neighbors(x, y):
-                if 0 < self.energy_levels[ny][nx] <= 9:
-                    self.energy_levels[ny][nx] += 1
-                    if self.energy_levels[ny][nx] > 9:
-                        flashing_octopuses.append((nx, ny))
+            index = flashing_octopuses.popleft()
+            energy_levels[index] = 0
+            for neighbor in table[index * stride : (index + 1) * stride]:
+                if neighbor != MISSING and 0 < energy_levels[neighbor] <= 9:
+                    energy_levels[neighbor] += 1
+                    if energy_levels[neighbor] > 9:
+                        flashing_octopuses.append(neighbor)
+        self.flashes_num += flashes
+        if flashes == len(energy_levels) and self.all_flash_step is None:
+            self.all_flash_step = self.steps_num
         return flashes
 
     def simulate(self, steps_num):
-        flashes = 0
+        """Carry on until `steps_num` steps were done in total, and return the number of flashes so far."""
         while self.steps_num < steps_num:
-            flashes += self.do_step()
-        return flashes
+            self.do_step()
+            progress(self)
+        return self.flashes_num
 
     def simulate_until_all_flash(self):
-        all_flashed = self.rows_num * self.cols_num
-        flashes = 0
-        while flashes < all_flashed:
-            flashes = self.do_step()
-        return self.steps_num
+        # The first step where all flash is recorded by `do_step`, so this also works after `simulate` went past it.
+        while self.all_flash_step is None:
+            self.do_step()
+            progress(self)
+        return self.all_flash_step
+
+
+def parse(text):
+    return Grid.from_text(text, DIGITS)
 
 
 def load_data(path):
     with open(path) as fd:
-        return [[int(x) for x in line.strip()] for line in fd]
+        return parse(fd.read())
 
 
 def part_one(data):
-    octopuses = Octopuses(data)
+    octopuses = resume(Octopuses(data))
     return octopuses.simulate(steps_num=100)
 
 
 def part_two(data):
-    octopuses = Octopuses(data)
+    octopuses = resume(Octopuses(data))
     return octopuses.simulate_until_all_flash()
 
 
+def solve(data):
+    octopuses = Octopuses(data)
+    flashes = octopuses.simulate(steps_num=100)
+    return flashes, octopuses.simulate_until_all_flash()
+
+
 if __name__ == "__main__":
     input_dir = Path().resolve().parent / "inputs/11"
     samples = load_data(input_dir / "samples.in")
@@ -82,6 +91,7 @@ if __name__ == "__main__":
 
     assert part_one(samples) == 1656
     assert part_two(samples) == 195
+    assert solve(samples) == (1656, 195)
 
     print(part_one(data))
     print(part_two(data))
@@ -1,36 +1,46 @@
 # https://adventofcode.com/2021/day/12
 
 from collections import defaultdict
-from functools import cache
 from pathlib import Path
 
+from aoc.search import count_paths
 
-def load_data(path):
+
+def parse(text):
     cave_system = defaultdict(list)
-    with open(path) as fd:
-        for line in fd:
-            a, b = line.strip().split("-")
-            cave_system[a].append(b)
-            cave_system[b].append(a)
+    for line in text.splitlines():
+        a, b = line.strip().split("-")
+        cave_system[a].append(b)
+        cave_system[b].append(a)
     return cave_system
 
 
+def load_data(path):
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def count_distinct_paths(cave_system, visit_single_small_twice=False):
-    @cache
-    def find_next_paths(cave, visited, visit_single_small_twice):
-        if cave.islower():
-            visited = visited.union({cave})
-        distinct_paths = 0
-        for next_cave in cave_system[cave]:
-            if next_cave == "end":
-                distinct_paths += 1
-            elif next_cave not in visited:
-                distinct_paths += find_next_paths(next_cave, visited, visit_single_small_twice)
-            elif next_cave != "start" and visit_single_small_twice:
-                distinct_paths += find_next_paths(next_cave, visited, False)
-        return distinct_paths
-
-    return find_next_paths("start", frozenset(), visit_single_small_twice)
+    caves = sorted(cave_system)
+    ids = {cave: i for i, cave in enumerate(caves)}
+    # Nothing leads back to the start, which can't be visited twice.
+    neighbors = [[ids[next_cave] for next_cave in cave_system[cave] if next_cave != "start"] for cave in caves]
+    small = [cave.islower() for cave in caves]
+    end = ids["end"]
+
+    # A state is the current cave, a bitmask of the small caves visited so far and whether a second visit is left.
+    def find_next_states(state):
+        cave, visited, visit_single_small_twice = state
+        if small[cave]:
+            visited |= 1 << cave
+        for next_cave in neighbors[cave]:
+            if not visited >> next_cave & 1:
+                yield next_cave, visited, visit_single_small_twice
+            elif visit_single_small_twice:
+                yield next_cave, visited, False
+
+    start = (ids["start"], 0, visit_single_small_twice)
+    return count_paths(start, find_next_states, lambda state: state[0] == end)
 
 
 def part_one(data):
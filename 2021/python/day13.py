@@ -3,18 +3,17 @@
 from collections import namedtuple
 from pathlib import Path
 
+from aoc.coords import pack2, unpack2
 
-Dot = namedtuple("Dot", "x y")
 Fold = namedtuple("Fold", "axis value")
 
 
-def load_data(path):
-    with open(path) as fd:
-        top, bottom = fd.read().split("\n\n")
+def parse(text):
+    top, bottom = text.split("\n\n")
     paper = set()
     for line in top.splitlines():
         x, y = line.split(",")
-        paper.add(Dot(int(x), int(y)))
+        paper.add(pack2(int(x), int(y)))
     fold_instrs = []
     for line in bottom.splitlines():
         instr, value = line.split("=")
@@ -22,13 +21,18 @@ def load_data(path):
     return paper, fold_instrs
 
 
+def load_data(path):
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def fold_vrt(paper, x):
     folded_paper = set()
     for dot in paper:
-        if dot.x > x:
-            new_dot = Dot(2 * x - dot.x, dot.y)
-            folded_paper.add(new_dot)
-        elif dot.x < x:
+        dot_x, dot_y = unpack2(dot)
+        if dot_x > x:
+            folded_paper.add(pack2(2 * x - dot_x, dot_y))
+        elif dot_x < x:
             folded_paper.add(dot)
     return folded_paper
 
@@ -36,10 +40,10 @@ def fold_vrt(paper, x):
 def fold_hor(paper, y):
     folded_paper = set()
     for dot in paper:
-        if dot.y > y:
-            new_dot = Dot(dot.x, 2 * y - dot.y)
-            folded_paper.add(new_dot)
-        elif dot.y < y:
+        dot_x, dot_y = unpack2(dot)
+        if dot_y > y:
+            folded_paper.add(pack2(dot_x, 2 * y - dot_y))
+        elif dot_y < y:
             folded_paper.add(dot)
     return folded_paper
 
@@ -52,11 +56,12 @@ def fold(paper, instr):
 
 
 def print_code(paper):
-    width = max(paper, key=lambda dot: dot.x).x + 1
-    height = max(paper, key=lambda dot: dot.y).y + 1
+    dots = [unpack2(dot) for dot in paper]
+    width = max(x for x, _ in dots) + 1
+    height = max(y for _, y in dots) + 1
     code = [["."] * width for _ in range(height)]
-    for dot in paper:
-        code[dot.y][dot.x] = "#"
+    for x, y in dots:
+        code[y][x] = "#"
     return "\n".join("".join(line) for line in code)
 
 
@@ -1,33 +1,45 @@
 # https://adventofcode.com/2021/day/14
 
 from collections import Counter
-from functools import cache
 from pathlib import Path
 
 
+def parse(text):
+    template, _, *rules = text.splitlines()
+    rules = {k: v for k, v in (rule.split(" -> ") for rule in rules)}
+    return template, rules
+
+
 def load_data(path):
     with open(path) as fd:
-        template, _, *rules = fd.read().splitlines()
-        rules = {k: v for k, v in (rule.split(" -> ") for rule in rules)}
-        return template, rules
+        return parse(fd.read())
+
 
+class Polymer(object):
+    """Pair and element counts of a polymer, which `polymerize` carries on from the steps already done."""
 
-def polymerize(template, rules, steps_num=10):
-    @cache
-    def count(pair, step):
-        if step == steps_num or pair not in rules:
-            return Counter()
-        step += 1
-        pair_ins = rules[pair]
-        new_counter = Counter(pair_ins)
-        new_counter.update(count(pair[0] + pair_ins, step))
-        new_counter.update(count(pair_ins + pair[1], step))
-        return new_counter
+    def __init__(self, template, rules):
+        self.rules = rules
+        self.pairs = Counter(left + right for left, right in zip(template, template[1:]))
+        self.elements = Counter(template)
+        self.steps_num = 0
 
-    counter = Counter(template)
-    for left, right in zip(template[0:], template[1:]):
-        counter.update(count(left + right, 0))
-    return counter
+    def do_step(self):
+        self.steps_num += 1
+        new_pairs = Counter()
+        for pair, count in self.pairs.items():
+            if (pair_ins := self.rules.get(pair)) is None:
+                new_pairs[pair] += count
+                continue
+            new_pairs[pair[0] + pair_ins] += count
+            new_pairs[pair_ins + pair[1]] += count
+            self.elements[pair_ins] += count
+        self.pairs = new_pairs
+
+    def polymerize(self, steps_num):
+        while self.steps_num < steps_num:
+            self.do_step()
+        return self.elements
 
 
 def get_diff(counter):
@@ -36,11 +48,17 @@ def get_diff(counter):
 
 
 def part_one(data):
-    return get_diff(polymerize(*data))
+    return get_diff(Polymer(*data).polymerize(steps_num=10))
 
 
 def part_two(data):
-    return get_diff(polymerize(*data, steps_num=40))
+    return get_diff(Polymer(*data).polymerize(steps_num=40))
+
+
+def solve(data):
+    polymer = Polymer(*data)
+    first_diff = get_diff(polymer.polymerize(steps_num=10))
+    return first_diff, get_diff(polymer.polymerize(steps_num=40))
 
 
 if __name__ == "__main__":
@@ -50,6 +68,7 @@ if __name__ == "__main__":
 
     assert part_one(samples) == 1588
     assert part_two(samples) == 2188189693529
+    assert solve(samples) == (1588, 2188189693529)
 
     print(part_one(data))
     print(part_two(data))
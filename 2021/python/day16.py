@@ -4,12 +4,18 @@ from collections import namedtuple
 from math import prod
 from pathlib import Path
 
+from aoc.inputs import map_input, strip
+
 Packet = namedtuple("Packet", "version type_id value subpackets")
 
 
+def parse(text):
+    # int() reads the hex digits straight from bytes, no decoded string of the input is needed.
+    return hex2bin(bytes(strip(text)))
+
+
 def load_data(path):
-    with open(path) as fd:
-        return hex2bin(fd.read().strip())
+    return parse(map_input(path))
 
 
 def hex2bin(hex_str):
@@ -1,19 +1,23 @@
 # https://adventofcode.com/2021/day/17
 
-import re
 from collections import namedtuple, deque
 from itertools import product
 from pathlib import Path
 
+from aoc.ints import ints
+
 
 Position = namedtuple("Position", "x y")
 Target = namedtuple("Target", "xmin xmax ymin ymax")
 
 
+def parse(text):
+    return Target(*ints(text))
+
+
 def load_data(path):
     with open(path) as fd:
-        coords = [int(coord) for coord in re.findall(r"-?\d+", fd.read())]
-        return Target(*coords)
+        return parse(fd.read())
 
 
 def launch_probe(vx, vy):
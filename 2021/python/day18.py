@@ -103,9 +103,13 @@ class SnailfishNumber:
         return root
 
 
+def parse(text):
+    return [SnailfishNumber.eval(line.strip()) for line in text.splitlines()]
+
+
 def load_data(path):
     with open(path) as fd:
-        return [SnailfishNumber.eval(line.strip()) for line in fd]
+        return parse(fd.read())
 
 
 def part_one(data):
@@ -2,63 +2,44 @@
 
 from __future__ import annotations
 from itertools import combinations, product
-from math import prod
 from pathlib import Path
+from typing import Callable, Optional
 
+from aoc.coords import ORIGIN3, manhattan3, pack3, unpack3
+from aoc.ints import ints, records
 
-class InsufficientOverlapError(Exception):
-    pass
-
-
-class Vector3:
-    def __init__(self, x: int, y: int, z: int) -> None:
-        self.x = x
-        self.y = y
-        self.z = z
+# Beacon and scanner positions are packed into ints by `aoc.coords`, so the difference of two positions is the
+# packed translation between them and adding it moves a position. Aligned scanners are repacked with the
+# translation found instead, which checks that their positions didn't overflow the packed coordinates.
+Vector3 = int
+Rotation = Callable[[int, int, int], tuple[int, int, int]]
 
-    def __repr__(self) -> str:
-        return f"({self.x}, {self.y}, {self.z})"
 
-    def __add__(self, other: Vector3) -> Vector3:
-        return Vector3(self.x + other.x, self.y + other.y, self.z + other.z)
-
-    def __sub__(self, other: Vector3) -> Vector3:
-        return Vector3(self.x - other.x, self.y - other.y, self.z - other.z)
-
-    def __eq__(self, other: Vector3) -> bool:
-        return isinstance(other, Vector3) and (self.x, self.y, self.z) == (
-            other.x,
-            other.y,
-            other.z,
-        )
+class InsufficientOverlapError(Exception):
+    pass
 
-    def __hash__(self) -> int:
-        return hash((self.x, self.y, self.z))
 
-    def distance_to(self, other: Vector3) -> int:
-        return abs(self.x - other.x) + abs(self.y - other.y) + abs(self.z - other.z)
+def rotate_around_x(x: int, y: int, z: int) -> tuple[int, int, int]:
+    return x, -z, y
 
-    def translate(self, translation: Vector3) -> None:
-        self.x += translation.x
-        self.y += translation.y
-        self.z += translation.z
 
-    def rotate_around_x(self) -> None:
-        self.x, self.y, self.z = self.x, -self.z, self.y
+def rotate_around_y(x: int, y: int, z: int) -> tuple[int, int, int]:
+    return z, y, -x
 
-    def rotate_around_y(self) -> None:
-        self.x, self.y, self.z = self.z, self.y, -self.x
 
-    def rotate_around_z(self) -> None:
-        self.x, self.y, self.z = self.y, -self.x, self.z
+def rotate_around_z(x: int, y: int, z: int) -> tuple[int, int, int]:
+    return y, -x, z
 
 
 class Scanner:
-    position: Vector3
+    position: Optional[Vector3] = None
 
     def __init__(self, beacons: list[Vector3]) -> None:
         self.beacons = beacons
-        self.distances = {a.distance_to(b) for a, b in combinations(beacons, 2)}
+        self.distances = {manhattan3(a, b) for a, b in combinations(beacons, 2)}
+
+    def rotate(self, rotation: Rotation) -> None:
+        self.beacons = [pack3(*rotation(*unpack3(beacon))) for beacon in self.beacons]
 
     def generate_all_rotations(self) -> None:
         """Generate all 24 beacon orientations.
@@ -73,51 +54,51 @@ class Scanner:
         """
         yield
         for i in range(1, 24):
-            for beacon in self.beacons:
-                beacon.rotate_around_x()
+            self.rotate(rotate_around_x)
             if i == 4 or i == 8 or i == 12:
-                for beacon in self.beacons:
-                    beacon.rotate_around_y()
+                self.rotate(rotate_around_y)
             if i == 16:
-                for beacon in self.beacons:
-                    beacon.rotate_around_y()
-                    beacon.rotate_around_z()
+                self.rotate(rotate_around_y)
+                self.rotate(rotate_around_z)
             if i == 20:
-                for beacon in self.beacons:
-                    beacon.rotate_around_z()
-                    beacon.rotate_around_z()
+                self.rotate(rotate_around_z)
+                self.rotate(rotate_around_z)
             yield
 
 
-def load_data(path: Path) -> list[Scanner]:
-    with open(path) as fd:
-        data = fd.read().split("\n\n")
+def parse(text: str) -> list[Scanner]:
     scanners = []
-    for scanner_report in data:
-        beacons = []
-        for line in scanner_report.splitlines()[1:]:
-            coords = [int(x) for x in line.split(",")]
-            beacons.append(Vector3(*coords))
-        scanners.append(Scanner(beacons))
+    # Every report starts with its header, "--- scanner N ---", so its integers are N and then the beacons.
+    for scanner_report in text.split("--- scanner ")[1:]:
+        values = ints(scanner_report)
+        scanners.append(Scanner([pack3(*beacon) for beacon in records(values[1:], 3)]))
     return scanners
 
 
-def find_alignment(scanner: Scanner, aligned_scanner: Scanner) -> Vector3:
+def load_data(path: Path) -> list[Scanner]:
+    with open(path) as fd:
+        return parse(fd.read())
+
+
+def find_alignment(scanner: Scanner, aligned_scanner: Scanner) -> tuple[int, int, int]:
+    aligned_beacons = set(aligned_scanner.beacons)
     for _ in scanner.generate_all_rotations():
         for fixed_beacon, rotating_beacon in product(aligned_scanner.beacons[11:], scanner.beacons):
             translation = fixed_beacon - rotating_beacon
             matches_num = 0
             for beacon in scanner.beacons:
-                if beacon + translation in aligned_scanner.beacons:
+                if beacon + translation in aligned_beacons:
                     matches_num += 1
                 if matches_num >= 12:
-                    return translation
+                    fixed_x, fixed_y, fixed_z = unpack3(fixed_beacon)
+                    rotating_x, rotating_y, rotating_z = unpack3(rotating_beacon)
+                    return fixed_x - rotating_x, fixed_y - rotating_y, fixed_z - rotating_z
     raise InsufficientOverlapError
 
 
 def align_scanners(scanners: list[Scanner]) -> list[Scanner]:
     initial_scanner, *remaining_scanners = scanners
-    initial_scanner.position = Vector3(0, 0, 0)
+    initial_scanner.position = ORIGIN3
     aligned_scanners = [initial_scanner]
     while remaining_scanners:
         for current_scanner, aligned_scanner in product(remaining_scanners, aligned_scanners):
@@ -128,9 +109,9 @@ def align_scanners(scanners: list[Scanner]) -> list[Scanner]:
                     continue
                 else:
                     break
-        current_scanner.position = translation
-        for beacon in current_scanner.beacons:
-            beacon.translate(translation)
+        dx, dy, dz = translation
+        current_scanner.position = pack3(dx, dy, dz)
+        current_scanner.beacons = [pack3(x + dx, y + dy, z + dz) for x, y, z in map(unpack3, current_scanner.beacons)]
         aligned_scanners.append(current_scanner)
         remaining_scanners.remove(current_scanner)
     return aligned_scanners
@@ -143,9 +124,11 @@ def part_one(data: list[Scanner]) -> int:
 
 
 def part_two(data: list[Scanner]) -> int:
+    if any(scanner.position is None for scanner in data):
+        data = align_scanners(data)
     max_distance = 0
     for scanner, other_scanner in combinations(data, 2):
-        max_distance = max(max_distance, scanner.position.distance_to(other_scanner.position))
+        max_distance = max(max_distance, manhattan3(scanner.position, other_scanner.position))
     return max_distance
 
 
@@ -3,15 +3,19 @@
 from pathlib import Path
 
 
-def load_data(path):
+def parse(text):
     data = []
-    with open(path) as fd:
-        for line in fd:
-            direction, value = line.split()
-            data.append((direction, int(value)))
+    for line in text.splitlines():
+        direction, value = line.split()
+        data.append((direction, int(value)))
     return data
 
 
+def load_data(path):
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def follow_course(cmds):
     h_pos = 0
     depth = 0
@@ -1,72 +1,86 @@
 # https://adventofcode.com/2021/day/20
 
-from itertools import product
 from pathlib import Path
 
-from pprint import pprint
+from aoc.checkpoint import progress, resume
+from aoc.grid import Grid
 
-OFFSETS = list(product([1, 0, -1], repeat=2))
+PIXELS: bytes = bytes.maketrans(b".#", b"\x00\x01")
 
 
-def load_data(path: Path) -> tuple[list[int], list[list[int]]]:
+def parse(text: str) -> tuple[list[int], Grid]:
+    algorithm, image = text.split("\n\n")
+    return [int(char == "#") for char in algorithm], Grid.from_text(image, PIXELS)
+
+
+def load_data(path: Path) -> tuple[list[int], Grid]:
     with open(path) as fd:
-        algorithm, image = fd.read().split("\n\n")
-    algorithm = [int(char == "#") for char in algorithm]
-    image = [[int(char == "#") for char in row] for row in image.splitlines()]
-    return algorithm, image
-
-
-def pad(image: list[list[int]], value: int) -> list[list[int]]:
-    padded_image = [[value, *row, value] for row in image]
-    padded_image = [
-        [value] * len(padded_image[0]),
-        *padded_image,
-        [value] * len(padded_image[0]),
-    ]
-    return padded_image
-
-
-def enhance_image(image: list[list[int]], algorithm: list[int], repeat: int = 1) -> list[list[int]]:
-    padding_value = 0
-    for _ in range(repeat):
-        padded_image = pad(image, padding_value)
-        enhanced_image = [[0] * len(padded_image[0]) for _ in range(len(padded_image))]
-        rows_num = len(enhanced_image)
-        row_size = len(enhanced_image[0])
-        for y in range(rows_num):
-            for x in range(row_size):
-                index = 0
-                for bit_position, (dy, dx) in enumerate(OFFSETS):
-                    pixel_x = x + dx
-                    pixel_y = y + dy
-                    if 0 <= pixel_x < row_size and 0 <= pixel_y < rows_num:
-                        pixel = padded_image[pixel_y][pixel_x]
-                    else:
-                        pixel = padding_value
-                    index += pixel * 2**bit_position
-                enhanced_image[y][x] = algorithm[index]
-        if padding_value == 0:
-            padding_value = algorithm[0]
-        else:
-            padding_value = algorithm[-1]
-        image = enhanced_image
-    return image
-
-
-def count_lit_pixels(image: list[list[int]]) -> int:
-    return sum(sum(row) for row in image)
-
-
-def part_one(data: tuple[list[int], list[list[int]]]) -> int:
+        return parse(fd.read())
+
+
+def enhance_image(image: Grid, algorithm: list[int], padding_value: int) -> Grid:
+    """Return the image enhanced once and grown by a pixel on every side, the pixels around it being `padding_value`."""
+    # With two pixels of padding, the 3x3 square around every pixel of the grown image is inside the grid.
+    padded = image.pad(2, padding_value)
+    pixels = padded.cells
+    width = padded.width
+    enhanced_image = Grid(image.width + 2, image.height + 2)
+    enhanced = enhanced_image.cells
+    for y in range(enhanced_image.height):
+        top = y * width
+        for x in range(enhanced_image.width):
+            above, center, below = top + x, top + width + x, top + 2 * width + x
+            index = (
+                pixels[above] << 8
+                | pixels[above + 1] << 7
+                | pixels[above + 2] << 6
+                | pixels[center] << 5
+                | pixels[center + 1] << 4
+                | pixels[center + 2] << 3
+                | pixels[below] << 2
+                | pixels[below + 1] << 1
+                | pixels[below + 2]
+            )
+            enhanced[y * enhanced_image.width + x] = algorithm[index]
+    return enhanced_image
+
+
+class Image:
+    """An image under enhancement: its pixels, the value of the infinite padding around them and the steps done."""
+
+    def __init__(self, pixels: Grid, padding_value: int = 0, steps_num: int = 0) -> None:
+        self.pixels = pixels
+        self.padding_value = padding_value
+        self.steps_num = steps_num
+
+    def enhance(self, algorithm: list[int], steps_num: int) -> "Image":
+        """Carry on enhancing until `steps_num` steps were done in total."""
+        while self.steps_num < steps_num:
+            self.pixels = enhance_image(self.pixels, algorithm, self.padding_value)
+            self.padding_value = algorithm[0] if self.padding_value == 0 else algorithm[-1]
+            self.steps_num += 1
+            progress(self)
+        return self
+
+    def count_lit_pixels(self) -> int:
+        return sum(self.pixels.cells)
+
+
+def part_one(data: tuple[list[int], Grid]) -> int:
+    algorithm, image = data
+    return resume(Image(image)).enhance(algorithm, steps_num=2).count_lit_pixels()
+
+
+def part_two(data: tuple[list[int], Grid]) -> int:
     algorithm, image = data
-    enhanced_image = enhance_image(image, algorithm, repeat=2)
-    return count_lit_pixels(enhanced_image)
+    return resume(Image(image)).enhance(algorithm, steps_num=50).count_lit_pixels()
 
 
-def part_two(data: tuple[list[int], list[list[int]]]) -> int:
+def solve(data: tuple[list[int], Grid]) -> tuple[int, int]:
     algorithm, image = data
-    enhanced_image = enhance_image(image, algorithm, repeat=50)
-    return count_lit_pixels(enhanced_image)
+    enhanced_image = Image(image).enhance(algorithm, steps_num=2)
+    lit_pixels = enhanced_image.count_lit_pixels()
+    return lit_pixels, enhanced_image.enhance(algorithm, steps_num=50).count_lit_pixels()
 
 
 if __name__ == "__main__":
@@ -76,6 +90,7 @@ if __name__ == "__main__":
 
     assert part_one(samples) == 35
     assert part_two(samples) == 3351
+    assert solve(samples) == (35, 3351)
 
     print(part_one(data))
     print(part_two(data))
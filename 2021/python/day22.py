@@ -1,116 +1,61 @@
 # https://adventofcode.com/2021/day/22
 
-from __future__ import annotations
-
-import re
+from itertools import compress
 from pathlib import Path
-from typing import Optional, Union
-
-
-class CoordRange:
-    def __init__(self, begin: int, end: int) -> None:
-        self.begin = begin
-        self.end = end
-
-    def __contains__(self, item: Union[int, CoordRange]) -> bool:
-        if isinstance(item, int):
-            return self.begin <= item < self.end
-        return self.begin <= item.begin and self.end >= item.end
-
-    def __len__(self) -> int:
-        return self.end - self.begin
-
-    def __repr__(self) -> str:
-        return f"CoordRange({self.begin}, {self.end})"
-
-    def intersection(self, other: CoordRange) -> Optional[CoordRange]:
-        if self.begin < other.end and self.end > other.begin:
-            begin = max(self.begin, other.begin)
-            end = min(self.end, other.end)
-            return CoordRange(begin, end)
-        return None
-
-
-class Cuboid:
-    def __init__(
-        self,
-        x_range: CoordRange,
-        y_range: CoordRange,
-        z_range: CoordRange,
-        is_on: bool = False,
-    ) -> None:
-        self.x_range = x_range
-        self.y_range = y_range
-        self.z_range = z_range
-        self.is_on = is_on
-
-    def __contains__(self, item: Union[int, Cuboid]) -> bool:
-        if isinstance(item, int):
-            return item in self.x_range and item in self.y_range and item in self.z_range
-        return item.x_range in self.x_range and item.y_range in self.y_range and item.z_range in self.z_range
-
-    def __repr__(self) -> str:
-        return f"Cuboid({repr(self.x_range)}, {repr(self.y_range)}, {repr(self.z_range)})"
-
-    @property
-    def volume(self) -> int:
-        v = len(self.x_range) * len(self.y_range) * len(self.z_range)
-        return v if self.is_on else -v
-
-    def intersection(self, other: Cuboid) -> Optional[Cuboid]:
-        if (
-            (x_range := self.x_range.intersection(other.x_range)) is not None
-            and (y_range := self.y_range.intersection(other.y_range)) is not None
-            and (z_range := self.z_range.intersection(other.z_range)) is not None
-        ):
-            return Cuboid(x_range, y_range, z_range, not self.is_on)
-        return None
-
-
-def load_data(path: Path) -> list[Cuboid]:
-    cuboids = []
+from typing import NamedTuple
+
+from aoc.boxes import Boxes
+from aoc.ints import ints, records
+
+# Steps between two compactions of the processed cuboids, merging the identical boxes inclusion-exclusion piles up.
+COMPACT_EVERY = 5
+
+
+class RebootSteps(NamedTuple):
+    cuboids: Boxes
+    states: list[bool]
+
+
+def parse(text: str) -> RebootSteps:
+    """Return the cuboids of the reboot steps, and whether each step turns cubes on."""
+    states = [line.startswith("on") for line in text.splitlines() if line]
+    cuboids = Boxes(3)
+    for x_min, x_max, y_min, y_max, z_min, z_max in records(ints(text), 6):
+        cuboids.append((x_min, x_max + 1, y_min, y_max + 1, z_min, z_max + 1))
+    return RebootSteps(cuboids, states)
+
+
+def load_data(path: Path) -> RebootSteps:
     with open(path) as fd:
-        for line in fd:
-            is_on = line.startswith("on")
-            x_min, x_max, y_min, y_max, z_min, z_max = [int(coord) for coord in re.findall(r"-?\d+", line)]
-            x_range = CoordRange(x_min, x_max + 1)
-            y_range = CoordRange(y_min, y_max + 1)
-            z_range = CoordRange(z_min, z_max + 1)
-            cuboids.append(Cuboid(x_range, y_range, z_range, is_on))
-    return cuboids
-
-
-def find_intersections(cuboid: Cuboid, candidates: list[Cuboid]) -> list[Cuboid]:
-    cuboids = []
-    for candidate in candidates:
-        intersection = candidate.intersection(cuboid)
-        if intersection:
-            cuboids.append(intersection)
-    return cuboids
-
-
-def apply_init_procedure(cuboids: list[Cuboid], region: Cuboid) -> list[Cuboid]:
-    return [cuboid for cuboid in cuboids if cuboid in region]
-
-
-def reboot_reactor(cuboids: list[Cuboid]) -> int:
-    processed_cuboids = []
-    for cuboid in cuboids:
-        intersections = find_intersections(cuboid, processed_cuboids)
-        processed_cuboids.extend(intersections)
-        if cuboid.is_on:
+        return parse(fd.read())
+
+
+def apply_init_procedure(steps: RebootSteps, region: tuple[int, ...]) -> RebootSteps:
+    inside = steps.cuboids.inside(region)
+    return RebootSteps(steps.cuboids.select(inside), list(compress(steps.states, inside)))
+
+
+def reboot_reactor(steps: RebootSteps) -> int:
+    # Inclusion-exclusion: every step cancels its overlap with the processed cuboids by adding the intersections
+    # with opposite weights, then adds itself when it turns cubes on. The weights are those signs, which is why
+    # the steps' states are kept apart from them.
+    processed_cuboids = Boxes(3)
+    for step, (cuboid, is_on) in enumerate(zip(steps.cuboids, steps.states), 1):
+        if step % COMPACT_EVERY == 0:
+            processed_cuboids = processed_cuboids.compact()
+        processed_cuboids.extend(processed_cuboids.intersect(cuboid, weight_factor=-1))
+        if is_on:
             processed_cuboids.append(cuboid)
-    return sum(cuboid.volume for cuboid in processed_cuboids)
+    return processed_cuboids.weighted_volume()
 
 
-def part_one(data: list[Cuboid]) -> int:
-    border = CoordRange(-50, 51)
-    region = Cuboid(border, border, border)
+def part_one(data: RebootSteps) -> int:
+    region = (-50, 51) * 3
     bounded_cuboids = apply_init_procedure(data, region)
     return reboot_reactor(bounded_cuboids)
 
 
-def part_two(data: list[Cuboid]) -> int:
+def part_two(data: RebootSteps) -> int:
     return reboot_reactor(data)
 
 
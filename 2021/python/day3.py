@@ -3,9 +3,13 @@
 from pathlib import Path
 
 
+def parse(text):
+    return text.splitlines()
+
+
 def load_data(path):
     with open(path) as fd:
-        return fd.readlines()
+        return parse(fd.read())
 
 
 def bin_to_int(binary):
@@ -32,33 +32,41 @@ class BingoBoard:
         return sum(self._numbers.keys())
 
 
-def load_data(path):
-    with open(path) as fd:
-        numbers, *boards = fd.read().split("\n\n")
+def parse(text):
+    numbers, *boards = text.split("\n\n")
     numbers = [int(number) for number in numbers.split(",")]
     boards = [BingoBoard(board) for board in boards]
     return numbers, boards
 
 
-def play(numbers, boards, to_end=False):
+def load_data(path):
+    with open(path) as fd:
+        return parse(fd.read())
+
+
+def play(numbers, boards):
+    """Yield the score of every board as it wins, in winning order."""
     boards = copy.deepcopy(boards)
     for number in numbers:
         for board in boards:
             board.mark(number)
             if board.is_bingo:
-                if not to_end:
-                    return number * board.sum_unmarked()
-                elif len(boards) == 1:
-                    return number * board.sum_unmarked()
+                yield number * board.sum_unmarked()
         boards = [board for board in boards if not board.is_bingo]
 
 
 def part_one(data):
-    return play(*data)
+    return next(play(*data))
 
 
 def part_two(data):
-    return play(*data, to_end=True)
+    *_, last_score = play(*data)
+    return last_score
+
+
+def solve(data):
+    scores = list(play(*data))
+    return scores[0], scores[-1]
 
 
 if __name__ == "__main__":
@@ -68,6 +76,7 @@ if __name__ == "__main__":
 
     assert part_one(samples) == 4512
     assert part_two(samples) == 1924
+    assert solve(samples) == (4512, 1924)
 
     print(part_one(data))
     print(part_two(data))
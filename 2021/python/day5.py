@@ -1,37 +1,36 @@
 # https://adventofcode.com/2021/day/5
 
-import re
-from collections import defaultdict, namedtuple
-from itertools import takewhile
+from collections import Counter, namedtuple
 from pathlib import Path
 
+from aoc.coords import delta2, pack2
+from aoc.inputs import map_input
+from aoc.ints import ints, records
+
 
 Point = namedtuple("Point", "x y")
 Vent = namedtuple("Vent", "start end")
 
 
+def parse(text):
+    return [Vent(Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in records(ints(text, signed=False), 4)]
+
+
 def load_data(path):
-    with open(path) as fd:
-        vents = []
-        for line in fd:
-            x1, y1, x2, y2 = (int(coord) for coord in re.findall(r"\d+", line))
-            vents.append(Vent(Point(x1, y1), Point(x2, y2)))
-    return vents
+    return parse(map_input(path))
 
 
 def count_overlaps(vents):
-    marked_points = defaultdict(int)
+    marked_points = Counter()
     for vent in vents:
         slope_x = vent.end.x - vent.start.x
         slope_y = vent.end.y - vent.start.y
         dx = 0 if slope_x == 0 else slope_x // abs(slope_x)
         dy = 0 if slope_y == 0 else slope_y // abs(slope_y)
-        curr_point = vent.start
-        marked_points[curr_point] += 1
-        while curr_point != vent.end:
-            curr_point = Point(curr_point.x + dx, curr_point.y + dy)
-            marked_points[curr_point] += 1
-    return len([point for point, count in marked_points.items() if count > 1])
+        # Packed points along a vent are evenly spaced ints, so the whole vent is one range.
+        start, end, step = pack2(*vent.start), pack2(*vent.end), delta2(dx, dy)
+        marked_points.update(range(start, end + step, step) if step else (start,))
+    return sum(count > 1 for count in marked_points.values())
 
 
 def part_one(data):
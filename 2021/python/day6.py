@@ -7,9 +7,13 @@ from pathlib import Path
 MAX_FISH_AGE = 8
 
 
+def parse(text):
+    return [int(fish) for fish in text.split(",")]
+
+
 def load_data(path):
     with open(path) as fd:
-        return [int(fish) for fish in fd.read().split(",")]
+        return parse(fd.read())
 
 
 def simulate(fish, days_num=80):
@@ -6,9 +6,13 @@ from pathlib import Path
 from statistics import mean, median
 
 
+def parse(text):
+    return [int(pos) for pos in text.split(",")]
+
+
 def load_data(path):
     with open(path) as fd:
-        return [int(pos) for pos in fd.read().split(",")]
+        return parse(fd.read())
 
 
 def part_one(data):
@@ -7,17 +7,21 @@ from pathlib import Path
 DIGIT_TO_LENGTH = {0: 6, 1: 2, 2: 5, 3: 5, 4: 4, 5: 5, 6: 6, 7: 3, 8: 7, 9: 6}
 
 
-def load_data(path):
+def parse(text):
     data = []
-    with open(path) as fd:
-        for line in fd:
-            patterns, output = line.split("|")
-            patterns = [frozenset(pattern) for pattern in patterns.split()]
-            output = [frozenset(output) for output in output.split()]
-            data.append((patterns, output))
+    for line in text.splitlines():
+        patterns, output = line.split("|")
+        patterns = [frozenset(pattern) for pattern in patterns.split()]
+        output = [frozenset(output) for output in output.split()]
+        data.append((patterns, output))
     return data
 
 
+def load_data(path):
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def get_first_match(criteria, candidates):
     return next(filter(criteria, candidates))
 
@@ -1,69 +1,56 @@
 # https://adventofcode.com/2021/day/9
 
 import math
-from collections import namedtuple
 from pathlib import Path
 
+from aoc.grid import DIGITS, MISSING, Grid
 
-Point = namedtuple("Point", "x y")
-HeightMap = namedtuple("HeightMap", "values max_x max_y")
+
+def parse(text):
+    return Grid.from_text(text, DIGITS)
 
 
 def load_data(path):
-    values = []
     with open(path) as fd:
-        for line in fd:
-            values.append([int(value) for value in line.strip()])
-    max_x = len(values[0]) - 1
-    max_y = len(values) - 1
-    return HeightMap(values, max_x, max_y)
-
-
-def get_neighbors(x, y, max_x, max_y):
-    neighbors = []
-    if x > 0:
-        neighbors.append(Point(x - 1, y))
-    if x < max_x:
-        neighbors.append(Point(x + 1, y))
-    if y > 0:
-        neighbors.append(Point(x, y - 1))
-    if y < max_y:
-        neighbors.append(Point(x, y + 1))
-    return neighbors
+        return parse(fd.read())
 
 
 def get_low_points(heightmap):
-    low_points = []
-    for y, row in enumerate(heightmap.values):
-        for x, height in enumerate(row):
-            neighbors = get_neighbors(x, y, heightmap.max_x, heightmap.max_y)
-            if all(height < heightmap.values[neighbor.y][neighbor.x] for neighbor in neighbors):
-                low_points.append((Point(x, y)))
-    return low_points
+    cells = heightmap.cells
+    return [
+        index
+        for index, neighbors in enumerate(heightmap.neighbors4)
+        if all(cells[index] < cells[neighbor] for neighbor in neighbors)
+    ]
 
 
 def get_risk(heightmap):
-    return sum(heightmap.values[point.y][point.x] + 1 for point in get_low_points(heightmap))
-
-
-def flood_fill(heightmap, visited, x, y):
-    if not visited[y][x]:
-        visited[y][x] = True
-        basin_size = 0
-        for neighbor in get_neighbors(x, y, heightmap.max_x, heightmap.max_y):
-            if heightmap.values[neighbor.y][neighbor.x] < 9:
-                basin_size += flood_fill(heightmap, visited, neighbor.x, neighbor.y)
-        return basin_size + 1
-    return 0
+    return sum(heightmap[index] + 1 for index in get_low_points(heightmap))
+
+
+def flood_fill(heightmap, visited, index):
+    neighbors = heightmap.neighbors4
+    table, stride = neighbors.table, neighbors.stride
+    cells = heightmap.cells
+    visited[index] = True
+    basin_size = 0
+    stack = [index]
+    while stack:
+        index = stack.pop()
+        basin_size += 1
+        for neighbor in table[index * stride : (index + 1) * stride]:
+            if neighbor != MISSING and not visited[neighbor] and cells[neighbor] < 9:
+                visited[neighbor] = True
+                stack.append(neighbor)
+    return basin_size
 
 
 def get_basins(heightmap, top=1):
-    visited = [[False] * (heightmap.max_x + 1) for _ in range(heightmap.max_y + 1)]
+    visited = bytearray(len(heightmap))
     basins = []
-    for y, row in enumerate(heightmap.values):
-        for x, height in enumerate(row):
-            if height < 9:
-                basins.append(flood_fill(heightmap, visited, x, y))
+    for index, height in enumerate(heightmap.cells):
+        if height < 9 and not visited[index]:
+            basins.append(flood_fill(heightmap, visited, index))
     return sorted(basins, reverse=True)[:top]
 
 
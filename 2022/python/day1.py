@@ -1,20 +1,28 @@
 # https://adventofcode.com/2022/day/1
 
 import os
+from array import array
 from pathlib import Path
 from typing import List, Union
 
+from aoc.api import Buffer
+from aoc.inputs import blocks, map_input
+from aoc.ints import ints
 
-def load_data(path: Union[str, bytes, os.PathLike]) -> List[List[int]]:
-    with open(path) as fd:
-        return [[int(item) for item in items.splitlines()] for items in fd.read().split("\n\n")]
 
+def parse(text: Buffer) -> List[array]:
+    return [ints(items) for items in blocks(text)]
 
-def part_one(data: List[List[int]]) -> int:
+
+def load_data(path: Union[str, bytes, os.PathLike]) -> List[array]:
+    return parse(map_input(path))
+
+
+def part_one(data: List[array]) -> int:
     return max(sum(food) for food in data)
 
 
-def part_two(data: List[List[int]]) -> int:
+def part_two(data: List[array]) -> int:
     return sum(sum(elf) for elf in sorted(data, key=sum)[-3:])
 
 
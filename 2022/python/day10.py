@@ -12,16 +12,20 @@ class CpuInstr(NamedTuple):
     value: Optional[int] = None
 
 
-def load_data(path: Union[str, bytes, os.PathLike]) -> List[CpuInstr]:
+def parse(text: str) -> List[CpuInstr]:
     cpu_instrs = []
-    with open(path) as fd:
-        for line in fd:
-            cpu_instrs.append(CpuInstr("noop"))
-            if match := re.search(r"addx ([^\s]+)", line):
-                cpu_instrs.append(CpuInstr("addx", int(match.group(1))))
+    for line in text.splitlines():
+        cpu_instrs.append(CpuInstr("noop"))
+        if match := re.search(r"addx ([^\s]+)", line):
+            cpu_instrs.append(CpuInstr("addx", int(match.group(1))))
     return cpu_instrs
 
 
+def load_data(path: Union[str, bytes, os.PathLike]) -> List[CpuInstr]:
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def execute(cpu_instrs: List[CpuInstr], wanted_cycles: List[int]) -> int:
     x = 1
     signal_strengths = 0
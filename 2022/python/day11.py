@@ -5,10 +5,12 @@ from __future__ import annotations
 import copy
 import math
 import os
-import re
 from collections import deque
 from pathlib import Path
-from typing import Callable, Deque, List, NamedTuple, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Tuple, Union
+
+from aoc.checkpoint import progress, resume
+from aoc.ints import ints
 
 
 class Test(NamedTuple):
@@ -28,6 +30,16 @@ class Monkey:
     def __copy__(self) -> Monkey:
         return Monkey(copy.deepcopy(self.items), self.op, self.test)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # The operation is rebuilt from its source, lambdas can't be pickled.
+        state = self.__dict__.copy()
+        del state["op_fn"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.op_fn = lambda old: eval(self.op)  # pyright: ignore
+
     def add_item(self, item: int) -> None:
         self.items.append(item)
 
@@ -44,29 +56,48 @@ class Monkey:
         return result
 
 
-def load_data(path: Union[str, bytes, os.PathLike]) -> List[Monkey]:
+def parse(text: str) -> List[Monkey]:
     monkeys = []
-    with open(path) as fd:
-        for raw_monkey in fd.read().split("\n\n"):
-            lines = raw_monkey.splitlines()
-            items = deque([int(num) for num in re.findall(r"\d+", lines[1])])
-            op = lines[2].rsplit("=", maxsplit=1)[-1]
-            divider = int(lines[3].rsplit(maxsplit=1)[-1])
-            true = int(lines[4].rsplit(maxsplit=1)[-1])
-            false = int(lines[5].rsplit(maxsplit=1)[-1])
-            monkeys.append(Monkey(items, op, Test(divider, true, false)))
+    for raw_monkey in text.split("\n\n"):
+        lines = raw_monkey.splitlines()
+        items = deque(ints(lines[1]))
+        op = lines[2].rsplit("=", maxsplit=1)[-1]
+        divider = int(lines[3].rsplit(maxsplit=1)[-1])
+        true = int(lines[4].rsplit(maxsplit=1)[-1])
+        false = int(lines[5].rsplit(maxsplit=1)[-1])
+        monkeys.append(Monkey(items, op, Test(divider, true, false)))
     return monkeys
 
 
+def load_data(path: Union[str, bytes, os.PathLike]) -> List[Monkey]:
+    with open(path) as fd:
+        return parse(fd.read())
+
+
+class Game:
+    """Monkeys in the middle of a game, with the number of rounds played so far."""
+
+    def __init__(self, monkeys: List[Monkey]) -> None:
+        self.monkeys = monkeys
+        self.rounds_num = 0
+
+    def play(self, rounds_num: int, worry_fn: Callable[[int], int]) -> int:
+        """Carry on until `rounds_num` rounds were played in total, and return the monkey business."""
+        monkeys = self.monkeys
+        common_divisor = math.prod([monkey.test.divisor for monkey in monkeys])
+        while self.rounds_num < rounds_num:
+            for monkey in monkeys:
+                for item, monkey_idx in monkey.inspect_items(worry_fn):
+                    monkeys[monkey_idx].add_item(item % common_divisor)
+            self.rounds_num += 1
+            progress(self)
+        most_active_monkeys = sorted(monkeys, key=lambda monkey: monkey.total_items_num)
+        monkey_business = most_active_monkeys[-1].total_items_num * most_active_monkeys[-2].total_items_num
+        return monkey_business
+
+
 def play(monkeys: List[Monkey], rounds_num: int, worry_fn: Callable[[int], int]) -> int:
-    common_divisor = math.prod([monkey.test.divisor for monkey in monkeys])
-    for _ in range(rounds_num):
-        for monkey in monkeys:
-            for item, monkey_idx in monkey.inspect_items(worry_fn):
-                monkeys[monkey_idx].add_item(item % common_divisor)
-    most_active_monkeys = sorted(monkeys, key=lambda monkey: monkey.total_items_num)
-    monkey_business = most_active_monkeys[-1].total_items_num * most_active_monkeys[-2].total_items_num
-    return monkey_business
+    return resume(Game(monkeys)).play(rounds_num, worry_fn)
 
 
 def part_one(data: List[Monkey]) -> int:
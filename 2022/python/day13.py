@@ -8,16 +8,20 @@ from pathlib import Path
 Packet = int | list["Packet"]
 
 
-def load_data(path: str | bytes | os.PathLike) -> list[Packet]:
+def parse(text: str) -> list[Packet]:
     packets = []
-    with open(path) as fd:
-        for line in fd:
-            if line.strip():
-                packet: Packet = eval(line)
-                packets.append(packet)
+    for line in text.splitlines():
+        if line.strip():
+            packet: Packet = eval(line)
+            packets.append(packet)
     return packets
 
 
+def load_data(path: str | bytes | os.PathLike) -> list[Packet]:
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def compare_packet(left: Packet | None, right: Packet | None) -> int:
     if not left and right:
         return -1
@@ -47,8 +51,7 @@ def part_one(data: list[Packet]) -> int:
 
 
 def part_two(data: list[Packet]) -> int:
-    data.extend([[[2]], [[6]]])
-    sorted_data = sorted(data, key=cmp_to_key(compare_packet))
+    sorted_data = sorted([*data, [[2]], [[6]]], key=cmp_to_key(compare_packet))
     return (sorted_data.index([[2]]) + 1) * (sorted_data.index([[6]]) + 1)
 
 
@@ -29,9 +29,13 @@ OUTCOME_SCORING: Dict[str, Tuple[str, str, str]] = {
 }
 
 
+def parse(text: str) -> List[Tuple[str, str]]:
+    return [tuple(line.split()) for line in text.splitlines()]
+
+
 def load_data(path: Union[str, bytes, os.PathLike]) -> List[Tuple[str, str]]:
     with open(path) as fd:
-        return [tuple(line.split()) for line in fd.readlines()]
+        return parse(fd.read())
 
 
 def get_total_score(rounds: List[Tuple[str, str]]) -> int:
@@ -8,9 +8,13 @@ LOWERCASE_OFFSET = ord("a") - 1
 UPPERCASE_OFFSET = ord("A") - 27
 
 
+def parse(text: str) -> List[str]:
+    return text.splitlines()
+
+
 def load_data(path: Union[str, bytes, os.PathLike]) -> List[str]:
     with open(path) as fd:
-        return fd.read().splitlines()
+        return parse(fd.read())
 
 
 def find_common(*data: str) -> str:
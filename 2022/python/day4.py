@@ -1,52 +1,35 @@
 # https://adventofcode.com/2022/day/4
 
-from __future__ import annotations
-
 import os
 from pathlib import Path
-from typing import List, Tuple, Union
-
+from typing import Tuple, Union
 
-class Range:
-    start: int
-    end: int
+from aoc.boxes import Boxes
+from aoc.ints import ints, records
 
-    def __init__(self, start: int, end: int) -> None:
-        self.start = start
-        self.end = end
 
-    def __contains__(self, item: Union[int, Range]) -> bool:
-        if isinstance(item, int):
-            return self.start <= item <= self.end
-        return self.start <= item.start and self.end >= item.end
+def parse(text: str) -> Tuple[Boxes, Boxes]:
+    """Return the first and the second sections ranges of every pair, as half-open one-dimensional boxes."""
+    first, second = Boxes(1), Boxes(1)
+    for first_start, first_end, second_start, second_end in records(ints(text, signed=False), 4):
+        first.append((first_start, first_end + 1))
+        second.append((second_start, second_end + 1))
+    return first, second
 
 
-def load_data(path: Union[str, bytes, os.PathLike]) -> List[Tuple[Range, Range]]:
-    assingments = []
+def load_data(path: Union[str, bytes, os.PathLike]) -> Tuple[Boxes, Boxes]:
     with open(path) as fd:
-        for line in fd:
-            assingment = [Range(*[int(id_num) for id_num in range_.split("-")]) for range_ in line.strip().split(",")]
-            assingments.append(assingment)
-    return assingments
-
-
-def part_one(data: List[Tuple[Range, Range]]) -> int:
-    result = 0
-    for first_range, second_range in data:
-        result += bool(first_range in second_range or second_range in first_range)
-    return result
-
-
-def part_two(data: List[Tuple[Range, Range]]) -> int:
-    result = 0
-    for first_range, second_range in data:
-        result += bool(
-            first_range.start in second_range
-            or first_range.end in second_range
-            or second_range.start in first_range
-            or second_range.end in first_range
-        )
-    return result
+        return parse(fd.read())
+
+
+def part_one(data: Tuple[Boxes, Boxes]) -> int:
+    first, second = data
+    return sum(a or b for a, b in zip(first.contains(second), second.contains(first)))
+
+
+def part_two(data: Tuple[Boxes, Boxes]) -> int:
+    first, second = data
+    return sum(first.overlaps(second))
 
 
 if __name__ == "__main__":
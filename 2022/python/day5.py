@@ -2,11 +2,12 @@
 
 import copy
 import os
-import re
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, NamedTuple, Tuple, Union
 
+from aoc.ints import ints, records
+
 Stack = List[str]
 
 
@@ -16,21 +17,22 @@ class Procedure(NamedTuple):
     dest: int
 
 
-def load_data(path: Union[str, bytes, os.PathLike]) -> Tuple[Dict[int, Stack], List[Procedure]]:
-    with open(path) as fd:
-        top, bottom = fd.read().split("\n\n")
+def parse(text: str) -> Tuple[Dict[int, Stack], List[Procedure]]:
+    top, bottom = text.split("\n\n")
     stacks = defaultdict(list)
     for line in top.splitlines()[:-1][::-1]:
         for i, crate in enumerate(line[1::4], start=1):
             if crate != " ":
                 stacks[i].append(crate)
-    procedures = []
-    for line in bottom.splitlines():
-        proc = Procedure(*[int(x) for x in re.findall(r"\d+", line)])
-        procedures.append(proc)
+    procedures = [Procedure(*proc) for proc in records(ints(bottom), 3)]
     return stacks, procedures
 
 
+def load_data(path: Union[str, bytes, os.PathLike]) -> Tuple[Dict[int, Stack], List[Procedure]]:
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def rearrange(stacks: Dict[int, Stack], procedures: List[Procedure], reverse: bool = True) -> Dict[int, Stack]:
     stacks = copy.deepcopy(stacks)
     for proc in procedures:
@@ -5,13 +5,20 @@ from collections import Counter
 from pathlib import Path
 from typing import Union
 
+from aoc.api import Buffer
+from aoc.inputs import map_input, strip
 
-def load_data(path: Union[str, bytes, os.PathLike]) -> str:
-    with open(path) as fd:
-        return fd.read().strip()
 
+def parse(text: Buffer) -> memoryview:
+    """Return a view of the datastream buffer, whose items are the byte values of its characters."""
+    return strip(text)
 
-def find_marker(data: str, unique_chars_num: int = 4) -> int:
+
+def load_data(path: Union[str, bytes, os.PathLike]) -> memoryview:
+    return parse(map_input(path))
+
+
+def find_marker(data: memoryview, unique_chars_num: int = 4) -> int:
     counter = Counter(data[:unique_chars_num])
     tail_idx = 0
     for head in data[unique_chars_num:]:
@@ -26,11 +33,11 @@ def find_marker(data: str, unique_chars_num: int = 4) -> int:
     return tail_idx + unique_chars_num
 
 
-def part_one(data: str) -> int:
+def part_one(data: memoryview) -> int:
     return find_marker(data)
 
 
-def part_two(data: str) -> int:
+def part_two(data: memoryview) -> int:
     return find_marker(data, unique_chars_num=14)
 
 
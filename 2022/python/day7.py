@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Optional, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 TOTAL_DISK_SPACE: int = 70000000
 
@@ -38,43 +38,59 @@ class Dir:
             return self.parent if self.parent else self
         return self.subdirs[name]
 
-    def get_total_size(self) -> int:
-        return sum(d.get_total_size() for d in self.subdirs.values()) + sum(f.size for f in self.files)
+    def get_dir_sizes(self, sizes: List[int]) -> int:
+        """Append the total size of every directory of the tree to `sizes`, subdirectories first, and return its own."""
+        total_size = sum(d.get_dir_sizes(sizes) for d in self.subdirs.values()) + sum(f.size for f in self.files)
+        sizes.append(total_size)
+        return total_size
 
-    def find_dirs(self, minsize: int = 0, maxsize: int = TOTAL_DISK_SPACE) -> List[Dir]:
-        dirs = []
-        for d in self.subdirs.values():
-            dirs.extend(d.find_dirs(minsize, maxsize))
-        if minsize <= self.get_total_size() <= maxsize:
-            dirs.append(self)
-        return dirs
+
+def parse(text: str) -> Dir:
+    curr_dir = Dir()
+    for line in text.splitlines():
+        if match := re.search(r"\$ cd ([^\s]+)", line):
+            curr_dir = curr_dir.cd(match.group(1))
+        elif match := re.search(r"dir ([^\s]+)", line):
+            curr_dir.make_dir(match.group(1))
+        elif match := re.search(r"(\d+) ([^\s]+)", line):
+            curr_dir.create_file(match.group(2), int(match.group(1)))
+        else:
+            continue
+    return curr_dir.cd("/")
 
 
 def load_data(path: Union[str, bytes, os.PathLike]) -> Dir:
-    curr_dir = Dir()
     with open(path) as fd:
-        for line in fd:
-            if match := re.search(r"\$ cd ([^\s]+)", line):
-                curr_dir = curr_dir.cd(match.group(1))
-            elif match := re.search(r"dir ([^\s]+)", line):
-                curr_dir.make_dir(match.group(1))
-            elif match := re.search(r"(\d+) ([^\s]+)", line):
-                curr_dir.create_file(match.group(2), int(match.group(1)))
-            else:
-                continue
-    return curr_dir.cd("/")
+        return parse(fd.read())
+
+
+def dir_sizes(data: Dir) -> List[int]:
+    """Return the total size of every directory, the root's last."""
+    sizes: List[int] = []
+    data.get_dir_sizes(sizes)
+    return sizes
+
+
+def sum_small_dirs(sizes: List[int]) -> int:
+    return sum(size for size in sizes if size <= 100000)
+
+
+def find_dir_to_delete(sizes: List[int]) -> int:
+    total_unused_space = TOTAL_DISK_SPACE - sizes[-1]
+    return min(size for size in sizes if size >= 30000000 - total_unused_space)
 
 
 def part_one(data: Dir) -> int:
-    return sum(d.get_total_size() for d in data.find_dirs(maxsize=100000))
+    return sum_small_dirs(dir_sizes(data))
 
 
 def part_two(data: Dir) -> int:
-    total_used_space = data.get_total_size()
-    total_unused_space = TOTAL_DISK_SPACE - total_used_space
-    dirs = data.find_dirs(minsize=30000000 - total_unused_space)
-    min_dir = min(dirs, key=lambda d: d.get_total_size())
-    return min_dir.get_total_size()
+    return find_dir_to_delete(dir_sizes(data))
+
+
+def solve(data: Dir) -> Tuple[int, int]:
+    sizes = dir_sizes(data)
+    return sum_small_dirs(sizes), find_dir_to_delete(sizes)
 
 
 if __name__ == "__main__":
@@ -84,6 +100,7 @@ if __name__ == "__main__":
 
     assert part_one(samples) == 95437
     assert part_two(samples) == 24933642
+    assert solve(samples) == (95437, 24933642)
 
     print(part_one(data))
     print(part_two(data))
@@ -1,80 +1,71 @@
 # https://adventofcode.com/2022/day/9
 
-from __future__ import annotations
-
 import os
-from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Set, Union
+from typing import List, NamedTuple, Set, Union
 
+from aoc.coords import BIAS, ORIGIN2, delta2, unpack2
 
-@dataclass(eq=True, frozen=True)
-class Position:
-    x: int
-    y: int
+# Positions are packed into ints by `aoc.coords`, and head moves are packed offsets added to them.
+Position = int
 
-    def adjacents(self, other: Position) -> bool:
-        return abs(self.x - other.x) <= 1 and abs(self.y - other.y) <= 1
+HEAD_MOVES = {"U": delta2(0, 1), "D": delta2(0, -1), "L": delta2(-1, 0), "R": delta2(1, 0)}
 
 
-@dataclass
-class Motion:
+class Motion(NamedTuple):
     direction: str
     steps_num: int
 
 
-def load_data(path: Union[str, bytes, os.PathLike]) -> List[Motion]:
+def parse(text: str) -> List[Motion]:
     motions = []
-    with open(path) as fd:
-        for line in fd:
-            direction, steps_num = line.split()
-            motions.append(Motion(direction, int(steps_num)))
+    for line in text.splitlines():
+        direction, steps_num = line.split()
+        motions.append(Motion(direction, int(steps_num)))
     return motions
 
 
+def load_data(path: Union[str, bytes, os.PathLike]) -> List[Motion]:
+    with open(path) as fd:
+        return parse(fd.read())
+
+
 def move_knot(dest: Position, knot: Position) -> Position:
-    while not knot.adjacents(dest):
-        dx, dy = dest.x - knot.x, dest.y - knot.y
-        if dx == 0:
-            nx, ny = knot.x, knot.y + dy // abs(dy)
-        elif dy == 0:
-            nx, ny = knot.x + dx // abs(dx), knot.y
-        else:
-            nx, ny = knot.x + dx // abs(dx), knot.y + dy // abs(dy)
-        knot = Position(nx, ny)
-    return knot
+    dest_x, dest_y = unpack2(dest)
+    knot_x, knot_y = unpack2(knot)
+    dx, dy = dest_x - knot_x, dest_y - knot_y
+    if abs(dx) <= 1 and abs(dy) <= 1:
+        return knot
+    # A knot two steps away moves one step towards `dest` along each axis where they differ.
+    return knot + delta2((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
 
 
 def simulate(motions: List[Motion], rope: List[Position]) -> Set[Position]:
+    # Adding packed moves isn't range checked, but no knot gets further from the origin than all the steps together.
+    if sum(motion.steps_num for motion in motions) >= BIAS:
+        raise ValueError(f"Motions of more than {BIAS - 1} steps may leave the packable range")
     all_visited = {rope[-1]}
     for motion in motions:
+        head_move = HEAD_MOVES[motion.direction]
         for _ in range(motion.steps_num):
-            head, *rest_knots = rope
-            match motion.direction:
-                case "U":
-                    head = Position(head.x, head.y + 1)
-                case "D":
-                    head = Position(head.x, head.y - 1)
-                case "L":
-                    head = Position(head.x - 1, head.y)
-                case "R":
-                    head = Position(head.x + 1, head.y)
-            rope = [head]
-            for knot in rest_knots:
-                knot = move_knot(rope[-1], knot)
-                rope.append(knot)
+            rope[0] += head_move
+            for i in range(1, len(rope)):
+                knot = move_knot(rope[i - 1], rope[i])
+                if knot == rope[i]:
+                    break
+                rope[i] = knot
             all_visited.add(rope[-1])
     return all_visited
 
 
 def part_one(data: List[Motion]) -> int:
-    rope = [Position(0, 0) for _ in range(2)]
+    rope = [ORIGIN2] * 2
     visited = simulate(data, rope)
     return len(visited)
 
 
 def part_two(data: List[Motion]) -> int:
-    rope = [Position(0, 0) for _ in range(10)]
+    rope = [ORIGIN2] * 10
     visited = simulate(data, rope)
     return len(visited)
 
@@ -16,9 +16,13 @@ NUM_WORDS = {
 }
 
 
+def parse(text: str) -> list[str]:
+    return text.splitlines(keepends=True)
+
+
 def load_data(path: str | bytes | os.PathLike) -> list[str]:
     with open(path) as fd:
-        return fd.readlines()
+        return parse(fd.read())
 
 
 def find_calibration_num(line: str, convert_num_words: bool = False) -> int:
@@ -0,0 +1,5 @@
+"""Shared tooling for running and measuring the Advent of Code solutions."""
+
+from aoc.api import solve
+
+__all__ = ["solve"]
@@ -0,0 +1,459 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aoc.days import Day, DayNotFoundError, find_days
+from aoc.defaults import (
+    DEFAULT_BASELINE,
+    DEFAULT_CHECKPOINT_DIR,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    DEFAULT_HISTORY,
+    DEFAULT_PORT,
+    DEFAULT_PROFILE_DIR,
+    DEFAULT_SEED,
+    DEFAULT_WATCH_INTERVAL,
+)
+from aoc.runner import PARTS, SOLVE, collect, format_part, format_report, format_seconds, run_day, run_parallel
+
+if TYPE_CHECKING:
+    from aoc.history import Timing
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    days = find_days(args.year, args.days)
+    if args.input is not None and len(days) != 1:
+        raise DayNotFoundError("--input requires a single year and day")
+    if args.import_profile or args.import_budget is not None:
+        return import_profile_days(args)
+    if args.profile:
+        return profile_days(days, args)
+    if args.memory:
+        return trace_days(days, args)
+    if args.checkpoint:
+        return checkpoint_days(days, args)
+    answers = None
+    if args.memo or args.force:
+        from aoc.answers import AnswerStore
+
+        answers = AnswerStore(force=args.force)
+    start = time.perf_counter()
+    if args.parallel:
+        completed = []
+        for part_result in run_parallel(days, args.input, args.jobs, args.parse_cache, answers):
+            print(format_part(part_result), file=sys.stderr)
+            completed.append(part_result)
+        results = collect(completed)
+    elif args.cache_stats:
+        from aoc import memo
+
+        results = []
+        for day in days:
+            memo.reset()
+            results.append(run_day(day, args.input, args.parse_cache, answers))
+            if used := {name: entry for name, entry in memo.stats().items() if entry.hits or entry.misses}:
+                print(f"{day} caches:\n{memo.format_stats(used)}", file=sys.stderr)
+    else:
+        results = [run_day(day, args.input, args.parse_cache, answers) for day in days]
+    if answers is not None:
+        answers.save()
+    print(format_report(results))
+    print(f"Wall time: {format_seconds(time.perf_counter() - start).strip()}")
+    if args.history:
+        from aoc.history import RUN, day_timings
+
+        record_history(args, RUN, [timing for result in results for timing in day_timings(result)])
+    return int(any(phase.error for result in results for phase in result.phases))
+
+
+def record_history(args: argparse.Namespace, kind: str, timings: "list[Timing]") -> None:
+    from aoc.history import History
+
+    with History(args.history_db) as history:
+        history.record(kind, timings)
+    print(f"{len(timings)} timing(s) recorded in {args.history_db}", file=sys.stderr)
+
+
+def profile_days(days: list[Day], args: argparse.Namespace) -> int:
+    from aoc.profiling import format_hot_spots, profile_day
+
+    results = []
+    for day in days:
+        result, profiles = profile_day(day, args.input, args.profile_dir)
+        results.append(result)
+        for phase, stats in profiles.items():
+            print(f"{day} {phase} hot spots:", *format_hot_spots(stats), sep="\n")
+    print(format_report(results))
+    print(f"Profiles written to {args.profile_dir}")
+    return int(any(phase.error for result in results for phase in result.phases))
+
+
+def import_profile_days(args: argparse.Namespace) -> int:
+    from aoc.imports import format_import_times, profile_imports, total_seconds
+
+    argv = []
+    options = iter(args.argv)
+    for option in options:
+        if option == "--import-budget":
+            next(options, None)
+        elif option != "--import-profile" and not option.startswith("--import-budget="):
+            argv.append(option)
+    times, returncode = profile_imports(argv)
+    print(format_import_times(times))
+    if args.import_budget is not None and (total := total_seconds(times) * 1000) > args.import_budget:
+        print(f"Import time {total:.3f} ms exceeds the budget of {args.import_budget:.3f} ms")
+        return returncode or 1
+    return returncode
+
+
+def trace_days(days: list[Day], args: argparse.Namespace) -> int:
+    from aoc.memory import format_memory, memory_day
+
+    results = []
+    timings = []
+    for day in days:
+        result, reports = memory_day(day, args.input)
+        results.append(result)
+        print(format_memory(day, reports))
+        if args.history:
+            from aoc.history import day_timings
+
+            timings += day_timings(result, {phase: report.peak for phase, report in reports.items()})
+    print(format_report(results))
+    if args.history:
+        from aoc.history import MEMORY
+
+        record_history(args, MEMORY, timings)
+    return int(any(phase.error for result in results for phase in result.phases))
+
+
+def checkpoint_days(days: list[Day], args: argparse.Namespace) -> int:
+    from aoc.checkpoint import checkpoint_day, format_checkpoints
+
+    results = []
+    for day in days:
+        try:
+            result, reports = checkpoint_day(day, args.input, args.checkpoint_dir, args.checkpoint_interval)
+        except KeyboardInterrupt:
+            print(f"{day} interrupted, run it again with --checkpoint to resume", file=sys.stderr)
+            return 130
+        results.append(result)
+        print(format_checkpoints(day, reports), file=sys.stderr)
+    print(format_report(results))
+    return int(any(phase.error for result in results for phase in result.phases))
+
+
+def cmd_answers(args: argparse.Namespace) -> int:
+    from aoc.answers import AnswerStore, format_entry
+
+    answers = AnswerStore()
+    if args.action == "evict":
+        print(f"Evicted {answers.evict(args.year, args.days)} answer(s)")
+        answers.save()
+    else:
+        for _, entry in answers.select(args.year, args.days):
+            print(format_entry(entry))
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    from aoc.bench import bench_day, bench_key, find_regressions, format_stats, load_baseline, save_baseline
+
+    days = find_days(args.year, args.days)
+    baseline = load_baseline(args.baseline)
+    results = {}
+    regressions = []
+    timings = []
+    for day in days:
+        stats = bench_day(day, args.repeat, args.warmup, parse_cache=args.parse_cache)
+        print(format_stats(day, stats, baseline))
+        results[bench_key(day)] = stats
+        regressions.extend(find_regressions(bench_key(day), stats, baseline, args.threshold))
+        if args.history:
+            from aoc.history import bench_timings
+
+            timings += bench_timings(day, stats)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.key} {regression.phase}: median {regression.baseline * 1000:.3f} ms"
+            f" -> {regression.current * 1000:.3f} ms ({regression.percent:+.1f}%)"
+        )
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+    if args.history:
+        from aoc.history import BENCH
+
+        record_history(args, BENCH, timings)
+    return int(bool(regressions))
+
+
+def cmd_history(args: argparse.Namespace) -> int:
+    from aoc import history
+
+    with history.History(args.history_db, args.machine) as db:
+        try:
+            if args.query == "slowest":
+                days = find_days(args.year, args.days) if args.year is not None else None
+                print(history.format_slowest(db.slowest(args.limit, days, memory=args.memory), args.memory))
+            elif args.query == "trend":
+                (day,) = find_days(args.year, [args.day])
+                for phase in [args.phase] if args.phase else db.phases(day):
+                    print(history.format_trend(day, phase, history.trend(db, day, phase, args.commits), args.commits))
+            else:
+                found = history.regressions(db, args.since, args.threshold)
+                print(history.format_regressions(found[: args.limit], args.since))
+                return int(bool(found))
+        except ValueError as error:
+            print(f"aoc: {error}", file=sys.stderr)
+            return 2
+    return 0
+
+
+def cmd_gen(args: argparse.Namespace) -> int:
+    from aoc.generators import generate, load_generator
+
+    day = Day(args.year, args.day)
+    scale = args.scale if args.scale is not None else load_generator(day).DEFAULT_SCALE
+    text = generate(day, scale, args.seed)
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text)
+    return 0
+
+
+def cmd_complexity(args: argparse.Namespace) -> int:
+    from aoc.complexity import analyze, format_analysis
+
+    flagged = []
+    failed = []
+    for day in find_days(args.year, args.days):
+        analysis = analyze(
+            day, args.base, args.steps, args.factor, args.repeat, args.max_seconds, args.tolerance, args.seed
+        )
+        print(format_analysis(analysis))
+        flagged.extend(f"{day} {fit.phase}" for fit in analysis.fits if fit.flagged)
+        if analysis.error is not None:
+            failed.append(str(day))
+    if flagged:
+        print(f"Scaling worse than expected: {', '.join(flagged)}")
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    return int(bool(flagged or failed))
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    import json
+
+    from aoc.batch import find_inputs, run_batch, to_record
+
+    (day,) = find_days(args.year, [args.day])
+    paths = find_inputs(args.inputs)
+    if not paths:
+        print(f"aoc: no input files match {' '.join(args.inputs)}", file=sys.stderr)
+        return 2
+    output = open(args.output, "w") if args.output is not None else sys.stdout
+    start = time.perf_counter()
+    failed = 0
+    try:
+        for path, result, worker in run_batch(day, paths, args.jobs):
+            print(json.dumps(to_record(path, result, worker)), file=output, flush=True)
+            failed += any(phase.error for phase in result.phases)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{day}: {len(paths)} input(s), {failed} failed, wall time {format_seconds(elapsed).strip()}"
+        f" ({len(paths) / elapsed:.1f} inputs/s)",
+        file=sys.stderr,
+    )
+    return int(bool(failed))
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    from aoc.server import SolveServer, SolveService
+
+    service = SolveService(args.jobs)
+    with SolveServer(service, args.port, args.verbose) as server:
+        print(f"Serving {len(service.days)} days with {service.workers} worker(s) on http://127.0.0.1:{args.port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.close()
+    return 0
+
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    from aoc.watch import Watcher, format_run
+
+    days = find_days(args.year, args.days)
+    watcher = Watcher(days)
+    # Days named on the command line run once at start, so that their first change already has a time to beat.
+    pending = [(day, False) for day in days] if args.days else []
+    print(f"Watching {len(days)} day(s), Ctrl-C to stop", flush=True)
+    try:
+        while True:
+            for day, reload in pending:
+                print(format_run(*watcher.run(day, reload)), flush=True)
+            time.sleep(args.interval)
+            changed, reloaded = watcher.poll()
+            if changed:
+                # Editors often save in several writes: let them settle before rerunning.
+                time.sleep(args.interval)
+                settled, also_reloaded = watcher.poll()
+                changed = sorted(set(changed) | set(settled))
+                reloaded |= also_reloaded
+            pending = [(day, day in reloaded) for day in changed]
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code solutions runner")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="run solutions and time parse and each part")
+    run.add_argument("year", type=int, nargs="?", help="year to run, all years by default")
+    run.add_argument("days", type=int, nargs="*", help="days to run, all days by default")
+    run.add_argument("--input", help="input file to use instead of data.in")
+    mode = run.add_mutually_exclusive_group()
+    mode.add_argument("-p", "--parallel", action="store_true", help="run each day and part in a process pool")
+    mode.add_argument("--profile", action="store_true", help="cProfile each phase, writing pstats and flame data")
+    mode.add_argument("--cache-stats", action="store_true", help="report the memoization caches used by each day")
+    mode.add_argument("--memory", action="store_true", help="trace the peak memory and allocation sites of each phase")
+    mode.add_argument("--checkpoint", action="store_true", help="checkpoint simulations, resuming interrupted ones")
+    run.add_argument("-j", "--jobs", type=int, help="number of worker processes, CPU count by default")
+    run.add_argument("--parse-cache", action="store_true", help="reuse parsed inputs pickled next to the inputs")
+    run.add_argument("--profile-dir", type=Path, default=DEFAULT_PROFILE_DIR, help="where --profile writes to")
+    run.add_argument(
+        "--checkpoint-dir", type=Path, default=DEFAULT_CHECKPOINT_DIR, help="where --checkpoint writes to"
+    )
+    run.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=DEFAULT_CHECKPOINT_INTERVAL,
+        help="seconds between two checkpoints of a simulation (default: %(default)s)",
+    )
+    run.add_argument("--memo", action="store_true", help="reuse stored answers of unchanged solutions and inputs")
+    run.add_argument("--force", action="store_true", help="recompute stored answers and store them again")
+    run.add_argument(
+        "--import-profile", action="store_true", help="rerun under -X importtime and report the slowest imports"
+    )
+    run.add_argument(
+        "--import-budget", type=float, metavar="MS", help="like --import-profile, failing above MS of import time"
+    )
+    run.add_argument("--history", action="store_true", help="record the timings in the performance history")
+    run.add_argument("--history-db", type=Path, default=DEFAULT_HISTORY, help="history database to record in")
+    run.set_defaults(func=cmd_run)
+
+    answers = subparsers.add_parser("answers", help="list or evict the answers stored by run --memo")
+    answers.add_argument("action", choices=("list", "evict"))
+    answers.add_argument("year", type=int, nargs="?", help="year to select, all years by default")
+    answers.add_argument("days", type=int, nargs="*", help="days to select, all days by default")
+    answers.set_defaults(func=cmd_answers)
+
+    bench = subparsers.add_parser("bench", help="benchmark solutions and compare them against a stored baseline")
+    bench.add_argument("year", type=int, nargs="?", help="year to benchmark, all years by default")
+    bench.add_argument("days", type=int, nargs="*", help="days to benchmark, all days by default")
+    bench.add_argument("-n", "--repeat", type=int, default=5, help="timed rounds per phase (default: %(default)s)")
+    bench.add_argument("-w", "--warmup", type=int, default=1, help="untimed warm-up rounds (default: %(default)s)")
+    bench.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON file")
+    bench.add_argument("--save", action="store_true", help="store the results in the baseline")
+    bench.add_argument(
+        "--threshold", type=float, default=10.0, help="median slowdown in percent to flag (default: %(default)s)"
+    )
+    bench.add_argument("--parse-cache", action="store_true", help="reuse parsed inputs pickled next to the inputs")
+    bench.add_argument("--history", action="store_true", help="record the medians in the performance history")
+    bench.add_argument("--history-db", type=Path, default=DEFAULT_HISTORY, help="history database to record in")
+    bench.set_defaults(func=cmd_bench)
+
+    history = subparsers.add_parser("history", help="query the timings recorded by run and bench --history")
+    history.add_argument("--history-db", type=Path, default=DEFAULT_HISTORY, help="history database to query")
+    history.add_argument("--machine", help="machine whose timings to query, this one by default")
+    queries = history.add_subparsers(dest="query", required=True)
+    slowest = queries.add_parser("slowest", help="rank the latest timing of every part")
+    slowest.add_argument("year", type=int, nargs="?", help="year to rank, all years by default")
+    slowest.add_argument("days", type=int, nargs="*", help="days to rank, all days by default")
+    slowest.add_argument("-n", "--limit", type=int, default=10, help="number of parts (default: %(default)s)")
+    slowest.add_argument("--memory", action="store_true", help="rank by the peak memory of --memory runs instead")
+    trend = queries.add_parser("trend", help="time of a day's phases over the last commits")
+    trend.add_argument("year", type=int)
+    trend.add_argument("day", type=int)
+    trend.add_argument("phase", nargs="?", choices=("parse", SOLVE, *PARTS), help="phase to follow, all by default")
+    trend.add_argument("--commits", type=int, default=30, help="number of commits back (default: %(default)s)")
+    regressions = queries.add_parser("regressions", help="phases slower now than at a given commit or tag")
+    regressions.add_argument("--since", required=True, metavar="REF", help="commit or tag to compare against")
+    regressions.add_argument("-n", "--limit", type=int, default=10, help="number of regressions (default: %(default)s)")
+    regressions.add_argument(
+        "--threshold", type=float, default=10.0, help="slowdown in percent to flag (default: %(default)s)"
+    )
+    history.set_defaults(func=cmd_history)
+
+    gen = subparsers.add_parser("gen", help="generate a valid puzzle input of a given scale")
+    gen.add_argument("year", type=int)
+    gen.add_argument("day", type=int)
+    gen.add_argument("-s", "--scale", type=int, help="input size, see the day's generator (default: real input size)")
+    gen.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed (default: %(default)s)")
+    gen.add_argument("-o", "--output", type=Path, help="file to write, stdout by default")
+    gen.set_defaults(func=cmd_gen)
+
+    complexity = subparsers.add_parser("complexity", help="fit how each part's time grows with the input scale")
+    complexity.add_argument("year", type=int, nargs="?", help="year to analyse, all years by default")
+    complexity.add_argument("days", type=int, nargs="*", help="days to analyse, all days by default")
+    complexity.add_argument("--base", type=int, help="smallest scale (default: real input size)")
+    complexity.add_argument("--steps", type=int, default=4, help="number of scales (default: %(default)s)")
+    complexity.add_argument("--factor", type=int, default=2, help="growth between scales (default: %(default)s)")
+    complexity.add_argument("-n", "--repeat", type=int, default=1, help="runs per scale, best is kept")
+    complexity.add_argument(
+        "--max-seconds", type=float, default=10.0, help="stop growing once a scale takes longer (default: %(default)s)"
+    )
+    complexity.add_argument(
+        "--tolerance", type=float, default=0.3, help="allowed excess over the expected exponent (default: %(default)s)"
+    )
+    complexity.add_argument("--seed", type=int, default=DEFAULT_SEED, help="random seed (default: %(default)s)")
+    complexity.set_defaults(func=cmd_complexity)
+
+    batch = subparsers.add_parser("batch", help="run one day over many input files in a pool of warm workers")
+    batch.add_argument("year", type=int)
+    batch.add_argument("day", type=int)
+    batch.add_argument("inputs", nargs="+", help="input files, directories of input files or glob patterns")
+    batch.add_argument("-j", "--jobs", type=int, help="number of worker processes, CPU count by default")
+    batch.add_argument("-o", "--output", type=Path, help="JSON lines file to write, stdout by default")
+    batch.set_defaults(func=cmd_batch)
+
+    serve = subparsers.add_parser("serve", help="serve solve requests on localhost from warm worker processes")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on (default: %(default)s)")
+    serve.add_argument("-j", "--jobs", type=int, help="number of worker processes, CPU count by default")
+    serve.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    serve.set_defaults(func=cmd_serve)
+
+    watch = subparsers.add_parser("watch", help="rerun the samples and the data of days as their files change")
+    watch.add_argument("year", type=int, nargs="?", help="year to watch, all years by default")
+    watch.add_argument("days", type=int, nargs="*", help="days to watch and run at start, all days by default")
+    watch.add_argument(
+        "--interval", type=float, default=DEFAULT_WATCH_INTERVAL, help="seconds between polls (default: %(default)s)"
+    )
+    watch.set_defaults(func=cmd_watch)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    args.argv = sys.argv[1:] if argv is None else argv
+    try:
+        return args.func(args)
+    except DayNotFoundError as error:
+        print(f"aoc: {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""Persistent store of computed answers.
+
+Answers are keyed on the day, the part, a hash of the day module's source, a hash of the sources of the `aoc`
+package, a hash of the input and any extra parameters, so an answer is only reused while neither the solution,
+the shared code it may import nor its input changed. The package is hashed like the parse cache's keys do, so
+both stores are invalidated by the same changes.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from aoc.days import ROOT, Day
+from aoc.defaults import DEFAULT_STORE
+from aoc.parsecache import package_digest
+from aoc.runner import PhaseResult
+
+
+class Entry(NamedTuple):
+    year: int
+    day: int
+    part: str
+    input: str
+    params: dict[str, Any]
+    answer: int | str
+    seconds: float
+    stored: float
+
+    @property
+    def stale_key(self) -> tuple[int, int, str, str, str]:
+        """Entries sharing this differ only by source, package or input hash, so only the latest one is kept."""
+        return self.year, self.day, self.part, self.input, json.dumps(self.params, sort_keys=True)
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def display_path(path: Path) -> str:
+    path = path.resolve()
+    return str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path)
+
+
+class AnswerStore:
+    def __init__(self, path: Path = DEFAULT_STORE, force: bool = False):
+        """With `force`, lookups always miss but newly computed answers are still stored."""
+        self.path = path
+        self.force = force
+        self.entries: dict[str, Entry] = {}
+        self.digests: dict[tuple[Path, int, int], str] = {}
+        self.package: str | None = None
+        if path.exists():
+            with open(path) as fd:
+                self.entries = {key: Entry(**entry) for key, entry in json.load(fd).items()}
+
+    def digest(self, path: Path) -> str:
+        stat = path.stat()
+        cache_key = (path.resolve(), stat.st_mtime_ns, stat.st_size)
+        if cache_key not in self.digests:
+            self.digests[cache_key] = file_digest(path)
+        return self.digests[cache_key]
+
+    def key(self, day: Day, part: str, input_path: Path, params: dict[str, Any] | None = None) -> str:
+        if self.package is None:
+            # Hashed once per store, since the package can't change under a running process that imported it.
+            self.package = package_digest()[:16]
+        source = self.digest(day.path)
+        data = self.digest(input_path)
+        params_key = json.dumps(params or {}, sort_keys=True)
+        return f"{day.year}/{day.day}:{part}:{source}:{self.package}:{data}:{params_key}"
+
+    def lookup(
+        self, day: Day, part: str, input_path: Path, params: dict[str, Any] | None = None
+    ) -> PhaseResult | None:
+        if self.force or (entry := self.entries.get(self.key(day, part, input_path, params))) is None:
+            return None
+        return PhaseResult(part, 0.0, entry.answer, cached=True)
+
+    def store(self, day: Day, input_path: Path, phase: PhaseResult, params: dict[str, Any] | None = None) -> None:
+        if phase.error is not None or phase.cached or not isinstance(phase.answer, (int, str)):
+            return
+        path = display_path(input_path)
+        entry = Entry(day.year, day.day, phase.name, path, params or {}, phase.answer, phase.seconds, time.time())
+        self.entries = {key: other for key, other in self.entries.items() if other.stale_key != entry.stale_key}
+        self.entries[self.key(day, phase.name, input_path, params)] = entry
+
+    def select(self, year: int | None = None, days: list[int] | None = None) -> list[tuple[str, Entry]]:
+        selected = [
+            (key, entry)
+            for key, entry in self.entries.items()
+            if (year is None or entry.year == year) and (not days or entry.day in days)
+        ]
+        return sorted(selected, key=lambda item: (item[1].year, item[1].day, item[1].part, item[1].input))
+
+    def evict(self, year: int | None = None, days: list[int] | None = None) -> int:
+        evicted = self.select(year, days)
+        for key, _ in evicted:
+            del self.entries[key]
+        return len(evicted)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as fd:
+            json.dump({key: entry._asdict() for key, entry in sorted(self.entries.items())}, fd, indent=2)
+        os.replace(tmp, self.path)
+
+
+def format_entry(entry: Entry) -> str:
+    answer = entry.answer if isinstance(entry.answer, int) or "\n" not in entry.answer else "<multi-line>"
+    params = f" {json.dumps(entry.params, sort_keys=True)}" if entry.params else ""
+    stored = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.stored))
+    seconds = f"{entry.seconds * 1000:.3f} ms"
+    return f"{entry.year} day {entry.day} {entry.part:<9} {entry.input}{params}  {answer}  ({stored}, {seconds})"
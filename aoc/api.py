@@ -0,0 +1,32 @@
+"""Solve days from memory instead of from input files.
+
+Every day module has a `parse(text)` function, which its `load_data(path)` wraps, so the puzzle input can come
+from a string or from any buffer (bytes, bytearray, memoryview, mmap) holding its UTF-8 encoding.
+"""
+
+from typing import Any
+
+from aoc.days import Day, load_module
+
+Buffer = str | bytes | bytearray | memoryview
+
+
+def decode(data: Buffer) -> str:
+    # str() decodes straight from the buffer protocol, without copying it into an intermediate bytes object.
+    return data if isinstance(data, str) else str(data, "utf-8")
+
+
+def parse(year: int, day: int, data: Buffer) -> Any:
+    return load_module(Day(year, day)).parse(decode(data))
+
+
+def solve(year: int, day: int, data: Buffer) -> tuple[Any, Any]:
+    """Return the answers to both parts of a day for the given puzzle input, through the day's `solve` if any.
+
+    Unlike the runner, errors raised by the solution propagate to the caller.
+    """
+    module = load_module(Day(year, day))
+    parsed = module.parse(decode(data))
+    if hasattr(module, "solve"):
+        return module.solve(parsed)
+    return module.part_one(parsed), module.part_two(parsed)
@@ -0,0 +1,70 @@
+"""Run one day over many input files in a pool of warm worker processes.
+
+Every worker loads the day module once, when it starts, and then parses and solves the files it is handed like
+`run` does, so a corpus of inputs costs one interpreter start per worker rather than one per file. Results are
+written as JSON lines, one per input file, in completion order.
+"""
+
+import glob
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+from aoc.answers import display_path
+from aoc.days import Day
+from aoc.parsecache import CACHE_SUFFIX
+from aoc.runner import DayResult, init_worker, run_day, without_parsed
+
+
+def find_inputs(patterns: list[str]) -> list[Path]:
+    """Expand files, directories (their files, not recursively) and glob patterns into sorted input paths."""
+    found = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            found.update(child for child in path.iterdir() if child.is_file())
+        elif glob.has_magic(pattern):
+            found.update(Path(match) for match in glob.glob(pattern) if Path(match).is_file())
+        else:
+            found.add(path)
+    return sorted(path for path in found if path.suffix != CACHE_SUFFIX)
+
+
+def solve_file(day: Day, path: Path) -> tuple[DayResult, int]:
+    result = run_day(day, path)
+    return DayResult(day, [without_parsed(phase) for phase in result.phases]), os.getpid()
+
+
+def run_batch(day: Day, paths: list[Path], workers: int | None = None) -> Iterator[tuple[Path, DayResult, int]]:
+    """Solve every input file, yielding its path, its result and the pid of the worker in completion order."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=init_worker, initargs=([day],))
+    try:
+        futures = {executor.submit(solve_file, day, path): path for path in paths}
+        for future in as_completed(futures):
+            result, worker = future.result()
+            yield futures[future], result, worker
+    finally:
+        # On Ctrl-C, only the files being solved are waited for, not all those still queued.
+        executor.shutdown(cancel_futures=True)
+
+
+def to_record(path: Path, result: DayResult, worker: int) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "year": result.day.year,
+        "day": result.day.day,
+        "input": display_path(path),
+        "worker": worker,
+        "seconds": result.seconds,
+    }
+    for phase in result.phases:
+        entry: dict[str, Any] = {"seconds": phase.seconds}
+        if phase.error is not None:
+            entry["error"] = phase.error
+        elif phase.name != "parse" and phase.answer is not None:
+            entry["answer"] = phase.answer if isinstance(phase.answer, (int, float, str)) else str(phase.answer)
+        if phase.shared:
+            entry["shared"] = True
+        record[phase.name] = entry
+    return record
@@ -0,0 +1,112 @@
+import json
+import os
+import platform
+import statistics
+from pathlib import Path
+from typing import NamedTuple
+
+from aoc.days import Day
+from aoc.defaults import DEFAULT_BASELINE
+from aoc.runner import PARTS, resolve_input, time_part
+
+# Differences below this many seconds are timer noise, whatever the percentage.
+NOISE_FLOOR: float = 1e-4
+
+
+class PhaseStats(NamedTuple):
+    min: float
+    median: float
+    p95: float
+    samples: int
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "PhaseStats":
+        ordered = sorted(samples)
+        p95 = ordered[max(0, -(-len(ordered) * 95 // 100) - 1)]
+        return cls(ordered[0], statistics.median(ordered), p95, len(ordered))
+
+
+class Regression(NamedTuple):
+    key: str
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def percent(self) -> float:
+        return (self.current / self.baseline - 1) * 100
+
+
+def bench_key(day: Day) -> str:
+    return f"{day.year}/{day.day}"
+
+
+def bench_day(
+    day: Day,
+    repeat: int = 5,
+    warmup: int = 1,
+    input_path: str | os.PathLike | None = None,
+    parse_cache: bool = False,
+) -> dict[str, PhaseStats]:
+    """Time each phase of a day `repeat` times after `warmup` untimed rounds."""
+    path = resolve_input(day, input_path)
+    samples: dict[str, list[float]] = {"parse": [], **{part: [] for part in PARTS}}
+    for round_num in range(warmup + repeat):
+        for part in PARTS:
+            parse, result = time_part(day, path, part, parse_cache)
+            if round_num >= warmup:
+                samples["parse"].append(parse.seconds)
+                samples[part].append(result.seconds)
+    return {phase: PhaseStats.from_samples(times) for phase, times in samples.items()}
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> dict[str, dict[str, PhaseStats]]:
+    if not path.exists():
+        return {}
+    with open(path) as fd:
+        raw = json.load(fd)
+    return {
+        key: {phase: PhaseStats(**stats) for phase, stats in phases.items()} for key, phases in raw["results"].items()
+    }
+
+
+def save_baseline(results: dict[str, dict[str, PhaseStats]], path: Path = DEFAULT_BASELINE) -> None:
+    merged = load_baseline(path)
+    merged.update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as fd:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.node(),
+                "results": {
+                    key: {phase: stats._asdict() for phase, stats in phases.items()}
+                    for key, phases in sorted(merged.items())
+                },
+            },
+            fd,
+            indent=2,
+        )
+
+
+def find_regressions(
+    key: str, current: dict[str, PhaseStats], baseline: dict[str, dict[str, PhaseStats]], threshold: float
+) -> list[Regression]:
+    regressions = []
+    for phase, stats in current.items():
+        if (base := baseline.get(key, {}).get(phase)) is None:
+            continue
+        if stats.median - base.median > max(NOISE_FLOOR, base.median * threshold / 100):
+            regressions.append(Regression(key, phase, base.median, stats.median))
+    return regressions
+
+
+def format_stats(day: Day, results: dict[str, PhaseStats], baseline: dict[str, dict[str, PhaseStats]]) -> str:
+    lines = [f"{day}"]
+    for phase, stats in results.items():
+        line = f"  {phase:<9} min {stats.min * 1000:10.3f} ms  median {stats.median * 1000:10.3f} ms"
+        line += f"  p95 {stats.p95 * 1000:10.3f} ms"
+        if (base := baseline.get(bench_key(day), {}).get(phase)) is not None and base.median > 0:
+            line += f"  ({(stats.median / base.median - 1) * 100:+.1f}% vs baseline)"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,153 @@
+"""Collections of N-dimensional integer boxes stored in flat arrays.
+
+A box is a half-open range `[low, high)` along each of its dimensions, given as `(low0, high0, low1, high1, ...)`.
+A `Boxes` collection keeps the bounds of all its boxes in one `array("q")`, along with an integer weight per box.
+Intersections, containment tests and volumes work column by column: the same bound of every box is one strided
+slice of the array, which `map` combines with builtin and `operator` functions and `itertools.compress` filters,
+so their loops run in C rather than once per box in Python. Inclusion-exclusion over boxes produces many identical
+boxes, which `compact` merges into one by summing their weights.
+"""
+
+import operator
+from array import array
+from itertools import compress, repeat
+from typing import Iterable, Iterator, Sequence
+
+Box = tuple[int, ...]
+
+
+def every(tests: Iterable[Iterable[bool]]) -> list[bool]:
+    """Combine several columns of tests into whether every test holds, position by position."""
+    result: list[bool] | None = None
+    for test in tests:
+        result = list(test) if result is None else list(map(operator.and_, result, test))
+    return result if result is not None else []
+
+
+class Boxes:
+    __slots__ = ("dims", "bounds", "weights")
+
+    def __init__(self, dims: int, bounds: Iterable[int] = (), weights: Iterable[int] | None = None) -> None:
+        self.dims = dims
+        self.bounds = array("q", bounds)
+        if len(self.bounds) % (2 * dims):
+            raise ValueError(f"{len(self.bounds)} bounds don't make {dims}-dimensional boxes")
+        self.weights = array("q", weights if weights is not None else [1] * (len(self.bounds) // (2 * dims)))
+        if len(self.weights) * 2 * dims != len(self.bounds):
+            raise ValueError(f"{len(self.weights)} weights given for {len(self.bounds) // (2 * dims)} boxes")
+
+    @classmethod
+    def from_columns(cls, columns: Sequence[Iterable[int]], weights: Iterable[int]) -> "Boxes":
+        """Build boxes from the columns of their bounds, `low0, high0, low1, high1, ...`."""
+        result = cls(len(columns) // 2)
+        result.weights = array("q", weights)
+        result.bounds = array("q", [0]) * (len(result.weights) * len(columns))
+        for index, column in enumerate(columns):
+            result.bounds[index :: len(columns)] = array("q", column)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def __getitem__(self, index: int) -> Box:
+        size = 2 * self.dims
+        return tuple(self.bounds[index * size : (index + 1) * size])
+
+    def __iter__(self) -> Iterator[Box]:
+        size = 2 * self.dims
+        return zip(*[iter(self.bounds)] * size)
+
+    def append(self, box: Sequence[int], weight: int = 1) -> None:
+        self.bounds.extend(box)
+        self.weights.append(weight)
+
+    def extend(self, other: "Boxes") -> None:
+        self.bounds.extend(other.bounds)
+        self.weights.extend(other.weights)
+
+    def column(self, index: int) -> array:
+        """Return the bound at `index` in the boxes' bounds, `low0, high0, low1, ...`, of every box."""
+        return self.bounds[index :: 2 * self.dims]
+
+    def select(self, keep: Sequence[bool]) -> "Boxes":
+        """Return the boxes, with their weights, at the positions where `keep` is true."""
+        columns = [compress(self.column(index), keep) for index in range(2 * self.dims)]
+        return Boxes.from_columns(columns, compress(self.weights, keep))
+
+    def intersect(self, box: Sequence[int], weight_factor: int = 1) -> "Boxes":
+        """Return the non-empty intersections of `box` with every box, their weights multiplied by `weight_factor`."""
+        # Most boxes miss `box`, so they're filtered out a dimension at a time before the others are clipped.
+        columns: list[Iterable[int]] = [self.column(index) for index in range(2 * self.dims)]
+        weights: Iterable[int] = self.weights
+        for low in range(0, 2 * self.dims, 2):
+            keep = list(
+                map(
+                    operator.and_,
+                    map(operator.lt, columns[low], repeat(box[low + 1])),
+                    map(operator.lt, repeat(box[low]), columns[low + 1]),
+                )
+            )
+            columns = [list(compress(column, keep)) for column in columns]
+            weights = list(compress(weights, keep))
+        for low in range(0, 2 * self.dims, 2):
+            columns[low] = map(max, repeat(box[low]), columns[low])
+            columns[low + 1] = map(min, repeat(box[low + 1]), columns[low + 1])
+        return Boxes.from_columns(columns, map(operator.mul, weights, repeat(weight_factor)))
+
+    def compact(self) -> "Boxes":
+        """Return the collection with identical boxes merged into one, summing their weights, and weight 0 dropped."""
+        merged: dict[Box, int] = {}
+        for box, weight in zip(self, self.weights):
+            merged[box] = merged.get(box, 0) + weight
+        result = Boxes(self.dims)
+        for box, weight in merged.items():
+            if weight:
+                result.append(box, weight)
+        return result
+
+    def inside(self, box: Sequence[int]) -> list[bool]:
+        """Tell for every box whether it lies entirely inside `box`."""
+        return every(
+            test
+            for low in range(0, 2 * self.dims, 2)
+            for test in (
+                map(operator.le, repeat(box[low]), self.column(low)),
+                map(operator.le, self.column(low + 1), repeat(box[low + 1])),
+            )
+        )
+
+    def within(self, box: Sequence[int]) -> "Boxes":
+        """Return the boxes lying entirely inside `box`."""
+        return self.select(self.inside(box))
+
+    def contains(self, other: "Boxes") -> list[bool]:
+        """Tell for every box whether it contains the box at the same position in `other`."""
+        return every(
+            test
+            for low in range(0, 2 * self.dims, 2)
+            for test in (
+                map(operator.le, self.column(low), other.column(low)),
+                map(operator.le, other.column(low + 1), self.column(low + 1)),
+            )
+        )
+
+    def overlaps(self, other: "Boxes") -> list[bool]:
+        """Tell for every box whether it overlaps the box at the same position in `other`."""
+        return every(
+            test
+            for low in range(0, 2 * self.dims, 2)
+            for test in (
+                map(operator.lt, self.column(low), other.column(low + 1)),
+                map(operator.lt, other.column(low), self.column(low + 1)),
+            )
+        )
+
+    def volumes(self) -> list[int]:
+        volumes: list[int] | None = None
+        for low in range(0, 2 * self.dims, 2):
+            sides = map(operator.sub, self.column(low + 1), self.column(low))
+            volumes = list(sides) if volumes is None else list(map(operator.mul, volumes, sides))
+        return volumes if volumes is not None else [1] * len(self)
+
+    def weighted_volume(self) -> int:
+        return sum(map(operator.mul, self.weights, self.volumes()))
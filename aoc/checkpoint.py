@@ -0,0 +1,144 @@
+"""Opt-in checkpoints of long-running simulations, to resume them after an interruption.
+
+A simulation supporting checkpoints starts from `resume(initial_state)` and calls `progress(state)` after each of
+its steps. Both do nothing unless a checkpoint is active, which `run --checkpoint` sets up around every part. Then
+`progress` pickles the state to the checkpoint file whenever `interval` seconds have passed since the last write,
+and on the next run `resume` hands back the last state written instead of the initial one.
+
+Checkpoint files start with the same key as the parse cache, so a state is only resumed with the same input,
+solution source, `aoc` package and Python version. A checkpoint is removed once its part completes, and the time
+of every write is recorded.
+"""
+
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+
+from aoc.days import Day, load_module
+from aoc.defaults import DEFAULT_CHECKPOINT_DIR, DEFAULT_CHECKPOINT_INTERVAL
+from aoc.memory import format_bytes
+from aoc.parsecache import cache_key
+from aoc.runner import PARTS, DayResult, resolve_input, timed
+
+T = TypeVar("T")
+
+
+class CheckpointReport(NamedTuple):
+    path: Path
+    resumed: bool
+    writes: list[float]
+    size: int
+
+
+class Checkpoint:
+    def __init__(self, path: Path, key: bytes, interval: float = DEFAULT_CHECKPOINT_INTERVAL) -> None:
+        self.path = path
+        self.key = key
+        self.interval = interval
+        self.resumed = False
+        self.writes: list[float] = []
+        self.size = 0
+        self.last_write = time.perf_counter()
+
+    def load(self) -> Any | None:
+        try:
+            with open(self.path, "rb") as fd:
+                if fd.readline().rstrip(b"\n") != self.key:
+                    return None
+                state = pickle.load(fd)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        self.resumed = True
+        return state
+
+    def save(self, state: Any) -> None:
+        start = time.perf_counter()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "wb") as fd:
+            fd.write(self.key + b"\n")
+            pickle.dump(state, fd, protocol=pickle.HIGHEST_PROTOCOL)
+            self.size = fd.tell()
+        # An interruption during the write leaves the previous checkpoint intact.
+        os.replace(tmp, self.path)
+        self.last_write = time.perf_counter()
+        self.writes.append(self.last_write - start)
+
+    def update(self, state: Any) -> None:
+        if time.perf_counter() - self.last_write >= self.interval:
+            self.save(state)
+
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def report(self) -> CheckpointReport:
+        return CheckpointReport(self.path, self.resumed, self.writes, self.size)
+
+
+_active: Checkpoint | None = None
+
+
+def resume(state: T) -> T:
+    """Return the state saved by the active checkpoint, if any, or else `state`."""
+    if _active is None or (saved := _active.load()) is None:
+        return state
+    return saved
+
+
+def progress(state: Any) -> None:
+    """Save `state` to the active checkpoint, if any, when it is due."""
+    if _active is not None:
+        _active.update(state)
+
+
+def checkpoint_path(directory: Path, day: Day, phase: str, input_path: Path) -> Path:
+    return directory / f"{day.year}-{day.day:02d}-{phase}-{input_path.stem}.checkpoint"
+
+
+def checkpoint_day(
+    day: Day,
+    input_path: str | os.PathLike | None = None,
+    directory: Path = DEFAULT_CHECKPOINT_DIR,
+    interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+) -> tuple[DayResult, dict[str, CheckpointReport]]:
+    """Run a day like `run_day` with every part checkpointed, resuming the parts interrupted before.
+
+    Parts run one by one even when the day has a `solve` function, since checkpoints are kept per part.
+    """
+    global _active
+    module = load_module(day)
+    path = resolve_input(day, input_path)
+    parse = timed("parse", module.load_data, path)
+    phases = [parse]
+    reports = {}
+    if parse.error is None:
+        key = cache_key(day, path)
+        for part in PARTS:
+            checkpoint = Checkpoint(checkpoint_path(directory, day, part, path), key, interval)
+            _active = checkpoint
+            try:
+                phase = timed(part, getattr(module, part), parse.answer)
+            finally:
+                _active = None
+            if phase.error is None:
+                checkpoint.remove()
+            phases.append(phase)
+            reports[part] = checkpoint.report()
+    return DayResult(day, phases), reports
+
+
+def format_checkpoints(day: Day, reports: dict[str, CheckpointReport]) -> str:
+    lines = []
+    for part, report in reports.items():
+        resumed = ", resumed" if report.resumed else ""
+        if not report.writes:
+            lines.append(f"{day} {part}: no checkpoint written{resumed}")
+            continue
+        mean = sum(report.writes) / len(report.writes)
+        lines.append(
+            f"{day} {part}: {len(report.writes)} checkpoint(s) of {format_bytes(report.size)}{resumed},"
+            f" write mean {mean * 1000:.3f} ms, max {max(report.writes) * 1000:.3f} ms"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,123 @@
+"""Empirical complexity analysis.
+
+Each part is timed on generated inputs of growing scale (n, 2n, 4n, ...) and the growth exponent `k` of
+`time ~ scale**k` is fitted by least squares on the log-log points.
+"""
+
+import math
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+from aoc.days import Day
+from aoc.generators import DEFAULT_SEED, generate, load_generator
+from aoc.runner import PARTS, time_part
+
+# Fits whose slowest point is faster than this are dominated by timer noise.
+MIN_RELIABLE_SECONDS: float = 0.005
+
+
+class Fit(NamedTuple):
+    phase: str
+    exponent: float
+    expected: float | None
+    reliable: bool
+    flagged: bool
+
+
+class Analysis(NamedTuple):
+    day: Day
+    scales: list[int]
+    times: dict[str, list[float]]
+    fits: list[Fit]
+    error: str | None = None
+
+
+def fit_exponent(scales: list[int], times: list[float]) -> float:
+    xs = [math.log(scale) for scale in scales]
+    ys = [math.log(max(time, 1e-9)) for time in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+def measure(day: Day, scale: int, seed: int = DEFAULT_SEED, repeat: int = 1) -> dict[str, float]:
+    best = {"parse": math.inf, **{part: math.inf for part in PARTS}}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "input.in"
+        path.write_text(generate(day, scale, seed))
+        for _ in range(repeat):
+            for part in PARTS:
+                parse, result = time_part(day, path, part)
+                best["parse"] = min(best["parse"], parse.seconds)
+                best[part] = min(best[part], result.seconds)
+    return best
+
+
+def analyze(
+    day: Day,
+    base: int | None = None,
+    steps: int = 4,
+    factor: int = 2,
+    repeat: int = 1,
+    max_seconds: float = 10.0,
+    tolerance: float = 0.3,
+    seed: int = DEFAULT_SEED,
+) -> Analysis:
+    """Fit the growth exponent of each phase of a day.
+
+    Scales grow by `factor` for `steps` points, stopping early once a single point takes more than
+    `max_seconds` in total. A phase is flagged when it grows faster than the generator's expected exponent
+    (linear by default) by more than `tolerance`. A failure stops the growth too, and is reported on the analysis
+    along with the fits of the points measured before it.
+    """
+    generator = load_generator(day)
+    scale = base if base is not None else generator.DEFAULT_SCALE
+    expected = getattr(generator, "EXPECTED_EXPONENT", 1.0)
+    scales: list[int] = []
+    times: dict[str, list[float]] = {"parse": [], **{part: [] for part in PARTS}}
+    error = None
+    for _ in range(steps):
+        try:
+            point = measure(day, scale, seed, repeat)
+        except Exception as failure:
+            # time_part already names the day and the phase which failed.
+            message = str(failure) if isinstance(failure, RuntimeError) else repr(failure)
+            error = f"failed at scale {scale}: {message}"
+            break
+        scales.append(scale)
+        for phase, seconds in point.items():
+            times[phase].append(seconds)
+        if sum(point.values()) > max_seconds:
+            break
+        scale *= factor
+    fits = []
+    if len(scales) >= 2:
+        for phase, phase_times in times.items():
+            exponent = fit_exponent(scales, phase_times)
+            reliable = max(phase_times) >= MIN_RELIABLE_SECONDS
+            flagged = reliable and expected is not None and exponent > expected + tolerance
+            fits.append(Fit(phase, exponent, expected, reliable, flagged))
+    return Analysis(day, scales, times, fits, error)
+
+
+def format_analysis(analysis: Analysis) -> str:
+    lines = [f"{analysis.day}"]
+    if analysis.scales:
+        lines[0] += f" (scales {', '.join(str(scale) for scale in analysis.scales)})"
+    if analysis.error is not None:
+        lines.append(f"  {analysis.error}")
+    elif not analysis.fits:
+        lines.append("  not enough points to fit, lower the base scale or raise --max-seconds")
+    for fit in analysis.fits:
+        slowest = max(analysis.times[fit.phase])
+        expected = "none" if fit.expected is None else f"{fit.expected:.1f}"
+        line = f"  {fit.phase:<9} exponent {fit.exponent:5.2f} (expected {expected}, slowest {slowest * 1000:.3f} ms)"
+        if not fit.reliable:
+            line += "  too fast to be reliable"
+        elif fit.flagged:
+            line += "  SCALES WORSE THAN EXPECTED"
+        lines.append(line)
+    return "\n".join(lines)
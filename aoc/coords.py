@@ -0,0 +1,62 @@
+"""Integer coordinates packed into single ints.
+
+A point `(x, y)` or `(x, y, z)` is stored as one int, each coordinate taking `BITS` bits offset by `BIAS` so that
+negative values pack too. Points then hash and compare as plain ints, and sets and dicts of them hold no tuples.
+
+Packing is linear, so the difference of two packed points is the packed `delta` between them, and adding a
+`delta` to a packed point moves it, without unpacking either. This holds while every coordinate stays within
+`[-BIAS, BIAS)`: packing raises a ValueError for coordinates outside it, but sums of packed ints aren't checked,
+so solutions moving points that way have to bound how far they go, or repack the points they end up with.
+"""
+
+BITS: int = 21
+BIAS: int = 1 << (BITS - 1)
+MASK: int = (1 << BITS) - 1
+
+# The packed `(0, 0)` and `(0, 0, 0)`: adding a delta to them packs the point it leads to.
+ORIGIN2: int = BIAS | BIAS << BITS
+ORIGIN3: int = BIAS | BIAS << BITS | BIAS << 2 * BITS
+
+
+def pack2(x: int, y: int) -> int:
+    x += BIAS
+    y += BIAS
+    # Biased coordinates out of range are negative or take more than BITS bits, leaving bits set after the shift.
+    if (x | y) >> BITS:
+        raise ValueError(f"Point ({x - BIAS}, {y - BIAS}) is out of the packable range [{-BIAS}, {BIAS})")
+    return x | y << BITS
+
+
+def unpack2(point: int) -> tuple[int, int]:
+    return (point & MASK) - BIAS, (point >> BITS & MASK) - BIAS
+
+
+def delta2(dx: int, dy: int) -> int:
+    """Return the packed offset moving a packed 2D point by `(dx, dy)`."""
+    return pack2(dx, dy) - ORIGIN2
+
+
+def pack3(x: int, y: int, z: int) -> int:
+    x += BIAS
+    y += BIAS
+    z += BIAS
+    if (x | y | z) >> BITS:
+        raise ValueError(
+            f"Point ({x - BIAS}, {y - BIAS}, {z - BIAS}) is out of the packable range [{-BIAS}, {BIAS})"
+        )
+    return x | y << BITS | z << 2 * BITS
+
+
+def unpack3(point: int) -> tuple[int, int, int]:
+    return (point & MASK) - BIAS, (point >> BITS & MASK) - BIAS, (point >> 2 * BITS & MASK) - BIAS
+
+
+def delta3(dx: int, dy: int, dz: int) -> int:
+    """Return the packed offset moving a packed 3D point by `(dx, dy, dz)`."""
+    return pack3(dx, dy, dz) - ORIGIN3
+
+
+def manhattan3(point: int, other: int) -> int:
+    x, y, z = unpack3(point)
+    other_x, other_y, other_z = unpack3(other)
+    return abs(x - other_x) + abs(y - other_y) + abs(z - other_z)
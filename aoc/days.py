@@ -0,0 +1,70 @@
+import importlib.util
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import NamedTuple
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+
+class DayNotFoundError(Exception):
+    pass
+
+
+class Day(NamedTuple):
+    year: int
+    day: int
+
+    def __str__(self) -> str:
+        return f"{self.year} day {self.day}"
+
+    @property
+    def path(self) -> Path:
+        return ROOT / str(self.year) / "python" / f"day{self.day}.py"
+
+    @property
+    def input_dir(self) -> Path:
+        return ROOT / str(self.year) / "inputs" / f"{self.day:02d}"
+
+    @property
+    def module_name(self) -> str:
+        return f"y{self.year}_day{self.day}"
+
+
+def find_years() -> list[int]:
+    return sorted(int(path.parent.name) for path in ROOT.glob("[0-9][0-9][0-9][0-9]/python"))
+
+
+def find_days(year: int | None = None, days: list[int] | None = None) -> list[Day]:
+    years = [year] if year is not None else find_years()
+    found = []
+    for y in years:
+        for path in (ROOT / str(y) / "python").glob("day*.py"):
+            if match := re.fullmatch(r"day(\d+)\.py", path.name):
+                found.append(Day(y, int(match.group(1))))
+    if days:
+        missing = set(days) - {day.day for day in found}
+        if missing:
+            raise DayNotFoundError(f"No solution found for {year} day {min(missing)}")
+        found = [day for day in found if day.day in days]
+    if not found:
+        raise DayNotFoundError(f"No solutions found for {year}")
+    return sorted(found)
+
+
+def load_module(day: Day) -> ModuleType:
+    if (module := sys.modules.get(day.module_name)) is not None:
+        return module
+    if not day.path.exists():
+        raise DayNotFoundError(f"No solution found for {day}")
+    spec = importlib.util.spec_from_file_location(day.module_name, day.path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[day.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+    return module
@@ -0,0 +1,21 @@
+"""Default settings of the command line.
+
+They live apart from the modules using them, so that building the argument parser imports none of those modules,
+nor their dependencies: `python -m aoc run` shouldn't pay for an HTTP server or a profiler it doesn't use.
+"""
+
+from pathlib import Path
+
+from aoc.days import ROOT
+
+STATE_DIR: Path = ROOT / ".aoc"
+
+DEFAULT_STORE: Path = STATE_DIR / "answers.json"
+DEFAULT_BASELINE: Path = STATE_DIR / "baseline.json"
+DEFAULT_PROFILE_DIR: Path = STATE_DIR / "profiles"
+DEFAULT_PORT: int = 8021
+DEFAULT_SEED: int = 2021
+DEFAULT_CHECKPOINT_DIR: Path = STATE_DIR / "checkpoints"
+DEFAULT_CHECKPOINT_INTERVAL: float = 5.0
+DEFAULT_WATCH_INTERVAL: float = 0.5
+DEFAULT_HISTORY: Path = STATE_DIR / "history.sqlite"
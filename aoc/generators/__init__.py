@@ -0,0 +1,25 @@
+"""Seeded generators of valid puzzle inputs at arbitrary scale.
+
+Every day has a module `aoc.generators.y<year>.day<N>` with a `generate(scale, rng)` function returning the
+input text. What `scale` measures (lines, grid side, packets, ...) is described in each module's docstring.
+`DEFAULT_SCALE` matches the size of the real puzzle input, and `EXPECTED_EXPONENT`, when present, overrides the
+linear growth of the work with `scale` that is otherwise expected (None when the growth isn't polynomial).
+"""
+
+import importlib
+import random
+from types import ModuleType
+
+from aoc.days import Day, DayNotFoundError
+from aoc.defaults import DEFAULT_SEED
+
+
+def load_generator(day: Day) -> ModuleType:
+    try:
+        return importlib.import_module(f"aoc.generators.y{day.year}.day{day.day}")
+    except ModuleNotFoundError as error:
+        raise DayNotFoundError(f"No input generator found for {day}") from error
+
+
+def generate(day: Day, scale: int, seed: int = DEFAULT_SEED) -> str:
+    return load_generator(day).generate(scale, random.Random(seed))
@@ -0,0 +1,14 @@
+"""Sonar sweep depths; `scale` is the number of measurements."""
+
+import random
+
+DEFAULT_SCALE: int = 2000
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(scale):
+        depth = max(0, depth + rng.randint(-5, 10))
+        depths.append(depth)
+    return "".join(f"{depth}\n" for depth in depths)
@@ -0,0 +1,42 @@
+"""Navigation subsystem; `scale` is the number of lines.
+
+Roughly half of the lines are corrupted and the rest are incomplete, so both parts have something to score.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 90
+PAIRS: dict[str, str] = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def balanced_chunks(length: int, rng: random.Random) -> list[str]:
+    chars = []
+    stack = []
+    while len(chars) < length:
+        if stack and (rng.random() < 0.45 or len(chars) + len(stack) >= length):
+            chars.append(PAIRS[stack.pop()])
+        else:
+            opening = rng.choice(list(PAIRS))
+            stack.append(opening)
+            chars.append(opening)
+    return chars + [PAIRS[opening] for opening in reversed(stack)]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for index in range(scale):
+        chars = balanced_chunks(rng.randint(40, 110), rng)
+        if index % 2:
+            closing = [i for i, char in enumerate(chars) if char in PAIRS.values()]
+            position = rng.choice(closing)
+            chars[position] = rng.choice([char for char in PAIRS.values() if char != chars[position]])
+        else:
+            depth = 0
+            open_positions = []
+            for i, char in enumerate(chars):
+                depth += 1 if char in PAIRS else -1
+                if depth > 0:
+                    open_positions.append(i)
+            chars = chars[: rng.choice(open_positions) + 1]
+        lines.append("".join(chars) + "\n")
+    return "".join(lines)
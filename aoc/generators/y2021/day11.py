@@ -0,0 +1,19 @@
+"""Dumbo octopus energy levels; `scale` is the side of the square grid.
+
+Fully random grids rarely synchronise, so most octopuses start at one shared level and only a sprinkle of
+them is random. Such grids reach the all-flash step of part two quickly.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 10
+EXPECTED_EXPONENT: float | None = 2.0
+NOISE: float = 0.15
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    level = rng.randint(0, 9)
+    rows = []
+    for _ in range(scale):
+        rows.append("".join(str(rng.randint(0, 9) if rng.random() < NOISE else level) for _ in range(scale)))
+    return "".join(f"{row}\n" for row in rows)
@@ -0,0 +1,35 @@
+"""Cave system; `scale` is the number of small caves.
+
+Big caves are never connected to each other, otherwise there would be infinitely many paths. The number of
+paths grows exponentially with the number of caves, so there is no polynomial growth to expect.
+"""
+
+import random
+import string
+
+DEFAULT_SCALE: int = 8
+EXPECTED_EXPONENT: float | None = None
+
+
+def cave_names(count: int, letters: str, rng: random.Random) -> list[str]:
+    names: set[str] = set()
+    while len(names) < count:
+        names.add("".join(rng.choices(letters, k=2)))
+    return sorted(names)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    small = [name for name in cave_names(scale + 2, string.ascii_lowercase, rng) if name not in ("start", "end")]
+    big = cave_names(max(1, scale // 4), string.ascii_uppercase, rng)
+    edges: set[tuple[str, str]] = set()
+    for cave in big:
+        for neighbor in rng.sample(small, min(len(small), 3)):
+            edges.add((cave, neighbor))
+    for cave in small:
+        edges.add((cave, rng.choice(small + big)))
+    for cave in rng.sample(small, min(len(small), 2)):
+        edges.add(("start", cave))
+    for cave in rng.sample(small + big, min(len(small) + len(big), 2)):
+        edges.add((cave, "end"))
+    unique_edges = {tuple(sorted(edge)) for edge in edges if edge[0] != edge[1]}
+    return "".join(f"{a}-{b}\n" for a, b in sorted(unique_edges))
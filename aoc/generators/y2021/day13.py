@@ -0,0 +1,38 @@
+"""Transparent origami; `scale` is the number of dots.
+
+Dots are placed on the pixels of a random 40x6 code and then unfolded at random, so no dot ever lies on a
+fold line.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 800
+CODE_WIDTH: int = 40
+CODE_HEIGHT: int = 6
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    width, height = CODE_WIDTH, CODE_HEIGHT
+    folds = []
+    while width * height < scale * 4:
+        if len(folds) % 2 == 0:
+            folds.append(("x", width))
+            width = 2 * width + 1
+        else:
+            folds.append(("y", height))
+            height = 2 * height + 1
+    pixels = [(x, y) for x in range(CODE_WIDTH) for y in range(CODE_HEIGHT) if rng.random() < 0.4]
+    dots = set()
+    for _ in range(scale):
+        x, y = rng.choice(pixels)
+        for axis, line in folds:
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * line - x
+                else:
+                    y = 2 * line - y
+        dots.add((x, y))
+    lines = [f"{x},{y}\n" for x, y in sorted(dots)]
+    lines.append("\n")
+    lines.extend(f"fold along {axis}={line}\n" for axis, line in reversed(folds))
+    return "".join(lines)
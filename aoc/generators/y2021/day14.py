@@ -0,0 +1,16 @@
+"""Polymer template and insertion rules; `scale` is the length of the template.
+
+There is a rule for every pair of the ten element letters.
+"""
+
+import random
+from itertools import product
+
+DEFAULT_SCALE: int = 20
+ELEMENTS: str = "BCFHKNOPSV"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    template = "".join(rng.choices(ELEMENTS, k=scale))
+    rules = [f"{a}{b} -> {rng.choice(ELEMENTS)}\n" for a, b in product(ELEMENTS, repeat=2)]
+    return f"{template}\n\n" + "".join(rules)
@@ -0,0 +1,10 @@
+"""Chiton risk map; `scale` is the side of the square map."""
+
+import random
+
+DEFAULT_SCALE: int = 100
+EXPECTED_EXPONENT: float | None = 2.0
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join("".join(rng.choices("123456789", k=scale)) + "\n" for _ in range(scale))
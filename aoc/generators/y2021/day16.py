@@ -0,0 +1,50 @@
+"""BITS transmission; `scale` is the number of packets.
+
+Operator packets nest at most `MAX_DEPTH` levels deep and products stay small, so that the expression can be
+evaluated quickly however many packets there are.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 300
+MAX_DEPTH: int = 12
+MAX_SUBPACKETS: int = 2047
+MAX_SUBPACKETS_LENGTH: int = 2**15 - 1
+
+
+def literal(value: int, rng: random.Random) -> str:
+    groups = f"{value:b}"
+    groups = groups.zfill(-(-len(groups) // 4) * 4)
+    chunks = [groups[i : i + 4] for i in range(0, len(groups), 4)]
+    body = "".join(("1" if i < len(chunks) - 1 else "0") + chunk for i, chunk in enumerate(chunks))
+    return f"{rng.randrange(8):03b}100" + body
+
+
+def packet(budget: int, depth: int, rng: random.Random) -> str:
+    if budget <= 1 or depth >= MAX_DEPTH:
+        return literal(rng.randrange(16 if depth else 4096), rng)
+    type_id = rng.choice([0, 0, 1, 2, 3, 5, 6, 7] if budget <= 4 else [0, 0, 2, 3, 5, 6, 7])
+    if type_id >= 5:
+        subpackets_num = 2
+    elif type_id == 1:
+        subpackets_num = min(budget - 1, 3)
+    else:
+        subpackets_num = min(budget - 1, MAX_SUBPACKETS, rng.randint(1, max(1, (budget - 1) // 2)))
+    if type_id == 1:
+        subpackets = [literal(rng.randint(1, 9), rng) for _ in range(subpackets_num)]
+    else:
+        budgets = [1] * subpackets_num
+        for _ in range(budget - 1 - subpackets_num):
+            budgets[rng.randrange(subpackets_num)] += 1
+        subpackets = [packet(sub_budget, depth + 1, rng) for sub_budget in budgets]
+    body = "".join(subpackets)
+    header = f"{rng.randrange(8):03b}{type_id:03b}"
+    if len(body) <= MAX_SUBPACKETS_LENGTH and rng.random() < 0.5:
+        return header + "0" + f"{len(body):015b}" + body
+    return header + "1" + f"{len(subpackets):011b}" + body
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    bits = packet(scale, 0, rng)
+    bits += "0" * (-len(bits) % 4)
+    return f"{int(bits, base=2):0{len(bits) // 4}X}\n"
@@ -0,0 +1,14 @@
+"""Trick shot target area; `scale` is the distance of the target area from the launch point."""
+
+import random
+
+DEFAULT_SCALE: int = 150
+EXPECTED_EXPONENT: float | None = 3.0
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    x_min = rng.randint(max(1, scale // 2), max(1, scale))
+    x_max = x_min + rng.randint(max(1, scale // 10), max(1, scale // 4))
+    y_min = -rng.randint(max(2, scale // 2), max(2, scale))
+    y_max = y_min + rng.randint(1, max(1, -y_min // 4))
+    return f"target area: x={x_min}..{x_max}, y={y_min}..{y_max}\n"
@@ -0,0 +1,16 @@
+"""Snailfish homework; `scale` is the number of snailfish numbers."""
+
+import random
+
+DEFAULT_SCALE: int = 100
+MAX_DEPTH: int = 4
+
+
+def number(depth: int, rng: random.Random) -> str:
+    if depth == MAX_DEPTH or (depth > 0 and rng.random() < 0.3):
+        return str(rng.randint(0, 9))
+    return f"[{number(depth + 1, rng)},{number(depth + 1, rng)}]"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(number(0, rng) + "\n" for _ in range(scale))
@@ -0,0 +1,61 @@
+"""Beacon scanner reports; `scale` is the number of scanners.
+
+Scanners form a chain stretching along the x axis, in which every scanner shares 12 beacons with the previous
+one, so that all of them can be aligned. Each report lists every beacon within 1000 units on each axis, in a
+random order and in one of the 24 scanner orientations.
+"""
+
+import random
+from itertools import permutations, product
+
+DEFAULT_SCALE: int = 30
+EXPECTED_EXPONENT: float | None = 2.0
+RANGE: int = 1000
+SHARED_BEACONS: int = 12
+OWN_BEACONS: int = 2
+
+Vector = tuple[int, int, int]
+Orientation = tuple[tuple[int, ...], tuple[int, ...]]
+
+
+def orientations() -> list[Orientation]:
+    result = []
+    for axes in permutations(range(3)):
+        inversions = sum(axes[i] > axes[j] for i in range(3) for j in range(i + 1, 3))
+        for signs in product((1, -1), repeat=3):
+            if (-1) ** inversions * signs[0] * signs[1] * signs[2] == 1:
+                result.append((axes, signs))
+    return result
+
+
+def random_point(center: Vector, low: Vector, high: Vector, rng: random.Random) -> Vector:
+    x, y, z = (c + rng.randint(lo, hi) for c, lo, hi in zip(center, low, high))
+    return x, y, z
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    scanners: list[Vector] = [(0, 0, 0)]
+    beacons: set[Vector] = set()
+    for _ in range(scale - 1):
+        previous = scanners[-1]
+        dx = rng.randint(RANGE * 11 // 10, RANGE * 13 // 10)
+        dy, dz = rng.randint(-RANGE, RANGE), rng.randint(-RANGE, RANGE)
+        overlap_low = (dx - RANGE, max(-RANGE, dy - RANGE), max(-RANGE, dz - RANGE))
+        overlap_high = (RANGE, min(RANGE, dy + RANGE), min(RANGE, dz + RANGE))
+        beacons.update(random_point(previous, overlap_low, overlap_high, rng) for _ in range(SHARED_BEACONS))
+        scanners.append((previous[0] + dx, previous[1] + dy, previous[2] + dz))
+    for scanner in scanners:
+        beacons.update(random_point(scanner, (-RANGE,) * 3, (RANGE,) * 3, rng) for _ in range(OWN_BEACONS))
+    all_orientations = orientations()
+    reports = []
+    for index, scanner in enumerate(scanners):
+        axes, signs = rng.choice(all_orientations)
+        lines = []
+        for beacon in sorted(beacons):
+            relative = [b - s for b, s in zip(beacon, scanner)]
+            if all(abs(coord) <= RANGE for coord in relative):
+                rotated = [relative[axis] * sign for axis, sign in zip(axes, signs)]
+                lines.append(",".join(str(coord) for coord in rotated))
+        rng.shuffle(lines)
+        reports.append("\n".join([f"--- scanner {index} ---", *lines]))
+    return "\n\n".join(reports) + "\n"
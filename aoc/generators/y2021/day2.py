@@ -0,0 +1,10 @@
+"""Submarine commands; `scale` is the number of commands."""
+
+import random
+
+DEFAULT_SCALE: int = 1000
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    directions = rng.choices(["forward", "down", "up"], weights=[4, 4, 3], k=scale)
+    return "".join(f"{direction} {rng.randint(1, 9)}\n" for direction in directions)
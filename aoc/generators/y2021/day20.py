@@ -0,0 +1,18 @@
+"""Trench map; `scale` is the side of the square input image.
+
+When the algorithm lights up empty regions, it also turns fully lit regions dark again, so the infinite
+background only ever blinks.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 100
+EXPECTED_EXPONENT: float | None = 2.0
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    algorithm = rng.choices("#.", k=512)
+    if algorithm[0] == "#":
+        algorithm[-1] = "."
+    image = ["".join(rng.choices("#.", k=scale)) for _ in range(scale)]
+    return "".join(algorithm) + "\n\n" + "".join(f"{row}\n" for row in image)
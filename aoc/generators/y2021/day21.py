@@ -0,0 +1,13 @@
+"""Dirac dice starting positions.
+
+The puzzle input is always two starting positions, so `scale` is ignored.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 1
+EXPECTED_EXPONENT: float | None = 0.0
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(f"Player {player} starting position: {rng.randint(1, 10)}\n" for player in (1, 2))
@@ -0,0 +1,31 @@
+"""Reactor reboot steps; `scale` is the number of steps.
+
+The first 20 steps lie within the -50..50 initialization region, the rest are large cuboids.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 420
+INIT_STEPS: int = 20
+INIT_BORDER: int = 50
+BORDER: int = 100000
+
+
+def cuboid(border: int, max_size: int, rng: random.Random) -> str:
+    ranges = []
+    for axis in "xyz":
+        size = rng.randint(1, max_size)
+        begin = rng.randint(-border, border - size)
+        ranges.append(f"{axis}={begin}..{begin + size}")
+    return ",".join(ranges)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    steps = []
+    for index in range(scale):
+        state = "on" if index == 0 or rng.random() < 0.6 else "off"
+        if index < INIT_STEPS:
+            steps.append(f"{state} {cuboid(INIT_BORDER, INIT_BORDER, rng)}\n")
+        else:
+            steps.append(f"{state} {cuboid(BORDER, BORDER // 2, rng)}\n")
+    return "".join(steps)
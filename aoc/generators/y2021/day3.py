@@ -0,0 +1,27 @@
+"""Diagnostic report; `scale` is the number of binary numbers.
+
+The rating filters of part two keep the numbers sharing a growing prefix, and fail if all of them have the same
+next bit, since the least common bit then matches none. The numbers are built top-down like a trie, so every group
+of two or more numbers sharing a prefix splits both ways at its next bit, roughly evenly as random numbers would.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 1000
+
+
+def build(count: int, width: int, rng: random.Random) -> list[int]:
+    if count == 1:
+        return [rng.getrandbits(width)]
+    half = 2 ** (width - 1)
+    zeros = round(rng.gauss(count / 2, count**0.5 / 2))
+    # Both halves get a number, and neither more than its bits can tell apart.
+    zeros = min(max(zeros, 1, count - half), count - 1, half)
+    return build(zeros, width - 1, rng) + [half + number for number in build(count - zeros, width - 1, rng)]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    width = max(12, scale.bit_length() + 1)
+    numbers = build(scale, width, rng)
+    rng.shuffle(numbers)
+    return "".join(f"{number:0{width}b}\n" for number in numbers)
@@ -0,0 +1,20 @@
+"""Bingo subsystem; `scale` is the number of boards.
+
+All numbers are eventually drawn, so every board wins at some point.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 100
+NUMBERS_NUM: int = 100
+BOARD_SIZE: int = 5
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    draws = rng.sample(range(NUMBERS_NUM), NUMBERS_NUM)
+    blocks = [",".join(str(number) for number in draws)]
+    for _ in range(scale):
+        numbers = rng.sample(range(NUMBERS_NUM), BOARD_SIZE * BOARD_SIZE)
+        rows = [numbers[i : i + BOARD_SIZE] for i in range(0, len(numbers), BOARD_SIZE)]
+        blocks.append("\n".join(" ".join(f"{number:2}" for number in row) for row in rows))
+    return "\n\n".join(blocks) + "\n"
@@ -0,0 +1,26 @@
+"""Hydrothermal vents; `scale` is the number of vent lines.
+
+Lines are horizontal, vertical or diagonal at 45 degrees and stay inside a 1000x1000 floor.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 500
+FLOOR_SIZE: int = 1000
+MAX_LENGTH: int = 200
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(scale):
+        x1, y1 = rng.randrange(FLOOR_SIZE), rng.randrange(FLOOR_SIZE)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+        sign = rng.choice([-1, 1])
+        dx, dy = dx * sign, dy * sign
+        length = rng.randint(1, MAX_LENGTH)
+        if dx:
+            length = min(length, FLOOR_SIZE - 1 - x1 if dx > 0 else x1)
+        if dy:
+            length = min(length, FLOOR_SIZE - 1 - y1 if dy > 0 else y1)
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}\n")
+    return "".join(lines)
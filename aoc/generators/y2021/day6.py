@@ -0,0 +1,9 @@
+"""Lanternfish timers; `scale` is the number of fish."""
+
+import random
+
+DEFAULT_SCALE: int = 300
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return ",".join(str(timer) for timer in rng.choices(range(1, 6), k=scale)) + "\n"
@@ -0,0 +1,11 @@
+"""Crab positions; `scale` is the number of crabs."""
+
+import random
+
+DEFAULT_SCALE: int = 1000
+MAX_POSITION: int = 2000
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    positions = [min(MAX_POSITION, int(rng.expovariate(1 / 400))) for _ in range(scale)]
+    return ",".join(str(position) for position in positions) + "\n"
@@ -0,0 +1,26 @@
+"""Seven-segment displays; `scale` is the number of notes.
+
+Every note shows all ten digits and four output digits wired through its own random segment permutation.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 200
+SEGMENTS: str = "abcdefg"
+DIGITS: list[str] = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+def scramble(pattern: str, wiring: dict[str, str], rng: random.Random) -> str:
+    wires = [wiring[segment] for segment in pattern]
+    rng.shuffle(wires)
+    return "".join(wires)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    notes = []
+    for _ in range(scale):
+        wiring = dict(zip(SEGMENTS, rng.sample(SEGMENTS, len(SEGMENTS))))
+        patterns = [scramble(digit, wiring, rng) for digit in rng.sample(DIGITS, len(DIGITS))]
+        output = [scramble(DIGITS[digit], wiring, rng) for digit in rng.choices(range(10), k=4)]
+        notes.append(f"{' '.join(patterns)} | {' '.join(output)}\n")
+    return "".join(notes)
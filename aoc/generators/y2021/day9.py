@@ -0,0 +1,31 @@
+"""Smoke basin heightmap; `scale` is the side of the square map.
+
+Basins are rectangles walled off by 9s, at most 12 cells wide, like in the real puzzle inputs.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 100
+EXPECTED_EXPONENT: float | None = 2.0
+
+
+def split_points(size: int, rng: random.Random) -> set[int]:
+    points = set()
+    point = rng.randint(3, 12)
+    while point < size:
+        points.add(point)
+        point += rng.randint(3, 12)
+    return points
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    wall_rows = split_points(scale, rng)
+    rows = []
+    for y in range(scale):
+        if y in wall_rows or not rows:
+            wall_cols = split_points(scale, rng)
+        if y in wall_rows:
+            rows.append("9" * scale)
+        else:
+            rows.append("".join("9" if x in wall_cols else str(rng.randint(0, 8)) for x in range(scale)))
+    return "".join(f"{row}\n" for row in rows)
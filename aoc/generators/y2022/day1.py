@@ -0,0 +1,13 @@
+"""Calorie counting; `scale` is the number of elves."""
+
+import random
+
+DEFAULT_SCALE: int = 250
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    elves = []
+    for _ in range(scale):
+        items = [str(rng.randint(1000, 9999)) for _ in range(rng.randint(1, 15))]
+        elves.append("\n".join(items))
+    return "\n\n".join(elves) + "\n"
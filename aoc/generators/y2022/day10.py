@@ -0,0 +1,21 @@
+"""CPU program; `scale` is the number of cycles it takes to run."""
+
+import random
+
+DEFAULT_SCALE: int = 240
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    x = 1
+    cycles = 0
+    while cycles < scale:
+        if rng.random() < 0.3 or cycles == scale - 1:
+            lines.append("noop\n")
+            cycles += 1
+        else:
+            cycles += 2
+            value = rng.randint(max(-10, -x), min(10, 39 - x))
+            x += value
+            lines.append(f"addx {value}\n")
+    return "".join(lines)
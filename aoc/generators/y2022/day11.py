@@ -0,0 +1,29 @@
+"""Monkeys playing keep away; `scale` is the number of monkeys, at least three.
+
+Test divisors are distinct primes, and monkeys never throw items to themselves.
+"""
+
+import random
+
+DEFAULT_SCALE: int = 8
+PRIMES: list[int] = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    scale = max(3, scale)
+    divisors = rng.sample(PRIMES, min(scale, len(PRIMES)))
+    divisors += rng.choices(PRIMES, k=scale - len(divisors))
+    monkeys = []
+    for index, divisor in enumerate(divisors):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        op = rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}", "old * old"])
+        true, false = rng.sample([i for i in range(scale) if i != index], 2)
+        monkeys.append(
+            f"Monkey {index}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {op}\n"
+            f"  Test: divisible by {divisor}\n"
+            f"    If true: throw to monkey {true}\n"
+            f"    If false: throw to monkey {false}\n"
+        )
+    return "\n".join(monkeys)
@@ -0,0 +1,33 @@
+"""Heightmap; `scale` is the width of the map, which is a quarter as tall.
+
+A path from S to E climbing one level at a time is carved through otherwise random terrain, so part one
+always has an answer.
+"""
+
+import random
+import string
+
+DEFAULT_SCALE: int = 160
+EXPECTED_EXPONENT: float | None = 2.0
+MIN_SCALE: int = 26
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    width = max(MIN_SCALE, scale)
+    height = max(5, width // 4)
+    grid = [rng.choices(string.ascii_lowercase[:12], k=width) for _ in range(height)]
+    x, y = 0, rng.randrange(height)
+    path = [(x, y)]
+    while x < width - 1:
+        if rng.random() < 0.3:
+            y = min(height - 1, max(0, y + rng.choice([-1, 1])))
+            if (x, y) != path[-1]:
+                path.append((x, y))
+        x += 1
+        path.append((x, y))
+    for index, (x, y) in enumerate(path):
+        grid[y][x] = string.ascii_lowercase[index * 25 // (len(path) - 1)]
+    start, end = path[0], path[-1]
+    grid[start[1]][start[0]] = "S"
+    grid[end[1]][end[0]] = "E"
+    return "".join("".join(row) + "\n" for row in grid)
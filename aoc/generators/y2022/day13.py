@@ -0,0 +1,20 @@
+"""Distress signal packets; `scale` is the number of packet pairs."""
+
+import random
+
+DEFAULT_SCALE: int = 150
+MAX_DEPTH: int = 4
+
+
+def packet(depth: int, rng: random.Random) -> str:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < MAX_DEPTH and rng.random() < 0.3:
+            items.append(packet(depth + 1, rng))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return f"[{','.join(items)}]"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "\n".join(f"{packet(0, rng)}\n{packet(0, rng)}\n" for _ in range(scale))
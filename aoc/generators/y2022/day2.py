@@ -0,0 +1,9 @@
+"""Rock paper scissors strategy guide; `scale` is the number of rounds."""
+
+import random
+
+DEFAULT_SCALE: int = 2500
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(scale))
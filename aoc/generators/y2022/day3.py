@@ -0,0 +1,27 @@
+"""Rucksacks; `scale` is the number of rucksacks, rounded up to whole groups of three.
+
+Every rucksack has exactly one item type in both compartments and every group of three elves shares exactly
+one badge item type.
+"""
+
+import random
+import string
+
+DEFAULT_SCALE: int = 300
+ITEMS: str = string.ascii_letters
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    rucksacks = []
+    for _ in range(-(-scale // 3)):
+        badge, *rest = rng.sample(ITEMS, len(ITEMS))
+        for elf in range(3):
+            own = rest[elf * 17 : (elf + 1) * 17]
+            shared, left_pool, right_pool = own[0], own[1:9], own[9:17]
+            size = rng.randint(8, 16)
+            left = [shared, badge, *rng.choices(left_pool, k=size - 2)]
+            right = [shared, *rng.choices(right_pool, k=size - 1)]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            rucksacks.append("".join(left + right) + "\n")
+    return "".join(rucksacks)
@@ -0,0 +1,14 @@
+"""Camp cleanup section assignments; `scale` is the number of pairs."""
+
+import random
+
+DEFAULT_SCALE: int = 1000
+
+
+def section_range(rng: random.Random) -> str:
+    start = rng.randint(1, 99)
+    return f"{start}-{rng.randint(start, 99)}"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(f"{section_range(rng)},{section_range(rng)}\n" for _ in range(scale))
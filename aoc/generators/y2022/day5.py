@@ -0,0 +1,29 @@
+"""Supply stacks and rearrangement procedure; `scale` is the number of procedure steps.
+
+Moves never empty a stack, so every stack has a crate on top at the end.
+"""
+
+import random
+import string
+
+DEFAULT_SCALE: int = 500
+STACKS_NUM: int = 9
+INITIAL_HEIGHT: int = 8
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    heights = [rng.randint(2, INITIAL_HEIGHT) for _ in range(STACKS_NUM)]
+    rows = []
+    for level in reversed(range(max(heights))):
+        crates = [f"[{rng.choice(string.ascii_uppercase)}]" if height > level else "   " for height in heights]
+        rows.append(" ".join(crates) + " \n")
+    rows.append(" ".join(f" {i} " for i in range(1, STACKS_NUM + 1)) + " \n")
+    steps = []
+    for _ in range(scale):
+        src = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        dest = rng.choice([i for i in range(STACKS_NUM) if i != src])
+        quantity = rng.randint(1, heights[src] - 1)
+        heights[src] -= quantity
+        heights[dest] += quantity
+        steps.append(f"move {quantity} from {src + 1} to {dest + 1}\n")
+    return "".join(rows) + "\n" + "".join(steps)
@@ -0,0 +1,17 @@
+"""Datastream buffer; `scale` is the length of the buffer.
+
+The buffer only uses three letters until its last 14 characters, which are all different, so both markers
+are found at the very end.
+"""
+
+import random
+import string
+
+DEFAULT_SCALE: int = 4096
+MARKER_SIZE: int = 14
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    prefix = rng.choices("abc", k=max(0, scale - MARKER_SIZE))
+    marker = rng.sample(string.ascii_lowercase, MARKER_SIZE)
+    return "".join(prefix + marker) + "\n"
@@ -0,0 +1,53 @@
+"""Terminal output of browsing a filesystem; `scale` is the approximate number of lines.
+
+Directories nest at most `MAX_DEPTH` levels deep. Once a subtree is fully listed, the log returns to the root
+and lists another new directory there, until there are enough lines. File sizes are spread so that the disk is
+between 41 and 69 million bytes full, which always leaves a directory to delete in part two.
+"""
+
+import random
+import string
+
+DEFAULT_SCALE: int = 1000
+MAX_DEPTH: int = 12
+TOTAL_DISK_SPACE: int = 70000000
+
+
+def names(count: int, rng: random.Random) -> list[str]:
+    chosen: set[str] = set()
+    while len(chosen) < count:
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+        chosen.add(name if rng.random() < 0.7 else f"{name}.{rng.choice(['txt', 'dat', 'log'])}")
+    result = sorted(chosen)
+    rng.shuffle(result)
+    return result
+
+
+def browse(lines: list[str | tuple[str]], scale: int, depth: int, rng: random.Random) -> None:
+    dirs_num = rng.randint(0, 3) if depth < MAX_DEPTH and len(lines) < scale else 0
+    files_num = rng.randint(1, 5)
+    entries = names(dirs_num + files_num, rng)
+    subdirs, files = entries[:dirs_num], entries[dirs_num:]
+    lines.append("$ ls")
+    lines.extend(f"dir {name}" for name in subdirs)
+    lines.extend((name,) for name in files)
+    for name in subdirs:
+        lines.append(f"$ cd {name}")
+        browse(lines, scale, depth + 1, rng)
+        lines.append("$ cd ..")
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines: list[str | tuple[str]] = ["$ cd /"]
+    browse(lines, scale, 0, rng)
+    root_dirs = 0
+    while len(lines) < scale:
+        name = f"root{root_dirs}"
+        root_dirs += 1
+        lines.extend(["$ cd /", "$ ls", f"dir {name}", f"$ cd {name}"])
+        browse(lines, scale, 1, rng)
+    weights = [rng.random() for line in lines if isinstance(line, tuple)]
+    used_space = rng.randint(41000000, TOTAL_DISK_SPACE - 1000000) - len(weights)
+    total_weight = sum(weights)
+    sizes = iter([1 + int(weight * used_space / total_weight) for weight in weights])
+    return "".join(f"{next(sizes)} {line[0]}\n" if isinstance(line, tuple) else f"{line}\n" for line in lines)
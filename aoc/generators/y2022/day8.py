@@ -0,0 +1,10 @@
+"""Tree heights; `scale` is the side of the square forest."""
+
+import random
+
+DEFAULT_SCALE: int = 99
+EXPECTED_EXPONENT: float | None = 2.0
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join("".join(rng.choices("0123456789", k=scale)) + "\n" for _ in range(scale))
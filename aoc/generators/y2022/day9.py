@@ -0,0 +1,9 @@
+"""Rope head motions; `scale` is the number of motions."""
+
+import random
+
+DEFAULT_SCALE: int = 2000
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(f"{rng.choice('UDLR')} {rng.randint(1, 20)}\n" for _ in range(scale))
@@ -0,0 +1,27 @@
+"""Calibration document; `scale` is the number of lines.
+
+Every line contains at least one digit, and spelled-out digits may overlap like `eightwo`.
+"""
+
+import random
+import string
+
+DEFAULT_SCALE: int = 1000
+WORDS: list[str] = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(scale):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                tokens.append(str(rng.randint(1, 9)))
+            elif kind < 0.6:
+                tokens.append(rng.choice(WORDS))
+            else:
+                tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens) + "\n")
+    return "".join(lines)
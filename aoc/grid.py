@@ -0,0 +1,153 @@
+"""Flat rectangular grids of small integers.
+
+Cells are stored row by row in a bytearray and addressed by a single integer index, `y * width + x`, so walking a
+grid allocates no coordinate objects. The 4- and 8-neighbor indices of every cell are kept in one flat `array("i")`
+with a fixed number of slots per cell, built column by column in C the first time a grid is asked for them and
+cached on that grid, so the table is freed along with it.
+"""
+
+from array import array
+from typing import Any, Iterable, Iterator, Sequence
+
+# Translation table turning the ASCII digits of a puzzle input into their values.
+DIGITS: bytes = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# Slot value of the neighbors beyond the edges of the grid.
+MISSING: int = -1
+
+OFFSETS4: tuple[tuple[int, int], ...] = ((0, -1), (-1, 0), (1, 0), (0, 1))
+OFFSETS8: tuple[tuple[int, int], ...] = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+
+
+class Neighbors:
+    """Neighbor indices of every cell of a grid, `stride` slots per cell in row-major order of their positions.
+
+    `table[index * stride + slot]` is the neighbor of cell `index` at `OFFSETS4[slot]` or `OFFSETS8[slot]`, or
+    `MISSING`. Indexing the table by cell returns the neighbors which exist, which makes it a graph for
+    `aoc.search`; hot loops can read `table` directly instead.
+    """
+
+    __slots__ = ("table", "stride")
+
+    def __init__(self, width: int, height: int, diagonal: bool = False) -> None:
+        offsets = OFFSETS8 if diagonal else OFFSETS4
+        size = width * height
+        self.stride = len(offsets)
+        self.table = array("i", [MISSING]) * (size * self.stride)
+        # Every column is a slice of the same run of indices, shifted by the offset of its neighbor.
+        margin = width + 1
+        indices = array("i", range(-margin, size + margin))
+        for slot, (dx, dy) in enumerate(offsets):
+            shift = dy * width + dx
+            column = indices[margin + shift : margin + shift + size]
+            missing_row = array("i", [MISSING]) * width
+            if dy < 0:
+                column[:width] = missing_row
+            elif dy > 0:
+                column[size - width :] = missing_row
+            missing_column = array("i", [MISSING]) * height
+            if dx < 0:
+                column[::width] = missing_column
+            elif dx > 0:
+                column[width - 1 :: width] = missing_column
+            self.table[slot :: self.stride] = column
+
+    def __len__(self) -> int:
+        return len(self.table) // self.stride
+
+    def __getitem__(self, index: int) -> Sequence[int]:
+        start = index * self.stride
+        neighbors = self.table[start : start + self.stride]
+        # Only the cells on the edges miss some neighbors, and they're the only ones paying for a filtered copy.
+        if MISSING in neighbors:
+            return [neighbor for neighbor in neighbors if neighbor != MISSING]
+        return neighbors
+
+    def __iter__(self) -> Iterator[Sequence[int]]:
+        # Zipping `stride` references to one iterator cuts the table into the tuples of neighbors of each cell in C.
+        for neighbors in zip(*[iter(self.table)] * self.stride):
+            yield [neighbor for neighbor in neighbors if neighbor != MISSING] if MISSING in neighbors else neighbors
+
+
+class Grid:
+    __slots__ = ("width", "height", "cells", "_neighbors4", "_neighbors8")
+
+    def __init__(self, width: int, height: int, cells: bytearray | None = None) -> None:
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else bytearray(width * height)
+        if len(self.cells) != width * height:
+            raise ValueError(f"{len(self.cells)} cells don't make a {width}x{height} grid")
+        self._neighbors4: Neighbors | None = None
+        self._neighbors8: Neighbors | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The neighbor tables are rebuilt on demand rather than pickled into parse caches and checkpoints.
+        return {"width": self.width, "height": self.height, "cells": self.cells}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state["width"], state["height"], state["cells"])  # type: ignore[misc]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[int]]) -> "Grid":
+        rows = [bytes(row) for row in rows]
+        return cls(len(rows[0]), len(rows), bytearray(b"".join(rows)))
+
+    @classmethod
+    def from_text(cls, text: str, table: bytes | None = None) -> "Grid":
+        """Build a grid from lines of characters, whose cells are their byte values mapped through `table`."""
+        lines = [line.strip().encode() for line in text.splitlines() if line.strip()]
+        if not lines:
+            raise ValueError("No grid in an empty input")
+        cells = bytearray(b"".join(lines))
+        if table is DIGITS and (others := cells.translate(None, b"0123456789")):
+            raise ValueError(f"Grid of digits has other characters: {sorted(set(others.decode(errors='replace')))}")
+        if table is not None:
+            cells = cells.translate(table)
+        return cls(len(lines[0]), len(lines), cells)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coords(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def copy(self) -> "Grid":
+        return Grid(self.width, self.height, self.cells[:])
+
+    def pad(self, border: int, value: int = 0) -> "Grid":
+        width = self.width + 2 * border
+        side = bytes([value]) * border
+        cells = bytearray(bytes([value]) * width * border)
+        for y in range(self.height):
+            cells += side + self.cells[y * self.width : (y + 1) * self.width] + side
+        cells += bytes([value]) * width * border
+        return Grid(width, self.height + 2 * border, cells)
+
+    def rows(self) -> list[range]:
+        return [range(y * self.width, (y + 1) * self.width) for y in range(self.height)]
+
+    def columns(self) -> list[range]:
+        return [range(x, len(self.cells), self.width) for x in range(self.width)]
+
+    @property
+    def neighbors4(self) -> Neighbors:
+        if self._neighbors4 is None:
+            self._neighbors4 = Neighbors(self.width, self.height)
+        return self._neighbors4
+
+    @property
+    def neighbors8(self) -> Neighbors:
+        if self._neighbors8 is None:
+            self._neighbors8 = Neighbors(self.width, self.height, diagonal=True)
+        return self._neighbors8
@@ -0,0 +1,288 @@
+"""Timings of every recorded run and benchmark, kept in a local SQLite database to follow them across commits.
+
+`run --history` and `bench --history` append a row to `runs`, tagged with the git commit of the checkout, whether
+it had uncommitted changes, the Python version and the machine, and a row to `timings` per day and phase: the
+time of a run, or the median of a benchmark with its number of samples, and the peak memory when the run traced
+it with `--memory`.
+
+Queries only compare timings taken on the same machine, the current one unless asked otherwise. Those ordered
+by commit (`trend` and `regressions`) follow the git history of the checkout and leave out runs of dirty trees
+and runs tracing memory, whose times don't stand for their commit or are inflated by tracing. Several timings of
+a phase at the same commit are summarised by their median.
+"""
+
+import platform
+import sqlite3
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from aoc.bench import NOISE_FLOOR, PhaseStats, Regression, bench_key
+from aoc.days import ROOT, Day
+from aoc.defaults import DEFAULT_HISTORY
+from aoc.runner import PARTS, SOLVE, DayResult
+
+# Kinds of runs, the last one having times slowed down by tracing.
+RUN: str = "run"
+BENCH: str = "bench"
+MEMORY: str = "memory"
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    git_commit TEXT,
+    dirty INTEGER NOT NULL,
+    python TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    platform TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    samples INTEGER NOT NULL,
+    peak_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS timings_by_phase ON timings (year, day, phase);
+"""
+
+
+class RunInfo(NamedTuple):
+    git_commit: str | None
+    dirty: bool
+    python: str
+    machine: str
+    platform: str
+
+
+class Timing(NamedTuple):
+    day: Day
+    phase: str
+    seconds: float
+    samples: int = 1
+    peak_bytes: int | None = None
+
+
+class Measurement(NamedTuple):
+    day: Day
+    phase: str
+    seconds: float
+    peak_bytes: int | None
+    git_commit: str | None
+    recorded_at: float
+
+
+class TrendPoint(NamedTuple):
+    git_commit: str
+    subject: str
+    seconds: float
+    timings: int
+
+
+def git(*args: str) -> str | None:
+    try:
+        child = subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    return child.stdout.strip() if child.returncode == 0 else None
+
+
+def run_info() -> RunInfo:
+    commit = git("rev-parse", "HEAD")
+    dirty = commit is not None and bool(git("status", "--porcelain", "--untracked-files=no"))
+    python = f"{platform.python_implementation()} {platform.python_version()}"
+    return RunInfo(commit, dirty, python, platform.node(), platform.platform())
+
+
+def commits(revisions: str, limit: int | None = None) -> list[str]:
+    """List the commits reachable from `revisions`, newest first, following first parents only."""
+    args = ["rev-list", "--first-parent", revisions]
+    if limit is not None:
+        args.append(f"--max-count={limit}")
+    output = git(*args)
+    if output is None:
+        raise ValueError(f"Unknown revision {revisions}")
+    return output.split()
+
+
+def day_timings(result: DayResult, peaks: dict[str, int] | None = None) -> list[Timing]:
+    # Cached and shared phases took no time of their own, and failed ones took an unrelated time.
+    return [
+        Timing(result.day, phase.name, phase.seconds, peak_bytes=(peaks or {}).get(phase.name))
+        for phase in result.phases
+        if phase.error is None and not phase.cached and not phase.shared
+    ]
+
+
+def bench_timings(day: Day, stats: dict[str, PhaseStats]) -> list[Timing]:
+    return [Timing(day, phase, entry.median, entry.samples) for phase, entry in stats.items()]
+
+
+class History:
+    def __init__(self, path: Path = DEFAULT_HISTORY, machine: str | None = None) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self.machine = machine if machine is not None else platform.node()
+
+    def __enter__(self) -> "History":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def record(self, kind: str, timings: list[Timing], info: RunInfo | None = None) -> int:
+        """Store the timings of one run in a single transaction and return the id of the run."""
+        info = info or run_info()
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (recorded_at, kind, git_commit, dirty, python, machine, platform)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), kind, info.git_commit, info.dirty, info.python, info.machine, info.platform),
+            )
+            run_id = cursor.lastrowid
+            assert run_id is not None
+            rows = [(run_id, timing.day.year, timing.day.day, *timing[1:]) for timing in timings]
+            self.connection.executemany(
+                "INSERT INTO timings (run_id, year, day, phase, seconds, samples, peak_bytes)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return run_id
+
+    def slowest(
+        self,
+        limit: int = 10,
+        days: list[Day] | None = None,
+        phases: tuple[str, ...] = (*PARTS, SOLVE),
+        memory: bool = False,
+    ) -> list[Measurement]:
+        """Rank the latest timing of every phase by time, or by peak memory among runs which traced it."""
+        condition = "t.peak_bytes IS NOT NULL" if memory else "r.kind != ?"
+        rows = self.connection.execute(
+            f"""
+            SELECT year, day, phase, seconds, peak_bytes, git_commit, recorded_at FROM (
+                SELECT t.*, r.git_commit, r.recorded_at,
+                    ROW_NUMBER() OVER (PARTITION BY t.year, t.day, t.phase ORDER BY r.id DESC) AS newest
+                FROM timings t JOIN runs r ON r.id = t.run_id
+                WHERE r.machine = ? AND {condition} AND t.phase IN ({", ".join("?" * len(phases))})
+            )
+            WHERE newest = 1
+            ORDER BY {"peak_bytes" if memory else "seconds"} DESC
+            """,
+            (self.machine, *(() if memory else (MEMORY,)), *phases),
+        )
+        selected = set(days) if days is not None else None
+        measurements = [
+            Measurement(Day(year, day), phase, seconds, peak_bytes, commit, recorded_at)
+            for year, day, phase, seconds, peak_bytes, commit, recorded_at in rows
+            if selected is None or Day(year, day) in selected
+        ]
+        return measurements[:limit]
+
+    def phases(self, day: Day) -> list[str]:
+        rows = self.connection.execute(
+            "SELECT DISTINCT t.phase FROM timings t JOIN runs r ON r.id = t.run_id"
+            " WHERE r.machine = ? AND t.year = ? AND t.day = ?",
+            (self.machine, day.year, day.day),
+        )
+        found = {phase for (phase,) in rows}
+        return [phase for phase in ("parse", SOLVE, *PARTS) if phase in found]
+
+    def by_commit(self, day: Day | None = None, phase: str | None = None) -> dict[tuple[str, str, str], list[float]]:
+        """Group the timings of clean, untraced runs by commit, bench key and phase."""
+        query = (
+            "SELECT r.git_commit, t.year, t.day, t.phase, t.seconds FROM timings t JOIN runs r ON r.id = t.run_id"
+            " WHERE r.machine = ? AND r.kind != ? AND NOT r.dirty AND r.git_commit IS NOT NULL"
+        )
+        params: list[object] = [self.machine, MEMORY]
+        if day is not None:
+            query += " AND t.year = ? AND t.day = ?"
+            params += [day.year, day.day]
+        if phase is not None:
+            query += " AND t.phase = ?"
+            params.append(phase)
+        grouped: dict[tuple[str, str, str], list[float]] = {}
+        for commit, year, day_num, phase_name, seconds in self.connection.execute(query, params):
+            grouped.setdefault((commit, bench_key(Day(year, day_num)), phase_name), []).append(seconds)
+        return grouped
+
+
+def trend(history: History, day: Day, phase: str, last: int = 30) -> list[TrendPoint]:
+    """Return the timings of a phase at each of the `last` commits up to HEAD which have some, oldest first."""
+    grouped = history.by_commit(day, phase)
+    points = []
+    for commit in reversed(commits("HEAD", last)):
+        if (times := grouped.get((commit, bench_key(day), phase))) is not None:
+            subject = git("log", "-1", "--format=%s", commit) or ""
+            points.append(TrendPoint(commit, subject, statistics.median(times), len(times)))
+    return points
+
+
+def regressions(history: History, since: str, threshold: float = 10.0) -> list[Regression]:
+    """Compare every phase at the newest commit measuring it since `since` with its newest timing up to `since`.
+
+    Regressions are ordered from the largest slowdown in percent, using the same noise floor as `bench`.
+    """
+    grouped = history.by_commit()
+    keys = {(key, phase) for _, key, phase in grouped}
+    before = commits(since)
+    after = commits(f"{since}..HEAD")
+    found = []
+    for key, phase in keys:
+        base = next((grouped[commit, key, phase] for commit in before if (commit, key, phase) in grouped), None)
+        current = next((grouped[commit, key, phase] for commit in after if (commit, key, phase) in grouped), None)
+        if base is None or current is None:
+            continue
+        base_time, current_time = statistics.median(base), statistics.median(current)
+        if current_time - base_time > max(NOISE_FLOOR, base_time * threshold / 100):
+            found.append(Regression(key, phase, base_time, current_time))
+    return sorted(found, key=lambda regression: -regression.percent)
+
+
+def format_slowest(measurements: list[Measurement], memory: bool = False) -> str:
+    from aoc.memory import format_bytes
+
+    lines = []
+    for rank, entry in enumerate(measurements, 1):
+        value = format_bytes(entry.peak_bytes or 0) if memory else f"{entry.seconds * 1000:12.3f} ms"
+        commit = (entry.git_commit or "no commit")[:10]
+        recorded = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.recorded_at))
+        lines.append(f"{rank:3}. {str(entry.day):<12} {entry.phase:<9} {value:>13}  {commit} {recorded}")
+    return "\n".join(lines) if lines else "No timings recorded"
+
+
+def format_trend(day: Day, phase: str, points: list[TrendPoint], last: int) -> str:
+    lines = [f"{day} {phase}, {len(points)} of the last {last} commit(s) measured"]
+    previous = None
+    for point in points:
+        line = f"  {point.git_commit[:10]} {point.seconds * 1000:12.3f} ms"
+        if previous is not None and previous.seconds > 0:
+            line += f" {(point.seconds / previous.seconds - 1) * 100:+7.1f}%"
+        else:
+            line += " " * 9
+        lines.append(f"{line}  x{point.timings:<3} {point.subject[:60]}")
+        previous = point
+    return "\n".join(lines)
+
+
+def format_regressions(found: list[Regression], since: str) -> str:
+    if not found:
+        return f"No regressions since {since}"
+    lines = [f"Regressions since {since}:"]
+    lines.extend(
+        f"  {regression.key:<8} {regression.phase:<9} {regression.baseline * 1000:10.3f} ms"
+        f" -> {regression.current * 1000:10.3f} ms ({regression.percent:+.1f}%)"
+        for regression in found
+    )
+    return "\n".join(lines)
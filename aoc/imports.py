@@ -0,0 +1,61 @@
+"""Start-up cost of a command, measured with `python -X importtime`.
+
+`profile_imports` runs an `aoc` command again in a child interpreter started with `-X importtime`, which writes
+to stderr a line per imported module with its own and its cumulative import time in microseconds, indented by
+nesting depth. Day modules are loaded from their paths rather than imported, so they get no line of their own:
+the modules a day imports appear as top-level imports.
+"""
+
+import re
+import subprocess
+import sys
+from typing import NamedTuple
+
+TOP_IMPORTS: int = 15
+
+_IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(stderr: str) -> tuple[list[ImportTime], str]:
+    """Split the stderr of an `-X importtime` run into its import times and the rest of the output."""
+    times = []
+    rest = []
+    for line in stderr.splitlines(keepends=True):
+        if match := _IMPORT_TIME_LINE.match(line):
+            self_us, cumulative_us, indent, module = match.groups()
+            times.append(ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2))
+        elif not line.startswith("import time:"):
+            rest.append(line)
+    return times, "".join(rest)
+
+
+def profile_imports(argv: list[str]) -> tuple[list[ImportTime], int]:
+    """Run `python -m aoc <argv>` with import times traced, passing its output through, and return them."""
+    child = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "aoc", *argv], stderr=subprocess.PIPE, text=True, check=False
+    )
+    times, rest = parse_import_times(child.stderr)
+    sys.stderr.write(rest)
+    return times, child.returncode
+
+
+def total_seconds(times: list[ImportTime]) -> float:
+    return sum(entry.cumulative_us for entry in times if entry.depth == 0) / 1e6
+
+
+def format_import_times(times: list[ImportTime], top: int = TOP_IMPORTS) -> str:
+    top_level = sorted((entry for entry in times if entry.depth == 0), key=lambda entry: -entry.cumulative_us)
+    lines = [f"Import time: {total_seconds(times) * 1000:.3f} ms across {len(times)} module(s)"]
+    lines.append("Slowest top-level imports (cumulative):")
+    lines.extend(f"  {entry.cumulative_us / 1000:9.3f} ms  {entry.module}" for entry in top_level[:top])
+    lines.append("Slowest modules (own time):")
+    by_self = sorted(times, key=lambda entry: -entry.self_us)
+    lines.extend(f"  {entry.self_us / 1000:9.3f} ms  {entry.module}" for entry in by_self[:top])
+    return "\n".join(lines)
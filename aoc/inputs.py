@@ -0,0 +1,64 @@
+"""Zero-copy access to puzzle input files.
+
+`map_input` memory-maps an input file and returns a read-only `memoryview` of it, so the file is neither read into
+a bytes object nor decoded into a string: pages are loaded on demand and the mapping lives as long as a view of
+it does. `lines`, `blocks` and `strip` cut views into views of the same memory, and parsers turn them into numbers
+directly, since `int`, `re` and `aoc.ints.ints` all accept bytes-like objects.
+
+Parsers using this layer accept both `str`, which the API and `run_text` pass, and buffers; a `str` is encoded
+once before it's split.
+"""
+
+import mmap
+import os
+import re
+from typing import Iterator
+
+from aoc.api import Buffer
+
+_WHITESPACE = b" \t\r\n\v\f"
+_LINE_SEPARATOR = re.compile(rb"\n")
+_BLOCK_SEPARATOR = re.compile(rb"\n\n")
+
+
+def map_input(path: str | os.PathLike) -> memoryview:
+    with open(path, "rb") as fd:
+        # Empty files can't be mapped. Closing the file doesn't unmap it, the mapping holds its own descriptor.
+        if os.fstat(fd.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def view(data: Buffer) -> memoryview:
+    return memoryview(data.encode() if isinstance(data, str) else data)
+
+
+def strip(data: Buffer) -> memoryview:
+    """Return a view of `data` without its leading and trailing ASCII whitespace."""
+    data = view(data)
+    start, end = 0, len(data)
+    while start < end and data[start] in _WHITESPACE:
+        start += 1
+    while end > start and data[end - 1] in _WHITESPACE:
+        end -= 1
+    return data[start:end]
+
+
+def split(data: Buffer, separator: re.Pattern[bytes]) -> Iterator[memoryview]:
+    """Yield views of the pieces of `data` between the matches of `separator`, except for an empty last piece."""
+    data = view(data)
+    start = 0
+    for match in separator.finditer(data):
+        yield data[start : match.start()]
+        start = match.end()
+    if start < len(data):
+        yield data[start:]
+
+
+def lines(data: Buffer) -> Iterator[memoryview]:
+    return split(data, _LINE_SEPARATOR)
+
+
+def blocks(data: Buffer) -> Iterator[memoryview]:
+    """Yield the blocks of lines separated by blank lines, with their trailing newlines stripped."""
+    return split(strip(data), _BLOCK_SEPARATOR)
@@ -0,0 +1,46 @@
+"""Bulk extraction of the integers in a puzzle input.
+
+The whole buffer is tokenized by a few passes of bytes methods, which run in C: `translate` blanks every byte
+but digits and minus signs, minus signs not followed by a digit are dropped, and `split` cuts out the integers.
+`map` then converts them with `int` and packs them into an `array("q")`, without matching a regex or running a
+Python loop per integer. `records` regroups them into fixed-width tuples, and `to_numpy` views them as a NumPy
+array without copying, for the tools that have NumPy installed.
+
+Text is tokenized as its UTF-8 encoding, so only ASCII digits count as digits, as they do in puzzle inputs.
+"""
+
+from array import array
+from typing import TYPE_CHECKING, Any, Iterator
+
+from aoc.api import Buffer
+
+if TYPE_CHECKING:
+    import numpy
+
+_SIGNED_TABLE = bytes(byte if byte in b"-0123456789" else ord(" ") for byte in range(256))
+_UNSIGNED_TABLE = bytes(byte if byte in b"0123456789" else ord(" ") for byte in range(256))
+
+
+def ints(data: Buffer, signed: bool = True) -> array:
+    """Return every integer in `data`, with a leading `-` making it negative unless `signed` is False."""
+    raw = data.encode() if isinstance(data, str) else bytes(data)
+    if not signed:
+        return array("q", map(int, raw.translate(_UNSIGNED_TABLE).split()))
+    # Once every minus sign starts a token, those followed by a blank rather than a digit are signs of nothing.
+    tokens = (raw.translate(_SIGNED_TABLE).replace(b"-", b" -") + b" ").replace(b"- ", b" ")
+    return array("q", map(int, tokens.split()))
+
+
+def records(values: array, width: int) -> Iterator[tuple[int, ...]]:
+    """Group `values` into tuples of `width` integers."""
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers can't be split into records of {width}")
+    return zip(*[iter(values)] * width)
+
+
+def to_numpy(values: array, width: int | None = None) -> "numpy.ndarray[Any, Any]":
+    """View `values` as an int64 NumPy array, of shape (n, width) when `width` is given."""
+    import numpy
+
+    result = numpy.frombuffer(values, dtype=numpy.int64)
+    return result.reshape(-1, width) if width is not None else result
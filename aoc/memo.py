@@ -0,0 +1,92 @@
+"""Bounded, instrumented memoization shared by the solutions.
+
+`memoize` is `functools.lru_cache` with a size bound by default, whose caches are registered so that their hit,
+miss and size counters can be reported. Solutions call `clear` on their caches once a solve is done: it frees
+the entries and folds the counters into per-function totals, which `stats` reports along with the live caches.
+"""
+
+import functools
+import weakref
+from typing import Any, Callable, NamedTuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_MAXSIZE: int = 2**16
+
+
+class CacheStats(NamedTuple):
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    maxsize: int | None = None
+    clears: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def merge(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            self.hits + other.hits,
+            self.misses + other.misses,
+            self.size + other.size,
+            other.maxsize,
+            self.clears + other.clears,
+        )
+
+
+_live: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_totals: dict[str, CacheStats] = {}
+
+
+def cache_name(fn: Callable[..., Any]) -> str:
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+
+def memoize(maxsize: int | None = DEFAULT_MAXSIZE) -> Callable[[F], F]:
+    """Cache the results of a function with hashable arguments, evicting the least recently used beyond `maxsize`."""
+
+    def decorator(fn: F) -> F:
+        cached = functools.lru_cache(maxsize=maxsize)(fn)
+        _live.add(cached)
+        return cached  # type: ignore[return-value]
+
+    return decorator
+
+
+def current(fn: Any) -> CacheStats:
+    info = fn.cache_info()
+    return CacheStats(info.hits, info.misses, info.currsize, info.maxsize)
+
+
+def clear(fn: Any) -> None:
+    """Empty the cache of a memoized function, keeping its counters in the totals."""
+    name = cache_name(fn)
+    _totals[name] = _totals.get(name, CacheStats()).merge(current(fn)._replace(size=0, clears=1))
+    fn.cache_clear()
+
+
+def stats() -> dict[str, CacheStats]:
+    """Return the counters of every memoized function, from its cleared and its live caches."""
+    result = dict(_totals)
+    for fn in list(_live):
+        name = cache_name(fn)
+        result[name] = result.get(name, CacheStats()).merge(current(fn))
+    return dict(sorted(result.items()))
+
+
+def reset() -> None:
+    """Forget the totals of cleared caches."""
+    _totals.clear()
+
+
+def format_stats(cache_stats: dict[str, CacheStats]) -> str:
+    lines = []
+    for name, entry in cache_stats.items():
+        bound = "unbounded" if entry.maxsize is None else f"max {entry.maxsize}"
+        lines.append(
+            f"  {name}: {entry.hits} hits, {entry.misses} misses ({entry.hit_rate:.1%} hit rate),"
+            f" {entry.size} entries ({bound}), cleared {entry.clears} time(s)"
+        )
+    return "\n".join(lines)
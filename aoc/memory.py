@@ -0,0 +1,111 @@
+"""Peak memory and allocation sites of each phase of a day, measured with tracemalloc.
+
+Tracing starts afresh for every phase, so a part isn't charged for the parsed data it receives. The peak is
+exact, but the allocation sites alive at that moment can only be sampled: a background thread snapshots the
+traces every time the traced memory grows by `PEAK_GROWTH`, and the last snapshot is reported. Tracing slows the
+solutions down several times, so the times printed next to memory aren't comparable with plain runs.
+"""
+
+import os
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+from aoc.days import Day, load_module
+from aoc.runner import PARTS, DayResult, PhaseResult, resolve_input, timed
+
+SAMPLE_INTERVAL: float = 0.01
+PEAK_GROWTH: float = 1.1
+TOP_SITES: int = 5
+
+
+class AllocationSite(NamedTuple):
+    location: str
+    size: int
+    count: int
+
+
+class MemoryReport(NamedTuple):
+    peak: int
+    retained: int
+    sites: list[AllocationSite]
+
+
+class PeakSampler(threading.Thread):
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.stopped = threading.Event()
+        self.size = 0
+        self.snapshot: tracemalloc.Snapshot | None = None
+
+    def run(self) -> None:
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.size * PEAK_GROWTH:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.size = current
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, limit: int = TOP_SITES) -> list[AllocationSite]:
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, path) for path in (__file__, tracemalloc.__file__, threading.__file__)]
+    )
+    sites = []
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        sites.append(AllocationSite(f"{Path(frame.filename).name}:{frame.lineno}", stat.size, stat.count))
+    return sites
+
+
+def traced(name: str, fn: Callable[..., Any], *args: Any) -> tuple[PhaseResult, MemoryReport]:
+    """Time `fn` like `timed` while tracing its memory allocations."""
+    tracemalloc.start()
+    sampler = PeakSampler()
+    sampler.start()
+    try:
+        result = timed(name, fn, *args)
+    finally:
+        sampler.stop()
+    retained, peak = tracemalloc.get_traced_memory()
+    final = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    snapshot = sampler.snapshot if sampler.snapshot is not None and sampler.size > retained else final
+    return result, MemoryReport(peak, retained, top_sites(snapshot))
+
+
+def memory_day(day: Day, input_path: str | os.PathLike | None = None) -> tuple[DayResult, dict[str, MemoryReport]]:
+    """Run a day like `run_day` with the memory of every phase traced."""
+    module = load_module(day)
+    parse, parse_report = traced("parse", module.load_data, resolve_input(day, input_path))
+    phases = [parse]
+    reports = {"parse": parse_report}
+    if parse.error is None:
+        for part in PARTS:
+            phase, reports[part] = traced(part, getattr(module, part), parse.answer)
+            phases.append(phase)
+    return DayResult(day, phases), reports
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    scaled = float(size)
+    for unit in ("KiB", "MiB", "GiB"):
+        scaled /= 1024
+        if scaled < 1024:
+            break
+    return f"{scaled:.1f} {unit}"
+
+
+def format_memory(day: Day, reports: dict[str, MemoryReport]) -> str:
+    lines = [f"{day}"]
+    for phase, report in reports.items():
+        lines.append(f"  {phase:<9} peak {format_bytes(report.peak):>10}  retained {format_bytes(report.retained):>10}")
+        for site in report.sites:
+            lines.append(f"    {format_bytes(site.size):>10} in {site.count:>8} blocks  {site.location}")
+    return "\n".join(lines)
@@ -0,0 +1,67 @@
+"""Opt-in on-disk cache of parsed inputs.
+
+The result of a day's `load_data` is pickled next to the input file (`data.in` -> `data.in.parsed`). The cache
+file starts with a key hashing the input content, the day module's source, the sources of the `aoc` package and
+the Python version, so it is ignored and rewritten as soon as any of them changes. The whole package is hashed
+because parsed data is often made of its types and encodings (`Grid`, `Boxes`, packed coordinates), whose layout
+a change to a shared module can alter without any change to the day.
+"""
+
+import hashlib
+import os
+import pickle
+import platform
+from pathlib import Path
+from typing import Any
+
+from aoc.days import Day, load_module
+
+CACHE_SUFFIX: str = ".parsed"
+PACKAGE_DIR: Path = Path(__file__).resolve().parent
+
+
+def package_digest() -> str:
+    """Hash the path and source of every module of the `aoc` package."""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(day: Day, input_path: Path) -> bytes:
+    digest = hashlib.sha256()
+    digest.update(input_path.read_bytes())
+    digest.update(day.path.read_bytes())
+    digest.update(package_digest().encode())
+    digest.update(f"{platform.python_version()}:{pickle.HIGHEST_PROTOCOL}".encode())
+    return digest.hexdigest().encode()
+
+
+def cache_path(input_path: Path) -> Path:
+    return input_path.with_name(input_path.name + CACHE_SUFFIX)
+
+
+def load_cached(day: Day, input_path: str | os.PathLike) -> Any:
+    """Return the day's parsed input, from the cache when it is still valid."""
+    input_path = Path(input_path)
+    key = cache_key(day, input_path)
+    path = cache_path(input_path)
+    try:
+        with open(path, "rb") as fd:
+            if fd.readline().rstrip(b"\n") == key:
+                return pickle.load(fd)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    data = load_module(day).load_data(input_path)
+    try:
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return data
+    try:
+        with open(path, "wb") as fd:
+            fd.write(key + b"\n")
+            fd.write(payload)
+    except OSError:
+        pass
+    return data
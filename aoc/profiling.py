@@ -0,0 +1,101 @@
+"""cProfile each phase of a day and export its profile as pstats and as collapsed stacks.
+
+cProfile only records caller -> callee edges, so the collapsed stacks are rebuilt from the call graph: the time
+of a function reached through several callers is split between them in proportion to the time each caller spent
+in it. The `.collapsed` files are in the "frame;frame;frame count" format read by flamegraph.pl, speedscope or
+inferno, with counts in microseconds.
+"""
+
+import cProfile
+import os
+import pstats
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.days import Day, load_module
+from aoc.defaults import DEFAULT_PROFILE_DIR
+from aoc.runner import PARTS, DayResult, PhaseResult, resolve_input, timed
+
+# Call paths carrying less time than this are dropped when collapsing, which keeps the walk from exploding.
+MIN_STACK_SECONDS: float = 1e-6
+
+Func = tuple[str, int, str]
+
+
+def label(func: Func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name.replace(";", ":")
+    return f"{name} ({os.path.basename(filename)}:{line})".replace(";", ":")
+
+
+def collapse(stats: pstats.Stats) -> dict[str, float]:
+    """Return the seconds spent in each call stack, keyed by its frames joined with `;`."""
+    raw: dict[Func, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Func, dict[Func, tuple]] = defaultdict(dict)
+    for func, (*_, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge
+    stacks: dict[str, float] = defaultdict(float)
+
+    def walk(func: Func, path: str, on_stack: frozenset[Func], share: float) -> None:
+        _, _, self_time, total_time, _ = raw[func]
+        stacks[path] += self_time * share
+        for callee, (*_, edge_time) in callees[func].items():
+            callee_total = raw[callee][3]
+            if callee in on_stack or callee_total <= 0 or share * edge_time < MIN_STACK_SECONDS:
+                continue
+            walk(callee, f"{path};{label(callee)}", on_stack | {callee}, share * edge_time / callee_total)
+
+    for func, (*_, callers) in raw.items():
+        if not callers and "_lsprof.Profiler" not in func[2]:
+            walk(func, label(func), frozenset([func]), 1.0)
+    return stacks
+
+
+def write_collapsed(stacks: dict[str, float], path: Path) -> None:
+    with open(path, "w") as fd:
+        for stack, seconds in sorted(stacks.items()):
+            if (micros := round(seconds * 1_000_000)) > 0:
+                fd.write(f"{stack} {micros}\n")
+
+
+def profiled(name: str, fn: Callable[..., Any], *args: Any, output: Path) -> tuple[PhaseResult, pstats.Stats]:
+    """Time `fn` like `timed` while profiling it, writing `output` with .pstats and .collapsed suffixes."""
+    profiler = cProfile.Profile()
+    result = timed(name, profiler.runcall, fn, *args)
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(output.with_suffix(".pstats"))
+    write_collapsed(collapse(stats), output.with_suffix(".collapsed"))
+    return result, stats
+
+
+def profile_day(
+    day: Day, input_path: str | os.PathLike | None = None, output_dir: Path = DEFAULT_PROFILE_DIR
+) -> tuple[DayResult, dict[str, pstats.Stats]]:
+    """Run a day like `run_day` with every phase profiled into `<output_dir>/<year>-<day>-<phase>.*`."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    module = load_module(day)
+    prefix = f"{day.year}-{day.day:02d}"
+    parse, parse_stats = profiled(
+        "parse", module.load_data, resolve_input(day, input_path), output=output_dir / f"{prefix}-parse"
+    )
+    phases = [parse]
+    profiles = {"parse": parse_stats}
+    if parse.error is None:
+        for part in PARTS:
+            phase, profiles[part] = profiled(
+                part, getattr(module, part), parse.answer, output=output_dir / f"{prefix}-{part}"
+            )
+            phases.append(phase)
+    return DayResult(day, phases), profiles
+
+
+def format_hot_spots(stats: pstats.Stats, limit: int = 5) -> list[str]:
+    raw: dict[Func, Any] = stats.stats  # type: ignore[attr-defined]
+    hottest = sorted(raw.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        f"    {self_time * 1000:10.3f} ms self {total_time * 1000:10.3f} ms total {calls:>9} calls  {label(func)}"
+        for func, (_, calls, self_time, total_time, _) in hottest
+    ]
@@ -0,0 +1,267 @@
+import functools
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, NamedTuple
+
+from aoc.api import Buffer, decode
+from aoc.days import Day, load_module
+
+if TYPE_CHECKING:
+    from aoc.answers import AnswerStore
+
+PARTS: tuple[str, ...] = ("part_one", "part_two")
+# Optional day function returning the answers to both parts, computing the work they share once.
+SOLVE: str = "solve"
+
+
+class PhaseResult(NamedTuple):
+    name: str
+    seconds: float
+    answer: Any = None
+    error: str | None = None
+    cached: bool = False
+    shared: bool = False
+
+
+class DayResult(NamedTuple):
+    day: Day
+    phases: list[PhaseResult]
+
+    @property
+    def seconds(self) -> float:
+        return sum(phase.seconds for phase in self.phases)
+
+
+def timed(name: str, fn: Callable[..., Any], *args: Any) -> PhaseResult:
+    start = time.perf_counter()
+    try:
+        answer = fn(*args)
+    except Exception as error:
+        return PhaseResult(name, time.perf_counter() - start, error=repr(error))
+    return PhaseResult(name, time.perf_counter() - start, answer)
+
+
+class PartResult(NamedTuple):
+    day: Day
+    parse: PhaseResult
+    part: PhaseResult
+
+
+def resolve_input(day: Day, input_path: str | os.PathLike | None = None) -> Path:
+    return Path(input_path) if input_path is not None else day.input_dir / "data.in"
+
+
+def parser(day: Day, parse_cache: bool = False) -> Callable[[Path], Any]:
+    if not parse_cache:
+        return load_module(day).load_data
+    from aoc.parsecache import load_cached
+
+    return functools.partial(load_cached, day)
+
+
+def solve_phases(module: Any, data: Any, cached: dict[str, PhaseResult | None] | None = None) -> list[PhaseResult]:
+    """Run both parts on the parsed data, through the module's `solve` when it has one.
+
+    The time of `solve` is reported on a phase of its own, and the part phases holding its answers are marked
+    `shared`. Without `solve`, the parts run one by one, except those already found in `cached`.
+    """
+    if not hasattr(module, SOLVE):
+        cached = cached or {}
+        return [cached.get(part) or timed(part, getattr(module, part), data) for part in PARTS]
+    solve = timed(SOLVE, module.solve, data)
+    if solve.error is not None:
+        return [solve]
+    shared = [PhaseResult(part, 0.0, answer, shared=True) for part, answer in zip(PARTS, solve.answer)]
+    return [solve._replace(answer=None), *shared]
+
+
+def run_day(
+    day: Day,
+    input_path: str | os.PathLike | None = None,
+    parse_cache: bool = False,
+    answers: "AnswerStore | None" = None,
+) -> DayResult:
+    """Parse the input and run both parts, reusing and storing answers in `answers` when given.
+
+    The input isn't even parsed when both answers are already stored.
+    """
+    path = resolve_input(day, input_path)
+    cached = {part: answers.lookup(day, part, path) for part in PARTS} if answers is not None else {}
+    if cached and all(cached.values()):
+        return DayResult(day, [PhaseResult("parse", 0.0, cached=True), *cached.values()])
+    module = load_module(day)
+    parse = timed("parse", parser(day, parse_cache), path)
+    phases = [parse]
+    if parse.error is None:
+        phases += solve_phases(module, parse.answer, cached)
+        if answers is not None:
+            for phase in phases[1:]:
+                answers.store(day, path, phase)
+    return DayResult(day, phases)
+
+
+def run_text(day: Day, data: Buffer) -> DayResult:
+    """Like `run_day`, but parse the puzzle input from memory, keeping the filesystem out of the parse time."""
+    module = load_module(day)
+    parse = timed("parse", lambda: module.parse(decode(data)))
+    phases = [parse]
+    if parse.error is None:
+        phases += solve_phases(module, parse.answer)
+    return DayResult(day, phases)
+
+
+def run_part(
+    day: Day, part: str, input_path: str | os.PathLike | None = None, parse_cache: bool = False
+) -> PartResult:
+    return finish_part(day, part, timed("parse", parser(day, parse_cache), resolve_input(day, input_path)))
+
+
+def run_solve(day: Day, input_path: str | os.PathLike | None = None, parse_cache: bool = False) -> list[PartResult]:
+    """Like `run_part` for a day with a `solve` function, whose single job yields the solve and both parts."""
+    parse = timed("parse", parser(day, parse_cache), resolve_input(day, input_path))
+    if parse.error is not None:
+        return [PartResult(day, parse, PhaseResult(SOLVE, 0.0, error=parse.error))]
+    phases = solve_phases(load_module(day), parse.answer)
+    return [PartResult(day, parse._replace(answer=None), phase) for phase in phases]
+
+
+def run_job(day: Day, part: str, input_path: Path, parse_cache: bool = False) -> list[PartResult]:
+    if part == SOLVE:
+        return run_solve(day, input_path, parse_cache)
+    return [run_part(day, part, input_path, parse_cache)]
+
+
+def run_text_part(day: Day, part: str, data: Buffer) -> PartResult:
+    module = load_module(day)
+    return finish_part(day, part, timed("parse", lambda: module.parse(decode(data))))
+
+
+def finish_part(day: Day, part: str, parse: PhaseResult) -> PartResult:
+    """Run a part on the outcome of its parse phase, for jobs whose result goes back to another process."""
+    if parse.error is not None:
+        return PartResult(day, parse, PhaseResult(part, 0.0, error=parse.error))
+    return PartResult(day, without_parsed(parse), timed(part, getattr(load_module(day), part), parse.answer))
+
+
+def without_parsed(phase: PhaseResult) -> PhaseResult:
+    """Drop the parsed data from a parse phase, before a worker process sends it back to its parent."""
+    # The parsed data may hold instances of classes from the day module, which the parent can't unpickle.
+    return phase._replace(answer=None) if phase.name == "parse" else phase
+
+
+def init_worker(days: list[Day]) -> None:
+    """Load the day modules in a pool worker before any job, leaving Ctrl-C to the parent process."""
+    import signal
+
+    # Ctrl-C reaches the whole process group, and it is up to the parent to shut the pool down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for day in days:
+        load_module(day)
+
+
+def time_part(day: Day, path: Path, part: str, parse_cache: bool = False) -> tuple[PhaseResult, PhaseResult]:
+    """Parse the input afresh, since some parts mutate their data, and time one part on it.
+
+    Unlike `run_day`, errors are raised instead of being reported.
+    """
+    module = load_module(day)
+    parse = timed("parse", parser(day, parse_cache), path)
+    if parse.error is not None:
+        raise RuntimeError(f"{day} parse failed with error: {parse.error}")
+    result = timed(part, getattr(module, part), parse.answer)
+    if result.error is not None:
+        raise RuntimeError(f"{day} {part} failed with error: {result.error}")
+    return parse, result
+
+
+def run_parallel(
+    days: list[Day],
+    input_path: str | os.PathLike | None = None,
+    workers: int | None = None,
+    parse_cache: bool = False,
+    answers: "AnswerStore | None" = None,
+) -> Iterator[PartResult]:
+    """Run every (day, part) job in a process pool, yielding results in completion order.
+
+    Each job parses its own input, so both parts of a day can run at the same time, except for days with a
+    `solve` function, which run as one job. Answers found in `answers` are yielded first without submitting a
+    job, and new ones are stored as they complete.
+    """
+    jobs = []
+    for day in days:
+        path = resolve_input(day, input_path)
+        cached = {part: answers.lookup(day, part, path) for part in PARTS} if answers is not None else {}
+        missing = [part for part in PARTS if cached.get(part) is None]
+        if missing and hasattr(load_module(day), SOLVE):
+            # `solve` answers both parts anyway, so a single stored answer is of no use.
+            jobs.append((day, SOLVE, path))
+            continue
+        for part in PARTS:
+            if part in missing:
+                jobs.append((day, part, path))
+            else:
+                yield PartResult(day, PhaseResult("parse", 0.0, cached=True), cached[part])
+    if not jobs:
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(run_job, day, part, path, parse_cache): path for day, part, path in jobs}
+        for future in as_completed(futures):
+            for result in future.result():
+                if answers is not None:
+                    answers.store(result.day, futures[future], result.part)
+                yield result
+
+
+def collect(results: list[PartResult]) -> list[DayResult]:
+    by_day: dict[Day, dict[str, PartResult]] = {}
+    for result in results:
+        by_day.setdefault(result.day, {})[result.part.name] = result
+    day_results = []
+    for day, parts in sorted(by_day.items()):
+        parse = min((result.parse for result in parts.values()), key=lambda phase: (phase.cached, phase.seconds))
+        phases = [parse, *(parts[name].part for name in (SOLVE, *PARTS) if name in parts)]
+        day_results.append(DayResult(day, phases))
+    return day_results
+
+
+def format_time(phase: PhaseResult) -> str:
+    if phase.cached:
+        return f"{'cached':>12}"
+    if phase.shared:
+        return f"{'in solve':>12}"
+    return format_seconds(phase.seconds)
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:9.3f} ms"
+    return f"{seconds:9.3f} s "
+
+
+def format_answer(phase: PhaseResult) -> str:
+    if phase.name in ("parse", SOLVE) and phase.error is None:
+        return ""
+    if phase.error is not None:
+        return f"  Failed with error: {phase.error}"
+    answer = str(phase.answer)
+    if "\n" in answer:
+        return "\n" + "\n".join(f"    {line}" for line in answer.splitlines())
+    return f"  {answer}"
+
+
+def format_part(result: PartResult) -> str:
+    return f"{result.day} {result.part.name:<9} {format_time(result.part)}{format_answer(result.part)}".rstrip(" ")
+
+
+def format_report(results: list[DayResult]) -> str:
+    lines = []
+    for result in results:
+        lines.append(f"{result.day}")
+        for phase in result.phases:
+            lines.append(f"  {phase.name:<9} {format_time(phase)}{format_answer(phase)}".rstrip(" "))
+    total = sum(result.seconds for result in results)
+    lines.append(f"Total: {format_seconds(total).strip()} across {len(results)} day(s)")
+    return "\n".join(lines)
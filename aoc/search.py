@@ -0,0 +1,178 @@
+"""Graph searches over integer node ids.
+
+Graphs are adjacency sequences: `graph[node]` lists the nodes reachable from `node`, like the neighbor tables of
+`aoc.grid.Grid`. Weighted searches take the cost of entering each node, which is how grid puzzles weigh their
+moves. All searches accept several sources and an optional set of goals to stop at, and return the distances and
+parent pointers of every node they settled.
+"""
+
+import heapq
+import sys
+from typing import Callable, Container, Hashable, Iterable, NamedTuple, Protocol, Sequence, TypeVar
+
+from aoc.memo import DEFAULT_MAXSIZE, clear, memoize
+
+Graph = Sequence[Sequence[int]]
+State = TypeVar("State", bound=Hashable)
+
+UNREACHED: int = -1
+
+
+class SearchResult(NamedTuple):
+    distances: list[int]
+    parents: list[int]
+    goal: int | None
+
+    def path(self, node: int) -> list[int]:
+        """Return the nodes from a source to `node`, both included."""
+        if self.distances[node] == UNREACHED:
+            raise ValueError(f"Node {node} wasn't reached")
+        path = [node]
+        while (node := self.parents[node]) != UNREACHED:
+            path.append(node)
+        return path[::-1]
+
+
+class PriorityQueue(Protocol):
+    def push(self, priority: int, node: int) -> None: ...
+
+    def pop(self) -> tuple[int, int]: ...
+
+    def __len__(self) -> int: ...
+
+
+class HeapQueue:
+    """Binary heap, for any non-negative weights."""
+
+    def __init__(self) -> None:
+        self.heap: list[tuple[int, int]] = []
+
+    def push(self, priority: int, node: int) -> None:
+        heapq.heappush(self.heap, (priority, node))
+
+    def pop(self) -> tuple[int, int]:
+        return heapq.heappop(self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class BucketQueue:
+    """One bucket per priority, for small integer weights and priorities that never decrease (Dial's algorithm)."""
+
+    def __init__(self) -> None:
+        self.buckets: list[list[int]] = []
+        self.current = 0
+        self.size = 0
+
+    def push(self, priority: int, node: int) -> None:
+        if priority < self.current:
+            raise ValueError(f"Priority {priority} is below the current one, {self.current}")
+        while len(self.buckets) <= priority:
+            self.buckets.append([])
+        self.buckets[priority].append(node)
+        self.size += 1
+
+    def pop(self) -> tuple[int, int]:
+        if not self.size:
+            raise IndexError("pop from an empty bucket queue")
+        while not self.buckets[self.current]:
+            self.current += 1
+        self.size -= 1
+        return self.current, self.buckets[self.current].pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def bfs(graph: Graph, sources: Iterable[int], goals: Container[int] = ()) -> SearchResult:
+    """Unweighted search, stopping as soon as one of `goals` is reached."""
+    distances = [UNREACHED] * len(graph)
+    parents = [UNREACHED] * len(graph)
+    frontier = []
+    for source in sources:
+        distances[source] = 0
+        if source in goals:
+            return SearchResult(distances, parents, source)
+        frontier.append(source)
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbor in graph[node]:
+                if distances[neighbor] == UNREACHED:
+                    distances[neighbor] = distance
+                    parents[neighbor] = node
+                    if neighbor in goals:
+                        return SearchResult(distances, parents, neighbor)
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return SearchResult(distances, parents, None)
+
+
+def dijkstra(
+    graph: Graph,
+    costs: Sequence[int],
+    sources: Iterable[int],
+    goals: Container[int] = (),
+    heuristic: Callable[[int], int] | None = None,
+    queue: PriorityQueue | None = None,
+) -> SearchResult:
+    """Cheapest paths where entering `node` costs `costs[node]`, stopping once one of `goals` is settled.
+
+    With a `heuristic` giving a lower bound of the cost from a node to the goals, this is A*. The heuristic must
+    be consistent, since settled nodes are never revisited. `queue` defaults to a `HeapQueue`.
+    """
+    distances = [UNREACHED] * len(graph)
+    parents = [UNREACHED] * len(graph)
+    settled = bytearray(len(graph))
+    queue = queue if queue is not None else HeapQueue()
+    for source in sources:
+        distances[source] = 0
+        queue.push(heuristic(source) if heuristic is not None else 0, source)
+    while queue:
+        _, node = queue.pop()
+        if settled[node]:
+            continue
+        settled[node] = 1
+        if node in goals:
+            return SearchResult(distances, parents, node)
+        distance = distances[node]
+        for neighbor in graph[node]:
+            new_distance = distance + costs[neighbor]
+            if not settled[neighbor] and (distances[neighbor] == UNREACHED or new_distance < distances[neighbor]):
+                distances[neighbor] = new_distance
+                parents[neighbor] = node
+                queue.push(new_distance + heuristic(neighbor) if heuristic is not None else new_distance, neighbor)
+    return SearchResult(distances, parents, None)
+
+
+def count_paths(
+    start: State,
+    successors: Callable[[State], Iterable[State]],
+    is_goal: Callable[[State], bool],
+    maxsize: int | None = DEFAULT_MAXSIZE,
+) -> int:
+    """Count the paths from `start` to a goal state, in a state graph without cycles.
+
+    Paths end at the first goal state they reach. The counts of the states are memoized in a cache bounded to
+    `maxsize` entries and cleared on return, so paths sharing a state are counted together. The states are
+    searched recursively: graphs with paths longer than the recursion limit raise a ValueError.
+    """
+
+    @memoize(maxsize=maxsize)
+    def count(state: State) -> int:
+        if is_goal(state):
+            return 1
+        paths = 0
+        for successor in successors(state):
+            paths += count(successor)
+        return paths
+
+    try:
+        return count(start)
+    except RecursionError:
+        raise ValueError(f"Paths are longer than the recursion limit, {sys.getrecursionlimit()} states") from None
+    finally:
+        clear(count)
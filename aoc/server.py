@@ -0,0 +1,180 @@
+"""Local solve server.
+
+A localhost HTTP server in front of a pool of worker processes that imported every day module up front, so
+callers pay neither interpreter startup nor imports:
+
+    POST /solve  {"year": 2021, "day": 15, "part": "part_one", "input": "..."}
+    GET  /stats  queue depth and per-day latency statistics
+
+The server only binds to the loopback interface and needs no network access.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from aoc.bench import PhaseStats
+from aoc.days import Day, DayNotFoundError, find_days, load_module
+from aoc.defaults import DEFAULT_PORT
+from aoc.runner import PARTS, PartResult, init_worker, run_text_part
+
+# Latency statistics are computed over this many of the most recent requests of each day and part.
+LATENCY_WINDOW: int = 1000
+
+
+def warm_up(days: list[Day]) -> None:
+    for day in days:
+        load_module(day)
+
+
+class WorkerCrashedError(Exception):
+    pass
+
+
+def solve_job(day: Day, part: str, text: str) -> tuple[PartResult, float, int]:
+    started = time.time()
+    return run_text_part(day, part, text), started, os.getpid()
+
+
+class SolveService:
+    def __init__(self, workers: int | None = None):
+        self.days = find_days()
+        self.workers = workers or os.cpu_count() or 1
+        warm_up(self.days)
+        self.executor = self.start_pool()
+        self.pool_lock = threading.Lock()
+        self.restarts = 0
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.served = 0
+        self.latencies: dict[str, deque[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def start_pool(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker, initargs=(self.days,))
+        # Workers are started on demand, so submit one job per worker to have them all running before requests.
+        wait([executor.submit(time.sleep, 0.1) for _ in range(self.workers)])
+        return executor
+
+    def restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a pool that lost a worker, which fails every job submitted to it from then on."""
+        with self.pool_lock:
+            # Requests in flight on the broken pool all fail together, and only the first one replaces it.
+            if self.executor is broken:
+                self.executor = self.start_pool()
+                self.restarts += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def solve(self, day: Day, part: str, text: str) -> dict[str, Any]:
+        if day not in self.days:
+            raise DayNotFoundError(f"No solution found for {day}")
+        if part not in PARTS:
+            raise ValueError(f"part must be one of {', '.join(PARTS)}")
+        submitted = time.time()
+        with self.lock:
+            self.in_flight += 1
+        key = f"{day.year}/{day.day} {part}"
+        executor = self.executor
+        try:
+            result, started, worker = executor.submit(solve_job, day, part, text).result()
+        except BrokenProcessPool as error:
+            with self.lock:
+                self.errors[key] = self.errors.get(key, 0) + 1
+            self.restart_pool(executor)
+            raise WorkerCrashedError(f"A worker process died while solving {day} {part}: {error}") from error
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        latency = time.time() - submitted
+        error = result.parse.error or result.part.error
+        with self.lock:
+            self.served += 1
+            self.latencies.setdefault(key, deque(maxlen=LATENCY_WINDOW)).append(latency)
+            if error is not None:
+                self.errors[key] = self.errors.get(key, 0) + 1
+        answer = result.part.answer
+        return {
+            "year": day.year,
+            "day": day.day,
+            "part": part,
+            "answer": answer if isinstance(answer, (int, str)) or answer is None else str(answer),
+            "error": error,
+            "parse_seconds": result.parse.seconds,
+            "part_seconds": result.part.seconds,
+            "queue_seconds": max(0.0, started - submitted),
+            "latency_seconds": latency,
+            "worker": worker,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self.lock:
+            latencies = {key: list(samples) for key, samples in self.latencies.items()}
+            return {
+                "workers": self.workers,
+                "restarts": self.restarts,
+                "in_flight": self.in_flight,
+                "queue_depth": max(0, self.in_flight - self.workers),
+                "served": self.served,
+                "latency": {
+                    key: {**PhaseStats.from_samples(samples)._asdict(), "errors": self.errors.get(key, 0)}
+                    for key, samples in sorted(latencies.items())
+                },
+            }
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+
+
+class SolveHandler(BaseHTTPRequestHandler):
+    server: "SolveServer"
+
+    def send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self.send_json(HTTPStatus.OK, self.server.service.stats())
+        else:
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/solve":
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            day = Day(int(request["year"]), int(request["day"]))
+            response = self.server.service.solve(day, request["part"], request["input"])
+        except DayNotFoundError as error:
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": str(error)})
+        except (ValueError, KeyError, TypeError) as error:
+            self.send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid request: {error!r}"})
+        except WorkerCrashedError as error:
+            self.send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)})
+        else:
+            self.send_json(HTTPStatus.OK, response)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SolveServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, service: SolveService, port: int = DEFAULT_PORT, verbose: bool = False):
+        super().__init__(("127.0.0.1", port), SolveHandler)
+        self.service = service
+        self.verbose = verbose
@@ -0,0 +1,160 @@
+"""Rerun days as their code or inputs change, in one warm interpreter.
+
+`Watcher` polls the modification times of the day modules and of the files in their input directories. A change
+to a day module reloads that module only, and a change to an input reruns its day with the module it has. A rerun
+first executes the sample asserts of the day's `__main__` block, without the statements printing the answers to
+the real input and those only they depend on, then times the day on its `data.in` like `run` does.
+
+The `aoc` package itself and the modules the days import aren't reloaded: restart the watch after changing them.
+"""
+
+import ast
+import contextlib
+import sys
+import time
+import traceback
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Iterator
+
+from aoc.days import Day, load_module
+from aoc.parsecache import CACHE_SUFFIX
+from aoc.runner import DayResult, PhaseResult, format_answer, format_time, run_day
+
+LOAD: str = "load"
+SAMPLES: str = "samples"
+
+Stamp = tuple[int, int]
+
+
+def watched_files(day: Day) -> Iterator[Path]:
+    yield day.path
+    if day.input_dir.is_dir():
+        yield from (path for path in day.input_dir.rglob("*") if path.is_file() and path.suffix != CACHE_SUFFIX)
+
+
+def stamp(path: Path) -> Stamp | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def is_print(statement: ast.stmt) -> bool:
+    return (
+        isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Call)
+        and isinstance(statement.value.func, ast.Name)
+        and statement.value.func.id == "print"
+    )
+
+
+def compile_samples(path: Path) -> CodeType | None:
+    """Compile the `__main__` block of a day module without its prints and the assignments only they use."""
+    tree = ast.parse(path.read_bytes(), str(path))
+    for node in tree.body:
+        if isinstance(node, ast.If) and "__main__" in ast.unparse(node.test):
+            break
+    else:
+        return None
+    # Walk the block backwards, keeping the assignments whose names a statement kept after them reads.
+    kept: list[ast.stmt] = []
+    read: set[str] = set()
+    for statement in reversed(node.body):
+        if is_print(statement):
+            continue
+        if isinstance(statement, ast.Assign):
+            names = {name.id for target in statement.targets for name in ast.walk(target) if isinstance(name, ast.Name)}
+            if not names & read:
+                continue
+        kept.insert(0, statement)
+        read |= {
+            name.id for name in ast.walk(statement) if isinstance(name, ast.Name) and isinstance(name.ctx, ast.Load)
+        }
+    return compile(ast.Module(body=kept, type_ignores=[]), str(path), "exec")
+
+
+def describe_failure(error: Exception, path: Path) -> str:
+    """Point at the innermost line of the day module in the traceback, which is the failing assert for samples."""
+    frames = [frame for frame in traceback.extract_tb(error.__traceback__) if frame.filename == str(path)]
+    if not frames or not isinstance(error, AssertionError):
+        return repr(error)
+    return f"line {frames[-1].lineno}: {frames[-1].line}"
+
+
+def run_samples(day: Day, module: ModuleType) -> PhaseResult | None:
+    start = time.perf_counter()
+    try:
+        code = compile_samples(day.path)
+        if code is None:
+            return None
+        # The blocks find their inputs relative to the working directory, as when run as scripts from it.
+        with contextlib.chdir(day.path.parent):
+            exec(code, {**vars(module), "__name__": "__main__"})
+    except Exception as error:
+        return PhaseResult(SAMPLES, time.perf_counter() - start, error=describe_failure(error, day.path))
+    return PhaseResult(SAMPLES, time.perf_counter() - start, "ok")
+
+
+class Watcher:
+    def __init__(self, days: list[Day]) -> None:
+        self.days = days
+        self.stamps = self.snapshot()
+        self.previous: dict[Day, DayResult] = {}
+
+    def snapshot(self) -> dict[Path, tuple[Day, Stamp | None]]:
+        return {path: (day, stamp(path)) for day in self.days for path in watched_files(day)}
+
+    def poll(self) -> tuple[list[Day], set[Day]]:
+        """Return the days whose files changed since the last poll, and those among them whose module changed."""
+        before, self.stamps = self.stamps, self.snapshot()
+        # Deleted inputs are only in the snapshot taken before, new ones only in the one taken now.
+        owners = {path: day for path, (day, _) in (before | self.stamps).items()}
+        changed = {path for path in owners if before.get(path) != self.stamps.get(path)}
+        reloaded = {owners[path] for path in changed if path == owners[path].path}
+        return sorted({owners[path] for path in changed}), reloaded
+
+    def run(self, day: Day, reload: bool = False) -> tuple[DayResult, DayResult | None]:
+        """Rerun a day, reloading its module first if asked, and return its result with the one of its last run."""
+        if reload:
+            sys.modules.pop(day.module_name, None)
+        start = time.perf_counter()
+        try:
+            module = load_module(day)
+        except Exception as error:
+            result = DayResult(day, [PhaseResult(LOAD, time.perf_counter() - start, error=repr(error))])
+            return result, self.previous.get(day)
+        phases = [PhaseResult(LOAD, time.perf_counter() - start)] if reload else []
+        samples = run_samples(day, module)
+        if samples is not None:
+            phases.append(samples)
+        if samples is None or samples.error is None:
+            phases += run_day(day).phases
+        result = DayResult(day, phases)
+        previous = self.previous.get(day)
+        if all(phase.error is None for phase in phases):
+            self.previous[day] = result
+        return result, previous
+
+
+def format_change(phase: PhaseResult, previous: DayResult | None) -> str:
+    if previous is None or phase.error is not None or phase.shared:
+        return ""
+    before = next((entry for entry in previous.phases if entry.name == phase.name), None)
+    if before is None or before.error is not None or before.shared or not before.seconds:
+        return ""
+    delta = phase.seconds - before.seconds
+    return f" {delta * 1000:+10.3f} ms {delta / before.seconds * 100:+7.1f}%"
+
+
+def format_run(result: DayResult, previous: DayResult | None) -> str:
+    lines = [f"{result.day}" + (" (reloaded)" if result.phases and result.phases[0].name == LOAD else "")]
+    for phase in result.phases:
+        # A reload has no answer, and its time depends on the imports the module shares with the others loaded.
+        if phase.name == LOAD:
+            line = f"  {phase.name:<9} {format_time(phase)}{format_answer(phase) if phase.error else ''}"
+        else:
+            line = f"  {phase.name:<9} {format_time(phase)}{format_change(phase, previous)}{format_answer(phase)}"
+        lines.append(line.rstrip(" "))
+    return "\n".join(lines)